@@ -0,0 +1,45 @@
+"""
+Benchmark of CharField validation with oversized payloads.
+
+Run: python -m benchmarks.char_field
+
+"""
+import timeit
+
+from rest_framework.serializers import CharField, ValidationError
+
+
+PAYLOAD_SIZES = (10 ** 3, 10 ** 5, 10 ** 7)  # Length of validated strings.
+NUMBER = 50  # Count of runs for each case.
+
+
+def validate(field, data):
+    """
+    Validate data and ignore the error.
+
+    :param rest_framework.serializers.CharField field: Field for validation.
+    :param str data: Data for validation.
+
+    """
+    try:
+        field.run_validation(data)
+    except ValidationError:
+        pass
+
+
+def main():
+    cases = (
+        ('max_length', CharField(max_length=255)),
+        ('max_length, trim_whitespace', CharField(max_length=255, trim_whitespace=True)),
+        ('trim_whitespace, blank', CharField(trim_whitespace=True, allow_blank=False)),
+    )
+    for size in PAYLOAD_SIZES:
+        payloads = (('text', 'q' * size), ('spaces', ' ' * size + 'q'))
+        for case_name, field in cases:
+            for payload_name, data in payloads:
+                seconds = timeit.timeit(lambda: validate(field, data), number=NUMBER)
+                print('{:>10} {:<30} {:<8} {:10.3f} ms'.format(size, case_name, payload_name, seconds / NUMBER * 1000))
+
+
+if __name__ == '__main__':
+    main()
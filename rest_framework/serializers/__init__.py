@@ -6,17 +6,18 @@ from .serializers import Serializer, ListSerializer
 from .fields import (
     BooleanField, BooleanNullField, CharField, IntegerField, FloatField, ListField,
     TimeField, DateField, DateTimeField,
-    JsonField, DictField,
+    JsonField, DictField, ChoiceField, EnumField,
     SerializerMethodField,
 )
 from .exceptions import ValidationError
+from .helpers import SerializerPool
 
 
 __ALL__ = (
     # fields
     BooleanField, BooleanNullField, CharField, IntegerField, FloatField, ListField,
     TimeField, DateField, DateTimeField,
-    JsonField, DictField,
+    JsonField, DictField, ChoiceField, EnumField,
     SerializerMethodField,
 
     # serializers
@@ -24,4 +25,7 @@ __ALL__ = (
 
     # exceptions
     ValidationError,
+
+    # helpers
+    SerializerPool,
 )
@@ -7,8 +7,11 @@ try:
     from typing import Mapping
 except ImportError:
     from collections import Mapping
+import copy
 import datetime
+import enum
 import json
+from collections import OrderedDict
 
 try:
     from json.decoder import JSONDecodeError
@@ -19,10 +22,11 @@ import six
 
 from rest_framework.exceptions import SkipError
 from rest_framework.serializers.exceptions import ValidationError
-from rest_framework.serializers.helpers import get_class_name
+from rest_framework.serializers.helpers import MISSING, get_class_name, find_json_limit_error
 from rest_framework.utils import html
 from rest_framework.serializers.validators import (
-    RequiredValidator, MaxLengthValidator, MinLengthValidator, MaxValueValidator, MinValueValidator
+    RequiredValidator, MaxLengthValidator, MinLengthValidator, MaxValueValidator, MinValueValidator,
+    FusedRangeValidator
 )
 
 MISSING_ERROR_MESSAGE = (
@@ -36,6 +40,14 @@ DEFAULT_DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
 DEFAULT_INPUT_DATE_FORMAT = '%Y-%m-%d'
 DEFAULT_INPUT_TIME_FORMAT = '%H:%M:%S'
 DEFAULT_INPUT_DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+PLAIN_DICT_TYPES = frozenset((dict, OrderedDict))  # Dicts, in which `.get()` is the same as `[]`.
+# Global limits of input size, for fields without own limits. None - no limit.
+# Example: `DEFAULT_INPUT_LIMITS['max_items'] = 10000`.
+DEFAULT_INPUT_LIMITS = {
+    'max_items': None,  # Max count of items in list.
+    'max_depth': None,  # Max depth of nested dicts and lists in JSON.
+    'max_keys': None,  # Max count of keys in one dict of JSON.
+}
 
 
 def get_attribute(obj, attr_name):
@@ -61,6 +73,28 @@ def get_attribute(obj, attr_name):
     return attr
 
 
+def get_attribute_or_missing(obj, attr_name):
+    """
+    Return object attribute or `MISSING`, without exceptions for not found attribute. Can work with dictionaries.
+
+    :param object obj: Object for search attribute.
+    :param str attr_name: Attribute name.
+
+    :return: Found attribute or `MISSING`.
+    :rtype: object
+
+    """
+    if isinstance(obj, Mapping):
+        # Plain dicts can search without exception, others can have own `__getitem__` or `__missing__`.
+        if type(obj) in PLAIN_DICT_TYPES:
+            return obj.get(attr_name, MISSING)
+        try:
+            return obj[attr_name]
+        except KeyError:
+            return MISSING
+    return getattr(obj, attr_name, MISSING)
+
+
 class Field(object):
     """
     Base field.
@@ -71,6 +105,7 @@ class Field(object):
         'null': 'This field cannot be null.'
     }
     default_validators = []  # Default validators for field.
+    batch = False  # Is the value computed for all objects of the `.data` call at once?
 
     def __init__(self, required=True, default=None, label=None, validators=None,
                  error_messages=None, source=None, allow_none=None):
@@ -126,6 +161,20 @@ class Field(object):
         if self.label is None:
             self.label = field_name.replace('_', ' ').capitalize()
 
+    @property
+    def root(self):
+        """
+        Returns the top-level field of the tree. Usually it is the root serializer.
+
+        :return: Root field.
+        :rtype: Field
+
+        """
+        root = self
+        while getattr(root, 'parent', None) is not None:
+            root = root.parent
+        return root
+
     @property
     def validators(self):
         """
@@ -133,9 +182,10 @@ class Field(object):
         :rtype: list
 
         """
-        if not hasattr(self, '_validators'):
-            self._validators = self.get_validators()
-        return self._validators
+        try:
+            return self.__dict__['_validators']
+        except KeyError:
+            return self.__dict__.setdefault('_validators', self.get_validators())
 
     @validators.setter
     def validators(self, validators):
@@ -195,6 +245,19 @@ class Field(object):
         message_string = msg.format(**kwargs)
         raise ValidationError(detail=message_string, status=key)
 
+    def get_input_limit(self, name):
+        """
+        Get limit of input size.
+
+        :param str name: Limit name. Key of `DEFAULT_INPUT_LIMITS`.
+
+        :return: Limit of the field or global default. None - no limit.
+        :rtype: Optional[int]
+
+        """
+        limit = getattr(self, name, None)
+        return limit if limit is not None else DEFAULT_INPUT_LIMITS.get(name)
+
     def to_internal_value(self, data):
         """
         Data transformation to python object.
@@ -279,6 +342,20 @@ class Field(object):
         """
         return get_attribute(instance, self._get_attribute_name())
 
+    def get_attribute_paths(self, field_name, fields=None, expand=None):
+        """
+        Attribute paths of the object, which the field reads during transformation to JSON.
+
+        :param str field_name: Field name in serializer.
+        :param dict fields: Tree of selected nested fields. None - all fields.
+        :param dict expand: Tree of expanded nested serializers.
+
+        :return: Dotted attribute paths.
+        :rtype: tuple
+
+        """
+        return (self.source or field_name,)
+
     def get_attribute(self, instance):
         """
         Searches for and returns an attribute on an object..
@@ -319,6 +396,57 @@ class Field(object):
             )
             raise type(e)(msg)
 
+    def get_attribute_or_missing(self, instance):
+        """
+        Searches for and returns an attribute on an object, as `.get_attribute()`.
+        Instead of `SkipError` returns `MISSING`, and not found attributes do not raise exceptions.
+        Fields with own `.get_attribute()`, `._get_attribute()` or `._get_attribute_name()` are called as before.
+
+        :return: Object attribute value or `MISSING`, if the field must be skipped.
+        :rtype: object
+
+        :raise Exception: If an error occurred during the search.
+
+        """
+        if not self._has_default_attribute_access():
+            try:
+                return self.get_attribute(instance)
+            except SkipError:
+                return MISSING
+
+        value = get_attribute_or_missing(instance, self.source or self.field_name)
+        if value is not MISSING:
+            return value
+        # Same order as in `.get_attribute()`.
+        if self.default is not None:
+            return self.get_default()
+        if self.allow_none:
+            return None
+        if self.required:
+            return MISSING
+        # The error for developer is raised with the exception contract.
+        return self.get_attribute(instance)
+
+    @classmethod
+    def _has_default_attribute_access(cls):
+        """
+        Check that the field class does not override search of attribute.
+
+        :return: Is attribute search of `Field` used?
+        :rtype: bool
+
+        """
+        try:
+            return cls.__dict__['_default_attribute_access']
+        except KeyError:
+            pass
+        default_attribute_access = all(
+            getattr(cls, name) is getattr(Field, name)
+            for name in ('get_attribute', '_get_attribute', '_get_attribute_name')
+        )
+        setattr(cls, '_default_attribute_access', default_attribute_access)
+        return default_attribute_access
+
     def validate_empty_values(self, data):
         """
         Check if the value is empty.
@@ -384,17 +512,43 @@ class Field(object):
         """
         errors = []
 
-        for validator in self.validators or []:
+        validators = self.__dict__.get('_validators')
+        if validators is None:
+            validators = self.validators or []
+        # Comparison of lists checks the identity of items first, so it is fast.
+        fused_from, fused = self.__dict__.get('_fused_validators') or (None, None)
+        if fused_from != validators:
+            fused = self._fuse_validators(validators)
+
+        for validator in fused:
             try:
                 # Run each validator.
                 validator(value)
             except ValidationError as e:
-                errors.append(e.detail)
+                if getattr(validator, 'many_errors', False):
+                    errors.extend(e.detail)
+                else:
+                    errors.append(e.detail)
 
         # Check on errors.
         if errors:
             raise ValidationError(detail=errors)
 
+    def _fuse_validators(self, validators):
+        """
+        Make validators for run, in which the built-in validators are fused by `FusedRangeValidator`.
+        The result is cached, until `.validators` is changed.
+
+        :param list validators: Validators of field.
+
+        :return: List validators for run.
+        :rtype: list
+
+        """
+        fused = FusedRangeValidator.fuse(validators)
+        self._fused_validators = (list(validators), fused)
+        return fused
+
 
 class CharField(Field):
     """
@@ -425,12 +579,14 @@ class CharField(Field):
         self.allow_blank = allow_blank
 
         # Added validators.
+        self._length_validators = []  # Built-in validators of the field, for the early check of length.
         if self.max_length is not None:
             message = self.error_messages['max_length'].format(max_length=self.max_length)
-            self.validators.append(MaxLengthValidator(max_length, message=message))
+            self._length_validators.append(MaxLengthValidator(max_length, message=message))
         if self.min_length is not None:
             message = self.error_messages['min_length'].format(min_length=self.min_length)
-            self.validators.append(MinLengthValidator(self.min_length, message=message))
+            self._length_validators.append(MinLengthValidator(self.min_length, message=message))
+        self.validators.extend(self._length_validators)
 
     def __deepcopy__(self, memo={}):
         return self.__class__(
@@ -451,12 +607,56 @@ class CharField(Field):
         :rtype: str
 
         """
-        if data == '' or (self.trim_whitespace and six.text_type(data).strip() == ''):
+        if self._is_blank(data):
             if not self.allow_blank:
                 self.fail_field_validation('blank')
             return ''
+        self._check_max_length_early(data)
         return super(CharField, self).run_validation(data)
 
+    def _is_blank(self, data):
+        """
+        Check that the data is an empty string. Strings are not copied for check.
+
+        :param object data: Data for check.
+
+        :return: Is blank string?
+        :rtype: bool
+
+        """
+        if data == '':
+            return True
+        if not self.trim_whitespace:
+            return False
+        if isinstance(data, six.string_types):
+            # The ends are checked first, so the usual strings are not scanned.
+            return data[0].isspace() and data[-1].isspace() and data.isspace()
+        return six.text_type(data).strip() == ''
+
+    def _check_max_length_early(self, data):
+        """
+        Reject too long string before it is converted and stripped.
+        The error is the same as from validators, so the check is done only when the other validators
+        are built-in validators of the field, and the stripping can not change the length.
+
+        :param object data: Data for check.
+
+        :raise ValidationError: If the string is too long.
+
+        """
+        if self.max_length is None or not isinstance(data, six.string_types) or len(data) <= self.max_length:
+            return
+        if self.trim_whitespace and (data[0].isspace() or data[-1].isspace()):
+            return
+        for validator in self.validators:
+            if type(validator) is RequiredValidator:
+                continue  # Strings are not None.
+            if not any(validator is own for own in self._length_validators):
+                return  # Custom validators can add errors.
+            if isinstance(validator, MinLengthValidator) and validator.min_length > len(data):
+                return
+        raise ValidationError(detail=[self.error_messages['max_length'].format(max_length=self.max_length)])
+
     def to_internal_value(self, data):
         """
         Data transformation to python object.
@@ -473,7 +673,7 @@ class CharField(Field):
         if isinstance(data, bool) or not isinstance(data, six.string_types + six.integer_types + (float,)):
             self.fail_field_validation('invalid')
 
-        val = six.text_type(data)
+        val = data if isinstance(data, six.text_type) else six.text_type(data)
 
         if self.trim_whitespace:
             val = val.strip()
@@ -835,11 +1035,13 @@ class ListField(Field):
         'not_a_list': 'Expected a list of items but got type "{input_type}".',
         'empty': 'This list may not be empty.',
         'min_length': 'Ensure this field has at least {min_length} elements.',
-        'max_length': 'Ensure this field has no more than {max_length} elements.'
+        'max_length': 'Ensure this field has no more than {max_length} elements.',
+        'max_items': 'Too many items.',
     }
     child = _UnvalidatedField()
 
-    def __init__(self, child=None, min_length=None, max_length=None, allow_empty=False, *args, **kwargs):
+    def __init__(self, child=None, min_length=None, max_length=None, allow_empty=False, max_items=None,
+                 *args, **kwargs):
         """
         Field for list objects.
 
@@ -847,6 +1049,7 @@ class ListField(Field):
         :param int min_length: Minimum length list.
         :param int max_length: Maximum length list.
         :param bool allow_empty: Allow empty array?
+        :param int max_items: Max count of items, checked before validation of items. None - global default.
 
         """
         super().__init__(*args, **kwargs)
@@ -854,6 +1057,7 @@ class ListField(Field):
         self.min_length = min_length if min_length is None else int(min_length)
         self.max_length = max_length if max_length is None else int(max_length)
         self.allow_empty = bool(allow_empty)
+        self.max_items = max_items if max_items is None else int(max_items)
 
         # Check field `child`.
         if all((not isinstance(child, Field), not isinstance(self.child, Field))):
@@ -873,8 +1077,8 @@ class ListField(Field):
         return self.__class__(
             required=self.required, default=self.default, label=self.label,
             validators=self._src_validators, error_messages=self._src_messages,
-            child=self.child, min_length=self.min_length, max_length=self.max_length,
-            allow_empty=self.allow_empty, source=self.source, allow_none=self.allow_none
+            child=copy.deepcopy(self.child, memo), min_length=self.min_length, max_length=self.max_length,
+            allow_empty=self.allow_empty, max_items=self.max_items, source=self.source, allow_none=self.allow_none
         )
 
     def to_internal_value(self, data):
@@ -898,6 +1102,10 @@ class ListField(Field):
         if not self.allow_empty and len(data) == 0:
             self.fail_field_validation('empty')
 
+        max_items = self.get_input_limit('max_items')
+        if max_items is not None and len(data) > max_items:
+            self.fail_field_validation('max_items')
+
         return [self.child.run_validation(item) for item in data]
 
     def to_representation(self, value):
@@ -1205,9 +1413,30 @@ class JsonField(Field):
 
     """
     default_error_messages = {
-        'invalid': 'Value must be valid JSON.'
+        'invalid': 'Value must be valid JSON.',
+        'max_depth': 'Too deep nesting.',
+        'max_keys': 'Too many keys.',
     }
 
+    def __init__(self, max_depth=None, max_keys=None, *args, **kwargs):
+        """
+        Field for custom JSON data.
+
+        :param int max_depth: Max depth of nested dicts and lists. None - global default.
+        :param int max_keys: Max count of keys in one dict. None - global default.
+
+        """
+        super().__init__(*args, **kwargs)
+        self.max_depth = max_depth if max_depth is None else int(max_depth)
+        self.max_keys = max_keys if max_keys is None else int(max_keys)
+
+    def __deepcopy__(self, memo={}):
+        return self.__class__(
+            required=self.required, default=self.default, label=self.label,
+            validators=self._src_validators, error_messages=self._src_messages,
+            max_depth=self.max_depth, max_keys=self.max_keys, source=self.source, allow_none=self.allow_none
+        )
+
     def to_internal_value(self, data):
         """
         Data transformation to python JSON object.
@@ -1220,13 +1449,30 @@ class JsonField(Field):
         :raise ValidationError: If not valid data.
 
         """
-        if isinstance(data, (dict, list)):
-            return data
+        if not isinstance(data, (dict, list)):
+            try:
+                data = json.loads(data, encoding='utf8')
+            except (JSONDecodeError, TypeError, ValueError):
+                self.fail_field_validation('invalid')
 
-        try:
-            return json.loads(data, encoding='utf8')
-        except (JSONDecodeError, TypeError, ValueError):
-            self.fail_field_validation('invalid')
+        self.check_input_limits(data)
+        return data
+
+    def check_input_limits(self, data):
+        """
+        Check depth and count of keys of JSON data.
+
+        :param Union[dict, list] data: Data for check.
+
+        :raise ValidationError: If data exceeds the limits.
+
+        """
+        max_depth, max_keys = self.get_input_limit('max_depth'), self.get_input_limit('max_keys')
+        if max_depth is None and max_keys is None:
+            return
+        error = find_json_limit_error(data, max_depth=max_depth, max_keys=max_keys)
+        if error is not None:
+            self.fail_field_validation(error)
 
     def to_representation(self, value):
         """
@@ -1275,7 +1521,8 @@ class DictField(JsonField):
         return self.__class__(
             required=self.required, default=self.default, label=self.label,
             validators=self._src_validators, error_messages=self._src_messages,
-            child=self.child, source=self.source, allow_none=self.allow_none
+            child=copy.deepcopy(self.child, memo), max_depth=self.max_depth, max_keys=self.max_keys,
+            source=self.source, allow_none=self.allow_none
         )
 
     def to_internal_value(self, data):
@@ -1291,11 +1538,14 @@ class DictField(JsonField):
 
         """
         if html.is_html_input(data):
-            data = html.parse_html_dict(data)
+            data = html.parse_html_tree(data)
 
         if not isinstance(data, dict):
             self.fail_field_validation('not_a_dict', input_type=type(data).__name__)
 
+        # Before validation of values.
+        self.check_input_limits(data)
+
         return {
             six.text_type(key): self.child.run_validation(value)
             for key, value in six.iteritems(data)
@@ -1319,6 +1569,136 @@ class DictField(JsonField):
         }
 
 
+class ChoiceField(Field):
+    """
+    Field for value from the set of choices.
+
+    """
+    default_error_messages = {
+        'invalid_choice': '"{input}" is not a valid choice.'
+    }
+
+    def __init__(self, choices, *args, **kwargs):
+        """
+        Field for value from the set of choices.
+
+        :param Union[iter, dict] choices: Valid values. If dict, then valid values are keys.
+
+        """
+        super().__init__(*args, **kwargs)
+        self.choices = choices
+        self._choices = self.get_choices_map(choices)
+        # Form data is text, so `'1'` is also accepted for the choice `1`.
+        self._text_choices = {six.text_type(key): value for key, value in six.iteritems(self._choices)}
+
+    def __deepcopy__(self, memo={}):
+        return self.__class__(
+            required=self.required, default=self.default, label=self.label,
+            validators=self._src_validators, error_messages=self._src_messages,
+            choices=self.choices, source=self.source, allow_none=self.allow_none
+        )
+
+    def get_choices_map(self, choices):
+        """
+        Make dict for search of choices.
+
+        :param Union[iter, dict] choices: Valid values.
+
+        :return: Dict: input value -> python value.
+        :rtype: dict
+
+        :raise ValueError: If choices are not iter or not hashable.
+
+        """
+        try:
+            return {value: value for value in choices}
+        except TypeError:
+            raise ValueError('`choices=` must be iter or dict of hashable values. Reality: `{}`.'.format(choices))
+
+    def to_internal_value(self, data):
+        """
+        Data transformation to python object.
+
+        :param object data: Data for transformation.
+
+        :return: Transformed data.
+        :rtype: object
+
+        :raise ValidationError: If not valid data.
+
+        """
+        try:
+            return self._choices[data]
+        except (KeyError, TypeError):
+            pass
+        try:
+            return self._text_choices[six.text_type(data)]
+        except KeyError:
+            self.fail_field_validation('invalid_choice', input=data)
+
+    def to_representation(self, value):
+        """
+        Transformation an object to a valid JSON object.
+
+        :param object value: The object to transformation.
+
+        :return: Transformed data.
+        :rtype: object
+
+        """
+        return value
+
+
+class EnumField(ChoiceField):
+    """
+    Field for members of `enum.Enum`. In JSON are values of members.
+
+    """
+
+    def __init__(self, enum_class, *args, **kwargs):
+        """
+        Field for members of `enum.Enum`.
+
+        :param Type[enum.Enum] enum_class: Enum with valid members.
+
+        """
+        self.enum_class = enum_class
+        super().__init__(enum_class, *args, **kwargs)
+
+    def __deepcopy__(self, memo={}):
+        return self.__class__(
+            required=self.required, default=self.default, label=self.label,
+            validators=self._src_validators, error_messages=self._src_messages,
+            enum_class=self.enum_class, source=self.source, allow_none=self.allow_none
+        )
+
+    def get_choices_map(self, choices):
+        """
+        Make dict for search of members. Member is found by value and by itself.
+
+        :param Type[enum.Enum] choices: Enum with valid members.
+
+        :return: Dict: input value -> member.
+        :rtype: dict
+
+        """
+        members = {member.value: member for member in choices}
+        members.update((member, member) for member in choices)
+        return members
+
+    def to_representation(self, value):
+        """
+        Transformation a member to a valid JSON object.
+
+        :param enum.Enum value: The member to transformation.
+
+        :return: Value of member.
+        :rtype: object
+
+        """
+        return value.value if isinstance(value, enum.Enum) else value
+
+
 class SerializerMethodField(Field):
     """
     A field that get its representation from calling a method on the
@@ -1337,11 +1717,22 @@ class SerializerMethodField(Field):
         def pop_extra_info(self, data):
             return ...  # Serializing some data to return.
 
+    With `batch=True` the values for all objects of the `.data` call are computed
+    with one call of the method "get_{field_name}_batch", which takes the list of objects
+    and returns the list of values in the same order:
+
+    class ExampleSerializer(self):
+        extra_info = SerializerMethodField(batch=True)
+
+        def get_extra_info_batch(self, objs):
+            return [...]  # One query for all objects.
+
     """
     default_method_name_get_template = 'get_{field_name}'
     default_method_name_pop_template = 'pop_{field_name}'
+    default_method_name_batch_template = '{method_name_get}_batch'
 
-    def __init__(self, method_name_get=None, method_name_pop=None,  *args, **kwargs):
+    def __init__(self, method_name_get=None, method_name_pop=None, batch=False, depends_on=None, *args, **kwargs):
         """
         A field that get its representation from calling a method on the
         parent serializer class. The method called will be of the form
@@ -1350,6 +1741,8 @@ class SerializerMethodField(Field):
 
         :param str method_name_get: Method name for get data from python object.
         :param str method_name_pop: Method name for get data from request body.
+        :param bool batch: Get data for all objects with one call of method "get_{field_name}_batch"?
+        :param Iterable[str] depends_on: Dotted attribute paths of the object, which the method reads.
 
         """
         kwargs['required'] = False
@@ -1357,13 +1750,16 @@ class SerializerMethodField(Field):
 
         self.method_name_get = method_name_get
         self.method_name_pop = method_name_pop
+        self.batch = bool(batch)
+        self.depends_on = tuple(depends_on or ())
+        self._method_get = self._method_pop = self._method_batch = None  # Methods of parent, found on bind.
 
     def __deepcopy__(self, memo={}):
         return self.__class__(
             required=self.required, default=self.default, label=self.label,
             validators=self._src_validators, error_messages=self._src_messages,
             method_name_get=self.method_name_get, method_name_pop=self.method_name_pop,
-            source=self.source, allow_none=self.allow_none
+            batch=self.batch, depends_on=self.depends_on, source=self.source, allow_none=self.allow_none
         )
 
     def bind(self, field_name, parent):
@@ -1404,18 +1800,60 @@ class SerializerMethodField(Field):
 
         super(SerializerMethodField, self).bind(field_name, parent)
 
+        # Search methods once, and not on each value. Methods set on the serializer object before bind are found too.
+        self._method_get = getattr(parent, self.method_name_get, None)
+        self._method_pop = getattr(parent, self.method_name_pop, None)
+        self._method_batch = getattr(
+            parent, self.default_method_name_batch_template.format(method_name_get=self.method_name_get), None
+        ) if self.batch else None
+
+    def _get_method(self, name):
+        """
+        Get method of parent serializer, which was not found on bind.
+
+        :param str name: Method name.
+
+        :return: Method of parent serializer.
+        :rtype: Callable
+
+        :raise AttributeError: If method not found.
+
+        """
+        return getattr(self.parent, name)
+
     def _get_attribute(self, instance):
         """
-        Searches for and returns an attribute on an object..
+        The method gets the whole object.
 
-        :return: Object attribute value.
+        :return: The object.
         :rtype: object
 
-        :raise SkipError: If you could not find the field and the field is required.
-        :raise Exception: If an error occurred during the search.
+        """
+        return instance
+
+    def get_attribute(self, instance):
+        """
+        The method gets the whole object, there is nothing to search.
+
+        :return: The object.
+        :rtype: object
 
         """
-        return self.to_internal_value(instance)
+        return instance
+
+    def get_attribute_paths(self, field_name, fields=None, expand=None):
+        """
+        Attribute paths of the object, which the method reads. Declared by `depends_on=`.
+
+        :param str field_name: Field name in serializer.
+        :param dict fields: Tree of selected nested fields. None - all fields.
+        :param dict expand: Tree of expanded nested serializers.
+
+        :return: Dotted attribute paths.
+        :rtype: tuple
+
+        """
+        return self.depends_on
 
     def to_representation(self, value):
         """
@@ -1427,9 +1865,24 @@ class SerializerMethodField(Field):
         :rtype: object
 
         """
-        method = getattr(self.parent, self.method_name_get)
+        method = self._method_get or self._get_method(self.method_name_get)
         return method(value)
 
+    def to_representation_batch(self, values):
+        """
+        Transformation a list of objects to custom user objects with one call.
+
+        :param list values: The objects to transformation.
+
+        :return: Transformed data for each object, in the same order. Can be awaitable.
+        :rtype: Union[list, Awaitable[list]]
+
+        """
+        method = self._method_batch or self._get_method(
+            self.default_method_name_batch_template.format(method_name_get=self.method_name_get)
+        )
+        return method(values)
+
     def to_internal_value(self, data):
         """
         Data transformation to python custom user object.
@@ -1442,5 +1895,5 @@ class SerializerMethodField(Field):
         :raise ValidationError: If not valid data.
 
         """
-        method = getattr(self.parent, self.method_name_pop)
+        method = self._method_pop or self._get_method(self.method_name_pop)
         return method(data)
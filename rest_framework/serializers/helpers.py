@@ -2,7 +2,36 @@
 Helpers for serializers and fields.
 
 """
-from collections import OrderedDict, MutableMapping
+import asyncio
+import inspect
+import threading
+from collections import OrderedDict, MutableMapping, deque
+
+try:
+    from contextvars import ContextVar
+except ImportError:  # Python < 3.7.
+    ContextVar = None
+
+import six
+
+
+class _Missing(object):
+    """
+    Marker of not found value. Used instead of exceptions, where missing values are expected often.
+
+    """
+    __slots__ = ()
+
+    def __repr__(self):
+        return 'MISSING'
+
+    def __bool__(self):
+        return False
+
+    __nonzero__ = __bool__
+
+
+MISSING = _Missing()
 
 
 def get_class_name(obj):
@@ -20,6 +49,65 @@ def get_class_name(obj):
     return obj.__class__.__name__
 
 
+def parse_fields_tree(fields):
+    """
+    Parse selection of fields to tree.
+
+    >>> parse_fields_tree('id,author.name,comments.user')
+    {'id': {}, 'author': {'name': {}}, 'comments': {'user': {}}}
+
+    :param Union[str, Iterable[str], dict] fields: Comma separated string or list of dotted field names.
+
+    :return: Tree of fields. Empty dict means the whole field.
+    :rtype: dict
+
+    """
+    if isinstance(fields, dict):
+        return fields
+    if isinstance(fields, six.string_types):
+        fields = fields.split(',')
+
+    tree = {}
+    for path in fields:
+        node = tree
+        for name in path.strip().split('.'):
+            if name:
+                node = node.setdefault(name, {})
+    return tree
+
+
+def find_json_limit_error(data, max_depth=None, max_keys=None):
+    """
+    Search the first exceeded limit of JSON data. Stops on the first found.
+
+    >>> find_json_limit_error({'a': {'b': [1]}}, max_depth=2)
+    'max_depth'
+
+    :param Union[dict, list] data: JSON data.
+    :param int max_depth: Max depth of nested dicts and lists. None - no limit.
+    :param int max_keys: Max count of keys in one dict. None - no limit.
+
+    :return: Name of exceeded limit: `max_depth`, `max_keys` or None.
+    :rtype: Optional[str]
+
+    """
+    stack = [(data, 1)]
+    while stack:
+        value, depth = stack.pop()
+        if isinstance(value, dict):
+            if max_keys is not None and len(value) > max_keys:
+                return 'max_keys'
+            children = six.itervalues(value)
+        elif isinstance(value, (list, tuple)):
+            children = value
+        else:
+            continue
+        if max_depth is not None and depth > max_depth:
+            return 'max_depth'
+        stack.extend((child, depth + 1) for child in children if isinstance(child, (dict, list, tuple)))
+    return None
+
+
 class BindingDict(MutableMapping):
     """
     This dict-like object is used to store fields on a serializer.
@@ -61,3 +149,262 @@ class BindingDict(MutableMapping):
 
     def __repr__(self):
         return dict.__repr__(self.fields)
+
+
+class _ThreadLocalVar(threading.local):
+    """
+    Replacement of `contextvars.ContextVar` for old python. The value is separate for each thread.
+
+    """
+    def __init__(self, name, default=None):
+        self.name, self.value = name, default
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        token, self.value = self.value, value
+        return token
+
+    def reset(self, token):
+        self.value = token
+
+
+# Current `.data` call. Separate for each thread and asyncio task, so one serializer can be used concurrently.
+_current_pass = (ContextVar or _ThreadLocalVar)('representation_pass', default=None)
+
+
+class RepresentationPass(object):
+    """
+    State of one `.data` call on the root serializer.
+    It is stored in the context of the call and not on the serializer,
+    nested serializers find it through `field.root` and drop it together with the call.
+
+    >>> with RepresentationPass(root=serializer) as representation_pass:
+    ...     data = serializer.to_representation(instance)
+    >>> representation_pass.resolve()
+
+    """
+
+    def __init__(self, root=None, expand=None):
+        self.root = root  # Root serializer of the call.
+        self._token = None
+        self.memo = {}  # Computed representations. {id(serializer): {key: (instance, representation)}}
+        self.batches = OrderedDict()  # Deferred fields. {id(field): (field, objects, [(container, key)])}
+        self.expand = expand or {}  # Tree of expanded nested serializers. {'author': {}, 'comments': {'user': {}}}
+        self.expanded = {}  # Expansion decision for serializers. {id(serializer): bool}
+
+    def __enter__(self):
+        self._token = _current_pass.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _current_pass.reset(self._token)
+        self._token = None
+
+    @staticmethod
+    def current(root):
+        """
+        Get state of the current call for root serializer.
+
+        :param rest_framework.serializers.serializers.BaseSerializer root: Root serializer.
+
+        :return: Current call state or None, if the root serializer is called not from `.data`.
+        :rtype: Optional[RepresentationPass]
+
+        """
+        representation_pass = _current_pass.get()
+        if representation_pass is not None and representation_pass.root is root:
+            return representation_pass
+        return None
+
+    def is_expanded(self, serializer):
+        """
+        Check that nested serializer was expanded in `expand=` of root serializer.
+
+        :param rest_framework.serializers.serializers.BaseSerializer serializer: Nested serializer.
+
+        :return: Is the serializer expanded?
+        :rtype: bool
+
+        """
+        try:
+            return self.expanded[id(serializer)]
+        except KeyError:
+            pass
+        tree, expanded = self.expand, True
+        for name in serializer._get_expand_path():
+            if name not in tree:
+                expanded = False
+                break
+            tree = tree[name]
+        self.expanded[id(serializer)] = expanded
+        return expanded
+
+    def get_memo(self, serializer):
+        """
+        Get storage of computed representations for serializer.
+
+        :param rest_framework.serializers.serializers.BaseSerializer serializer: Serializer for memo.
+
+        :return: Dict with representations. {key: (instance, representation)}
+        :rtype: dict
+
+        """
+        try:
+            return self.memo[id(serializer)]
+        except KeyError:
+            return self.memo.setdefault(id(serializer), {})
+
+    def defer(self, field, instance, container, key):
+        """
+        Postpone the computation of field value for object, until `.resolve()`.
+
+        :param rest_framework.serializers.fields.Field field: Field with batch computation.
+        :param object instance: Object for field.
+        :param dict container: Representation, in which the value is set.
+        :param str key: Key in representation.
+
+        """
+        try:
+            _, objects, slots = self.batches[id(field)]
+        except KeyError:
+            _, objects, slots = self.batches[id(field)] = (field, [], [])
+        objects.append(instance)
+        slots.append((container, key))
+
+    def resolve(self):
+        """
+        Compute all deferred values, one call for each field.
+
+        :raise TypeError: If batch method returns coroutine.
+
+        """
+        while self.batches:
+            _, (field, objects, slots) = self.batches.popitem(last=False)
+            values = field.to_representation_batch(objects)
+            if inspect.isawaitable(values):
+                getattr(values, 'close', lambda: None)()
+                raise TypeError(
+                    'Batch method for field `{}` returns awaitable object. '
+                    'Use `await serializer.async_data()` instead of `serializer.data`.'.format(field.field_name)
+                )
+            self.scatter(field, values, slots)
+
+    async def resolve_async(self):
+        """
+        Compute all deferred values, one call for each field. Coroutines are awaited concurrently.
+
+        """
+        batches = list(self.batches.values())
+        self.batches.clear()
+
+        results = await asyncio.gather(*[
+            _ensure_result(field.to_representation_batch(objects)) for field, objects, _ in batches
+        ])
+        for (field, _, slots), values in zip(batches, results):
+            self.scatter(field, values, slots)
+
+    @staticmethod
+    def scatter(field, values, slots):
+        """
+        Set computed values to representations.
+
+        :param rest_framework.serializers.fields.Field field: Field with batch computation.
+        :param iter values: Values for each object, in the same order.
+        :param list slots: Places for values. [(container, key)]
+
+        :raise ValueError: If count of values not equal count of objects.
+
+        """
+        values = list(values)
+        if len(values) != len(slots):
+            raise ValueError(
+                'Batch method for field `{}` must return one value for each object. '
+                'Expected {}, reality {}.'.format(field.field_name, len(slots), len(values))
+            )
+        for (container, key), value in zip(slots, values):
+            container[key] = value
+
+
+async def _ensure_result(value):
+    """
+    Await value, if it is awaitable.
+
+    :param object value: Value or awaitable object.
+
+    :return: Result value.
+    :rtype: object
+
+    """
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+class SerializerPool(object):
+    """
+    Pool of serializer instances for reuse between requests.
+    An acquired serializer belongs only to the caller until `.release()`, so the pool is safe for threads and tasks.
+
+    >>> pool = SerializerPool()
+    >>> serializer = pool.acquire(PostSerializer, instance=post)
+    >>> serializer.data
+    >>> pool.release(serializer)
+
+    """
+    def __init__(self, max_size=16):
+        """
+        Creating a pool.
+
+        :param int max_size: Max count of free serializers for one serializer class and arguments.
+
+        """
+        self.max_size = max_size
+        self._free = {}  # Free serializers. {(serializer_class, kwargs): deque}
+
+    def acquire(self, serializer_class, instance=None, data=None, expand=None, **kwargs):
+        """
+        Get free serializer from the pool, or create new one.
+
+        :param Type[rest_framework.serializers.serializers.BaseSerializer] serializer_class: Serializer class.
+        :param object instance: Python object to transformation.
+        :param dict data: The data that came in the request.
+        :param Union[str, Iterable[str], dict] expand: Expanded nested serializers. Set on each acquire,
+                                                       so values from clients do not make new groups of serializers.
+        :param kwargs: Other arguments of serializer. Example: `many=True`. Must be hashable.
+
+        :return: Serializer ready for `.data` or `.is_valid()`.
+        :rtype: rest_framework.serializers.serializers.BaseSerializer
+
+        """
+        key = (serializer_class, tuple(sorted(six.iteritems(kwargs))))
+        try:
+            free = self._free[key]
+        except KeyError:
+            free = self._free.setdefault(key, deque())
+        except TypeError:  # Not hashable arguments, such serializer is not pooled.
+            return serializer_class(instance=instance, data=data, expand=expand, **kwargs)
+
+        try:
+            serializer = free.pop()
+        except IndexError:
+            serializer = serializer_class(**kwargs)
+            serializer._pool_key = key
+        return serializer.reset(instance=instance, data=data, expand=expand)
+
+    def release(self, serializer):
+        """
+        Return serializer to the pool. The serializer can not be used after it.
+
+        :param rest_framework.serializers.serializers.BaseSerializer serializer: Serializer from `.acquire()`.
+
+        """
+        key = getattr(serializer, '_pool_key', None)
+        if key is None:
+            return
+        # Drop links to the object and data, so that they are not kept alive by the pool.
+        serializer.reset()
+        free = self._free[key]
+        if len(free) < self.max_size:
+            free.append(serializer)
@@ -13,17 +13,22 @@ from collections import OrderedDict
 
 import six
 
-from rest_framework.serializers.fields import Field, SerializerMethodField
-from rest_framework.serializers.helpers import BindingDict
-from rest_framework.exceptions import SkipError
+from rest_framework.serializers.fields import Field, get_attribute
+from rest_framework.serializers.helpers import MISSING, BindingDict, RepresentationPass, parse_fields_tree
 from rest_framework.serializers.exceptions import ValidationError
 from rest_framework.utils import html
 
 
+VALIDATE_METHOD_PREFIX = 'validate_'  # Prefix of manual validation methods of fields.
+
 LIST_SERIALIZER_KWARGS = (
     'required', 'default', 'label', 'error_messages', 'allow_empty',
-    'instance', 'data', 'min_length', 'max_length', 'source'
+    'instance', 'data', 'min_length', 'max_length', 'source', 'expand',
+    'sparse_errors', 'max_errors', 'max_items'
 )  # The argument list for the ListSerializer to control the creation of many=True.
+LIST_SERIALIZER_ONLY_KWARGS = (
+    'allow_empty', 'sparse_errors', 'max_errors', 'max_items'
+)  # The arguments from LIST_SERIALIZER_KWARGS, which are not passed to the child serializer.
 
 
 class MroFieldsSearch(object):
@@ -78,6 +83,48 @@ class MroFieldsSearch(object):
         # Forward storage of fields to the class itself.
         return _declared_fields, _remove_fields
 
+    def get_validate_hooks(self, cls=None):
+        """
+        Search methods `validate_<field_name>` on order MRO.
+
+        :param rest_framework.serializers.Serializer cls: Serializer class for search methods.
+
+        :return: Dict of functions `{field_name: function(serializer, value)}`.
+        :rtype: dict
+
+        """
+        _hooks = {}
+
+        for _cls in reversed((cls or self.cls).__mro__):
+            for name, obj in six.iteritems(_cls.__dict__):
+                if not name.startswith(VALIDATE_METHOD_PREFIX) or hasattr(Field, name):
+                    continue  # Methods of Field, such as `validate_empty_values`, are not hooks.
+                field_name = name[len(VALIDATE_METHOD_PREFIX):]
+                if inspect.isfunction(obj):
+                    _hooks[field_name] = obj
+                elif callable(obj) or isinstance(obj, (staticmethod, classmethod)):
+                    # Other descriptors are resolved on the serializer object.
+                    _hooks[field_name] = self._make_attribute_hook(name)
+                else:
+                    _hooks.pop(field_name, None)
+
+        return _hooks
+
+    @staticmethod
+    def _make_attribute_hook(name):
+        """
+        Make hook, which calls attribute of serializer object.
+
+        :param str name: Attribute name.
+
+        :return: Function `function(serializer, value)`.
+        :rtype: Callable
+
+        """
+        def hook(serializer, value):
+            return getattr(serializer, name)(value)
+        return hook
+
 
 class BaseSerializerMeta(type):
     """
@@ -98,6 +145,8 @@ class BaseSerializerMeta(type):
         # Get serializer fields.
         _declared_fields = MroFieldsSearch(_cls).get_fields()
         setattr(_cls, '_declared_fields', _declared_fields)  # Ser fields information on serializer.
+        # Manual validation methods of fields, so as not to search them on each validation.
+        setattr(_cls, '_validate_hooks', MroFieldsSearch(_cls).get_validate_hooks())
 
         return _cls
 
@@ -107,18 +156,28 @@ class BaseSerializer(six.with_metaclass(BaseSerializerMeta, Field)):
     Base class serializer.
 
     """
-    def __init__(self, instance=None, data=None, *args, **kwargs):
+    def __init__(self, instance=None, data=None, memoize=False, memo_key=None,
+                 expandable=False, reference_field='id', expand=None, *args, **kwargs):
         """
         Creating a serializer. The serializer should behave like a Field so that nesting can be done.
 
         :param object instance: Python object to transformation.
         :param dict data: The data that came in the request.
+        :param bool memoize: Reuse the representation of already seen objects within one `.data` call?
+        :param Union[str, Callable] memo_key: Attribute name or function for the memo key. Default: `id(obj)`.
+        :param bool expandable: Render nested serializer as reference, until it is expanded?
+        :param str reference_field: Attribute name of the reference for not expanded serializer.
+        :param Union[str, Iterable[str], dict] expand: Expanded nested serializers. Example: `author,comments.user`.
 
         """
         super().__init__(*args, **kwargs)
         self.instance = instance
-        if isinstance(data, Mapping):
-            self.initial_data = data
+        self.memoize = bool(memoize) or memo_key is not None
+        self.memo_key = memo_key
+        self.expandable = bool(expandable)
+        self.reference_field = reference_field
+        self.expand = parse_fields_tree(expand) if expand is not None else None
+        self._set_initial_data(data)
 
     def __new__(cls, *args, **kwargs):
         """
@@ -133,7 +192,39 @@ class BaseSerializer(six.with_metaclass(BaseSerializerMeta, Field)):
     def __deepcopy__(self, memo={}):
         return self.__class__(instance=self.instance, data=self.data,
                               source=self.source, allow_none=self.allow_none,
-                              required=self.required)
+                              required=self.required,
+                              memoize=self.memoize, memo_key=self.memo_key,
+                              expandable=self.expandable, reference_field=self.reference_field)
+
+    def reset(self, instance=None, data=None, expand=None):
+        """
+        Prepare the serializer for reuse with other object or data.
+        Clears results of previous `.data` and `.is_valid()` calls, bound fields are kept.
+
+        :param object instance: Python object to transformation.
+        :param dict data: The data that came in the request.
+        :param Union[str, Iterable[str], dict] expand: Expanded nested serializers. None - nothing expanded.
+
+        :return: The same serializer.
+        :rtype: BaseSerializer
+
+        """
+        for attr in ('_data', '_validated_data', '_errors', 'initial_data'):
+            self.__dict__.pop(attr, None)
+        self.instance = instance
+        self.expand = parse_fields_tree(expand) if expand is not None else None
+        self._set_initial_data(data)
+        return self
+
+    def _set_initial_data(self, data):
+        """
+        Save the data that came in the request, for `.is_valid()`.
+
+        :param dict data: The data that came in the request.
+
+        """
+        if isinstance(data, Mapping):
+            self.initial_data = data
 
     @classmethod
     def many_init(cls, *args, **kwargs):
@@ -144,7 +235,10 @@ class BaseSerializer(six.with_metaclass(BaseSerializerMeta, Field)):
         and which are passed to the child.
 
         """
-        child_serializer = cls(*args, **kwargs)  # Make child serializer.
+        child_serializer = cls(*args, **{
+            key: value for key, value in six.iteritems(kwargs)
+            if key not in LIST_SERIALIZER_ONLY_KWARGS
+        })  # Make child serializer.
 
         # Passing arguments to the ListSerializer.
         list_kwargs = {'child': child_serializer}
@@ -156,6 +250,87 @@ class BaseSerializer(six.with_metaclass(BaseSerializerMeta, Field)):
         # Creating ListSerializer.
         return ListSerializer(*args, **list_kwargs)
 
+    @classmethod
+    def required_attributes(cls, fields=None, expand=None):
+        """
+        Attribute paths of the object, which the serializer reads during transformation to JSON.
+        Can be used to load only needed columns from the database.
+
+        >>> PostSerializer.required_attributes('title,author.name')
+        frozenset({'title', 'author.name'})
+
+        :param Union[str, Iterable[str], dict] fields: Selection of rendered fields. None - all fields.
+        :param Union[str, Iterable[str], dict] expand: Expanded nested serializers. None - nothing expanded.
+
+        :return: Dotted attribute paths.
+        :rtype: frozenset
+
+        """
+        if fields is not None or expand is not None:
+            return frozenset(cls._collect_attribute_paths(
+                parse_fields_tree(fields) if fields is not None else None,
+                parse_fields_tree(expand) if expand is not None else None
+            ))
+
+        # Plan of the class does not change, so we compute it once.
+        if '_required_attributes' not in cls.__dict__:
+            cls._required_attributes = frozenset(cls._collect_attribute_paths())
+        return cls._required_attributes
+
+    @classmethod
+    def _collect_attribute_paths(cls, fields=None, expand=None):
+        """
+        Collect attribute paths of all declared fields.
+
+        :param dict fields: Tree of selected fields. None or empty dict - all fields.
+        :param dict expand: Tree of expanded nested serializers. None - nothing expanded.
+
+        :return: Dotted attribute paths.
+        :rtype: set
+
+        """
+        paths = set()
+        for field_name, field_obj in six.iteritems(cls._declared_fields):
+            if fields and field_name not in fields:
+                continue
+            paths.update(field_obj.get_attribute_paths(
+                field_name, fields.get(field_name) if fields else None, (expand or {}).get(field_name)
+            ))
+        return paths
+
+    def get_attribute_paths(self, field_name, fields=None, expand=None):
+        """
+        Attribute paths of the object, which the nested serializer reads during transformation to JSON.
+
+        :param str field_name: Field name in serializer.
+        :param dict fields: Tree of selected nested fields. None - all fields.
+        :param dict expand: Tree of expanded nested serializers. None - this serializer is not expanded.
+
+        :return: Dotted attribute paths.
+        :rtype: tuple
+
+        """
+        name = self.source or field_name
+        if self.expandable and expand is None:
+            return (name + '.' + self.reference_field,)
+        return tuple(sorted(name + '.' + path for path in self._get_item_attribute_paths(fields, expand))) or (name,)
+
+    def _get_item_attribute_paths(self, fields=None, expand=None):
+        """
+        Attribute paths, which the serializer reads on each object.
+
+        :param dict fields: Tree of selected fields. None - all fields.
+        :param dict expand: Tree of expanded nested serializers.
+
+        :return: Dotted attribute paths.
+        :rtype: set
+
+        """
+        paths = set(self._collect_attribute_paths(fields, expand))
+        if isinstance(self.memo_key, six.string_types):
+            paths.add(self.memo_key)
+        return paths
+
     def validate(self, data):
         """
         Manual validation of serializer full data.
@@ -192,7 +367,57 @@ class BaseSerializer(six.with_metaclass(BaseSerializerMeta, Field)):
         """
         if instance is None and self.allow_none:
             return instance
-        return self.to_representation(instance)
+        if not self.memoize and not self.expandable:
+            return self.to_representation(instance)
+
+        # Memo and expansion live only while the root serializer computes `.data`.
+        representation_pass = self._get_representation_pass()
+        if self.expandable and (representation_pass is None or not representation_pass.is_expanded(self)):
+            return get_attribute(instance, self.reference_field)
+        if not self.memoize or representation_pass is None:
+            return self.to_representation(instance)
+
+        memo, key = representation_pass.get_memo(self), self._get_memo_key(instance)
+        try:
+            return memo[key][1]
+        except KeyError:
+            pass
+
+        # We keep the instance, so that `id()` is not reused during the call.
+        representation = self.to_representation(instance)
+        memo[key] = (instance, representation)
+        return representation
+
+    def _get_expand_path(self):
+        """
+        Get path of field names from the root serializer to this serializer.
+
+        :return: Field names. Example: `('comments', 'user')`.
+        :rtype: tuple
+
+        """
+        path, field = [], self
+        while getattr(field, 'parent', None) is not None:
+            if field.field_name:
+                path.append(field.field_name)
+            field = field.parent
+        return tuple(reversed(path))
+
+    def _get_memo_key(self, instance):
+        """
+        Get key for search the computed representation of object.
+
+        :param object instance: The object to transformation.
+
+        :return: Memo key.
+        :rtype: Hashable
+
+        """
+        if self.memo_key is None:
+            return id(instance)
+        if callable(self.memo_key):
+            return self.memo_key(instance)
+        return get_attribute(instance, self.memo_key)
 
     def to_representation(self, instance):
         """
@@ -251,14 +476,23 @@ class BaseSerializer(six.with_metaclass(BaseSerializerMeta, Field)):
         :rtype: rest_framework.serializers.helpers.BindingDict
 
         """
-        if not hasattr(self, '_fields'):
-            self._fields = BindingDict(self)
-            # TODO: FIXME Architecture. many call bind methods. On create serializer object
-            # Call bind method. In metaclass not access to create class.
-            for field_name, field_obj in six.iteritems(self.get_fields()):
-                self._fields[field_name] = field_obj
-
-        return self._fields
+        try:
+            return self.__dict__['_fields']
+        except KeyError:
+            pass
+
+        fields = BindingDict(self)
+        # TODO: FIXME Architecture. many call bind methods. On create serializer object
+        # Call bind method. In metaclass not access to create class.
+        for field_name, field_obj in six.iteritems(self.get_fields()):
+            fields[field_name] = field_obj
+        # Manual validation methods, set on the object, are found once with the fields.
+        hooks = self._get_validate_hooks()
+        if hooks is not type(self)._validate_hooks:
+            self._validate_hooks = hooks
+
+        # Publish only filled fields. If other thread was faster, its fields are used by all.
+        return self.__dict__.setdefault('_fields', fields)
 
     def get_fields(self):
         """
@@ -274,6 +508,26 @@ class BaseSerializer(six.with_metaclass(BaseSerializerMeta, Field)):
         
         return copy.deepcopy(self._declared_fields)
 
+    def _get_validate_hooks(self):
+        """
+        Manual validation methods of fields. Found in the class once, methods set on the object are accounted too.
+        Called on binding of fields, the result is saved to `._validate_hooks` of the object.
+
+        :return: Dict of functions `{field_name: function(serializer, value)}`.
+        :rtype: dict
+
+        """
+        hooks = type(self)._validate_hooks
+        for name, obj in six.iteritems(self.__dict__):
+            if name.startswith(VALIDATE_METHOD_PREFIX) and not hasattr(Field, name):
+                if hooks is type(self)._validate_hooks:
+                    hooks = hooks.copy()
+                if callable(obj):
+                    hooks[name[len(VALIDATE_METHOD_PREFIX):]] = MroFieldsSearch._make_attribute_hook(name)
+                else:
+                    hooks.pop(name[len(VALIDATE_METHOD_PREFIX):], None)
+        return hooks
+
     @property
     def data(self):
         """
@@ -282,6 +536,57 @@ class BaseSerializer(six.with_metaclass(BaseSerializerMeta, Field)):
         :return: Serialized object.
         :rtype: dict
 
+        """
+        self._check_data_access()
+
+        if not hasattr(self, '_data'):
+            with RepresentationPass(root=self, expand=self.expand) as representation_pass:
+                data = self._get_data_representation()
+                representation_pass.resolve()
+            self._data = data
+        return self._data
+
+    async def async_data(self):
+        """
+        Serialized object. Async version of `.data`, batch methods of fields can be coroutines.
+
+        :return: Serialized object.
+        :rtype: dict
+
+        """
+        self._check_data_access()
+
+        if not hasattr(self, '_data'):
+            with RepresentationPass(root=self, expand=self.expand) as representation_pass:
+                data = self._get_data_representation()
+            await representation_pass.resolve_async()
+            self._data = data
+        return self._data
+
+    def represent(self, instance, expand=None):
+        """
+        Transformation an object to a valid JSON object, with memo, batch fields and expand as `.data`.
+        The state of the call is not saved on the serializer, so one serializer can be used from many threads.
+
+        :param object instance: The object to transformation.
+        :param Union[str, Iterable[str], dict] expand: Expanded nested serializers. None - `expand=` of serializer.
+
+        :return: Serialized object.
+        :rtype: object
+
+        """
+        expand = parse_fields_tree(expand) if expand is not None else self.expand
+        with RepresentationPass(root=self, expand=expand) as representation_pass:
+            data = self._to_representation(instance)
+            representation_pass.resolve()
+        return data
+
+    def _check_data_access(self):
+        """
+        Check that the serializer can return `.data`.
+
+        :raise AssertionError: If data was passed and not validated.
+
         """
         if hasattr(self, 'initial_data') and not hasattr(self, '_validated_data'):
             msg = (
@@ -293,14 +598,29 @@ class BaseSerializer(six.with_metaclass(BaseSerializerMeta, Field)):
             )
             raise AssertionError(msg)
 
-        if not hasattr(self, '_data'):
-            if self.instance is not None and not getattr(self, '_errors', None):
-                self._data = self._to_representation(self.instance)
-            elif hasattr(self, '_validated_data') and not getattr(self, '_errors', None):
-                self._data = self._to_representation(self._validated_data)
-            else:
-                self._data = self.get_default()
-        return self._data
+    def _get_data_representation(self):
+        """
+        Transformation of `.instance` or `.validated_data` to a valid JSON object.
+
+        :return: Serialized object.
+        :rtype: dict
+
+        """
+        if self.instance is not None and not getattr(self, '_errors', None):
+            return self._to_representation(self.instance)
+        elif hasattr(self, '_validated_data') and not getattr(self, '_errors', None):
+            return self._to_representation(self._validated_data)
+        return self.get_default()
+
+    def _get_representation_pass(self):
+        """
+        Get state of the current `.data` call on the root serializer.
+
+        :return: Current call state or None, if the serializer is called not from `.data`.
+        :rtype: Optional[rest_framework.serializers.helpers.RepresentationPass]
+
+        """
+        return RepresentationPass.current(self.root)
 
 
 class Serializer(BaseSerializer):
@@ -337,15 +657,15 @@ class Serializer(BaseSerializer):
         for _, field_val in six.iteritems(self.fields):
             # TODO: mini hack
             field_name = field_val._get_field_name()
-            if not isinstance(field_val, SerializerMethodField):
-                # We try to get the attribute.
-                try:
-                    attribute = field_val.get_attribute(instance)
-                except SkipError:
-                    # TODO: That thing, throw an error, if the attribute of the object is not found, or skip?
-                    continue
-            else:
-                attribute = instance
+            if field_val.batch:
+                # The value is computed for all objects of the `.data` call at once.
+                self._defer_field(field_val, field_name, instance, res)
+                continue
+            # We try to get the attribute. Not found required attributes are skipped.
+            attribute = field_val.get_attribute_or_missing(instance)
+            if attribute is MISSING:
+                # TODO: That thing, throw an error, if the attribute of the object is not found, or skip?
+                continue
 
             # We try to turn it into a JSON valid format.
             res[field_name] = field_val._to_representation(attribute)
@@ -353,6 +673,24 @@ class Serializer(BaseSerializer):
         # Return.
         return res
 
+    def _defer_field(self, field, field_name, instance, res):
+        """
+        Postpone the computation of field value, until all objects are collected.
+
+        :param rest_framework.serializers.fields.Field field: Field with batch computation.
+        :param str field_name: Field name.
+        :param object instance: The object to transformation.
+        :param collections.OrderedDict res: Transformed data, for set value.
+
+        """
+        res[field_name] = None  # Keep the order of fields.
+        representation_pass = self._get_representation_pass()
+        if representation_pass is not None:
+            representation_pass.defer(field, instance, res, field_name)
+        else:
+            # Called not from `.data`, there is nothing to collect.
+            RepresentationPass.scatter(field, field.to_representation_batch([instance]), [(res, field_name)])
+
     def _manual_validate_method(self, field_name, validated_value):
         """
         Manual validation of a specific field.
@@ -365,9 +703,9 @@ class Serializer(BaseSerializer):
 
         """
         # We look, if there is a method of manual validation, we call it..
-        manual_validate_method = getattr(self, 'validate_' + field_name, None)
-        if callable(manual_validate_method):
-            validated_value = manual_validate_method(validated_value)
+        hook = self._validate_hooks.get(field_name)
+        if hook is not None:
+            validated_value = hook(self, validated_value)
         return validated_value
 
     def _field_validation(self, fields_dict, data):
@@ -382,6 +720,7 @@ class Serializer(BaseSerializer):
 
         """
         validated_data, errors = OrderedDict(), OrderedDict()
+        hooks = self._validate_hooks
         # Running through the fields.
         for _, field_obj in six.iteritems(fields_dict):
             field_name = field_obj._get_field_name()
@@ -396,8 +735,9 @@ class Serializer(BaseSerializer):
                 # Transform to python type and validate each field.
                 validated_val = field_obj.run_validation(_field_data)
 
-                # Now manual validation.
-                validated_val = self._manual_validate_method(field_name, validated_val)
+                # Now manual validation, only for fields with `validate_<field_name>` method.
+                if field_name in hooks:
+                    validated_val = hooks[field_name](self, validated_val)
 
                 # And if there was a field in the incoming data, then we save it in the converted form.
                 if field_name in data:
@@ -521,18 +861,26 @@ class ListSerializer(Serializer):
     default_error_messages = {
         'not_a_list': 'Expected a list of items but got type "{input_type}".',
         'empty': 'This list may not be empty.',
+        'max_items': 'Too many items.',
     }
 
-    def __init__(self, child=None, allow_empty=None, *args, **kwargs):
+    def __init__(self, child=None, allow_empty=None, sparse_errors=False, max_errors=None, max_items=None,
+                 *args, **kwargs):
         """
         Serializer for the list of objects.
 
         :param rest_framework.serializers.Field child: Child serializer.
         :param bool allow_empty: Allow empty list?
+        :param bool sparse_errors: Return errors only of invalid items, as dict `{"<index>": errors}`?
+        :param int max_errors: Stop validation after this count of invalid items. None - validate all items.
+        :param int max_items: Max count of items, checked before validation of items. None - global default.
 
         """
         self.child = child or copy.deepcopy(self.child)
         self.allow_empty = bool(allow_empty)
+        self.sparse_errors = bool(sparse_errors)
+        self.max_errors = max_errors
+        self.max_items = max_items
 
         # We check that the data is correct.
         assert self.child is not None, '`child` is a required argument'
@@ -543,12 +891,25 @@ class ListSerializer(Serializer):
         # Bind child serializer.
         self.child.bind(field_name='', parent=self)
 
+    def _set_initial_data(self, data):
+        """
+        Save the data that came in the request, for `.is_valid()`. Not a list is rejected by `.is_valid()`.
+
+        :param list data: The data that came in the request.
+
+        """
+        if data is not None:
+            self.initial_data = data
+
     def __deepcopy__(self, memo={}):
         return self.__class__(
             instance=self.instance, data=self.data,
-            child=self.child, allow_empty=self.allow_empty,
+            child=copy.deepcopy(self.child, memo), allow_empty=self.allow_empty,
+            sparse_errors=self.sparse_errors, max_errors=self.max_errors, max_items=self.max_items,
             source=self.source, allow_none=self.allow_none,
-            required=self.required
+            required=self.required,
+            memoize=self.memoize, memo_key=self.memo_key,
+            expandable=self.expandable, reference_field=self.reference_field
         )
 
     def to_internal_value(self, data):
@@ -579,7 +940,17 @@ class ListSerializer(Serializer):
             message = self.error_messages['empty']
             raise ValidationError(detail={'non_field_errors': [message]}, code='empty')
 
+        # Check the size before validation of items.
+        max_items = self.get_input_limit('max_items')
+        if max_items is not None and len(data) > max_items:
+            message = self.error_messages['max_items']
+            raise ValidationError(detail={'non_field_errors': [message]}, code='max_items')
+
+        if self.sparse_errors:
+            return self._validate_items_sparse(data)
+
         res, errors = [], []  # Make storage for results.
+        errors_count = 0
 
         # Validating each item from the list.
         for item in data:
@@ -588,6 +959,9 @@ class ListSerializer(Serializer):
             except ValidationError as e:
                 res.append({})
                 errors.append(e.detail)
+                errors_count += 1
+                if self.max_errors is not None and errors_count >= self.max_errors:
+                    break
             else:
                 res.append(value)
                 errors.append({})
@@ -599,6 +973,65 @@ class ListSerializer(Serializer):
         # We return the transformed and validated data.
         return res
 
+    def _validate_items_sparse(self, data):
+        """
+        Validating each item from the list. Errors are saved only for invalid items, with index of item.
+
+        :param list data: Data for validation.
+
+        :return: Transformed data.
+        :rtype: list
+
+        :raise ValidationError: If data not valid. Detail: `{"<index>": errors}`.
+
+        """
+        res, errors = [], OrderedDict()
+        for index, item in enumerate(data):
+            try:
+                value = self.child.run_validation(item)
+            except ValidationError as e:
+                errors[str(index)] = e.detail
+                res = None  # Result will not be returned, so as not to keep it.
+                if self.max_errors is not None and len(errors) >= self.max_errors:
+                    break
+            else:
+                if res is not None:
+                    res.append(value)
+
+        if errors:
+            raise ValidationError(detail=errors)
+        return res
+
+    def get_attribute_paths(self, field_name, fields=None, expand=None):
+        """
+        Attribute paths of the objects, which the nested list serializer reads during transformation to JSON.
+
+        :param str field_name: Field name in serializer.
+        :param dict fields: Tree of selected nested fields. None - all fields.
+        :param dict expand: Tree of expanded nested serializers. None - this serializer is not expanded.
+
+        :return: Dotted attribute paths.
+        :rtype: tuple
+
+        """
+        name = self.source or field_name
+        if self.child.expandable and expand is None:
+            return (name + '.' + self.child.reference_field,)
+        return tuple(sorted(name + '.' + path for path in self._get_item_attribute_paths(fields, expand))) or (name,)
+
+    def _get_item_attribute_paths(self, fields=None, expand=None):
+        """
+        Attribute paths, which the child serializer reads on each object.
+
+        :param dict fields: Tree of selected fields. None - all fields.
+        :param dict expand: Tree of expanded nested serializers.
+
+        :return: Dotted attribute paths.
+        :rtype: set
+
+        """
+        return self.child._get_item_attribute_paths(fields, expand)
+
     def to_representation(self, instance):
         """
         Transformation an object to a valid JSON list object.
@@ -628,7 +1061,7 @@ class ListSerializer(Serializer):
             )
 
         # Preparing storage for results.
-        self._errors, self._validated_data = [], []
+        self._errors, self._validated_data = OrderedDict() if self.sparse_errors else [], []
 
         # Validating all fields
         try:
@@ -668,4 +1101,4 @@ class ListSerializer(Serializer):
         """
         if not hasattr(self, '_errors'):
             raise AssertionError('You must call `.is_valid()` before accessing `.errors`.')
-        return self._errors[:]
+        return copy.copy(self._errors)
@@ -18,6 +18,7 @@ class BaseValidator(object):
 
     """
     message = ''
+    many_errors = False  # Is `detail` of raised error a list of several errors?
 
     def __init__(self, message=None):
         """
@@ -181,6 +182,105 @@ class MaxValueValidator(BaseValidator):
             self.fail(detail=self.message.format(max_value=self.max_value))
 
 
+class FusedRangeValidator(BaseValidator):
+    """
+    Validator, which runs a group of built-in validators of required, length and value in one check.
+    If the value passes the check, the validators are not called.
+    Otherwise they are called in order, so the errors are the same as from separate validators.
+
+    """
+    many_errors = True
+
+    def __init__(self, validators, *args, **kwargs):
+        """
+        Validator, which runs a group of built-in validators in one check.
+
+        :param list validators: Validators from `FUSIBLE_VALIDATORS`, at most one of each type.
+
+        """
+        super().__init__(*args, **kwargs)
+        self.validators = list(validators)
+        by_type = {type(validator): validator for validator in self.validators}
+        if len(by_type) != len(self.validators) or not all(cls in FUSIBLE_VALIDATORS for cls in by_type):
+            raise ValueError('`validators=` must be built-in validators, at most one of each type.')
+
+        min_length = getattr(by_type.get(MinLengthValidator), 'min_length', None)
+        max_length = getattr(by_type.get(MaxLengthValidator), 'max_length', None)
+        # Tuple of all limits, for one lookup on check.
+        self.limits = (
+            RequiredValidator in by_type,  # Check None?
+            min_length is not None or max_length is not None,  # Check length?
+            min_length, max_length,
+            MinValueValidator in by_type, getattr(by_type.get(MinValueValidator), 'min_value', None),
+            MaxValueValidator in by_type, getattr(by_type.get(MaxValueValidator), 'max_value', None),
+        )
+
+    def __call__(self, value):
+        """
+        Validation.
+
+        :param object value: Value for validation.
+
+        :raise: ValidationError: If not valid data. `detail` is list of errors of failed validators.
+
+        """
+        # Fast check, with the same comparisons as in the validators.
+        check_none, check_length, min_length, max_length, check_min, min_value, check_max, max_value = self.limits
+        try:
+            if not (
+                (check_none and value is None) or
+                (check_length and (
+                    (min_length is not None and len(value) < min_length) or
+                    (max_length is not None and len(value) > max_length)
+                )) or
+                (check_min and value < min_value) or
+                (check_max and value > max_value)
+            ):
+                return
+        except Exception:
+            pass  # The validators raise the same exception.
+
+        errors = []
+        for validator in self.validators:
+            try:
+                validator(value)
+            except ValidationError as e:
+                errors.append(e.detail)
+        if errors:
+            self.fail(detail=errors)
+
+    @classmethod
+    def fuse(cls, validators):
+        """
+        Replace groups of contiguous built-in validators by `FusedRangeValidator`. Order of validators is kept.
+
+        :param list validators: Validators of field.
+
+        :return: Validators for run.
+        :rtype: list
+
+        """
+        result, group = [], []
+        for validator in list(validators) + [None]:
+            if type(validator) in FUSIBLE_VALIDATORS and all(type(v) is not type(validator) for v in group):
+                group.append(validator)
+                continue
+            if len(group) > 1:
+                result.append(cls(group))
+            else:
+                result.extend(group)
+            group = [validator] if type(validator) in FUSIBLE_VALIDATORS else []
+            if validator is not None and not group:
+                result.append(validator)
+        return result
+
+
+# Built-in validators, which are run by `FusedRangeValidator`. Subclasses are not fused.
+FUSIBLE_VALIDATORS = frozenset((
+    RequiredValidator, MinLengthValidator, MaxLengthValidator, MinValueValidator, MaxValueValidator
+))
+
+
 class RegexValidator(BaseValidator):
     """
     Validator for check regex raw.
@@ -227,6 +327,58 @@ class RegexValidator(BaseValidator):
             self.fail(detail=self.message)
 
 
+class RegexSetValidator(BaseValidator):
+    """
+    Validator for check several regex raws in one call.
+    Messages of all failed regex are raised in one error.
+
+    """
+    message = RegexValidator.message
+    many_errors = True
+
+    def __init__(self, validators, *args, **kwargs):
+        """
+        Validator for check several regex raws in one call.
+
+        :param iter validators: `RegexValidator` objects or regex raws.
+
+        """
+        super().__init__(*args, **kwargs)
+        self.validators = [
+            validator if isinstance(validator, RegexValidator) else RegexValidator(validator, message=self.message)
+            for validator in validators
+        ]
+        # Bound methods of compiled regex, so the check is a loop of C calls.
+        self._checks = tuple(
+            (validator.regex.search, bool(validator.inverse_match), validator) for validator in self.validators
+        )
+
+    def get_failed(self, value):
+        """
+        Search failed validators.
+
+        :param object value: Value for validation.
+
+        :return: Failed `RegexValidator` objects, in order of declaration.
+        :rtype: list
+
+        """
+        return [validator for search, inverse_match, validator in self._checks if inverse_match is bool(search(value))]
+
+    def __call__(self, value):
+        """
+        Validation.
+
+        :param object value: Value for validation.
+
+        :raise: ValidationError: If not valid data. `detail` is list of messages of failed validators.
+
+        """
+        failed = self.get_failed(value)
+        if failed:
+            self.fail(detail=[validator.message for validator in failed])
+
+
 class ChoiceValidator(BaseValidator):
     """
     Validator for validation choice field.
@@ -247,10 +399,12 @@ class ChoiceValidator(BaseValidator):
             raise ValueError('`choices=` must be iter or dict. Reality: `{}`.'.format(type(choices)))
         super().__init__(*args, **kwargs)
         self._choices = choices
-
-    @property
-    def choices(self):
-        return self._choices.keys() if isinstance(self._choices, Mapping) else self._choices
+        self.choices = choices.keys() if isinstance(choices, Mapping) else choices
+        try:
+            self._choices_set = frozenset(self.choices)
+        except TypeError:
+            self._choices_set = None  # Not hashable choices are searched in the list.
+        self._formatted_message = None
 
     def __call__(self, value: object):
         """
@@ -259,5 +413,21 @@ class ChoiceValidator(BaseValidator):
         :param object value: Object for validation.
 
         """
-        if value not in self.choices:
-            raise ValidationError(detail=self.message.format(**dict(allowed_values=self.choices)))
+        try:
+            is_valid = value in self._choices_set
+        except TypeError:
+            is_valid = value in self.choices
+        if not is_valid:
+            raise ValidationError(detail=self.get_message())
+
+    def get_message(self):
+        """
+        Error message. Formatted once with all allowed values.
+
+        :return: Error message.
+        :rtype: str
+
+        """
+        if self._formatted_message is None:
+            self._formatted_message = self.message.format(**dict(allowed_values=self.choices))
+        return self._formatted_message
@@ -3,6 +3,10 @@ Collections.
 
 """
 import copy
+try:
+    from typing import Mapping
+except ImportError:
+    from collections import Mapping
 
 import six
 
@@ -15,11 +19,23 @@ class MultiValueDictKeyError(KeyError):
     pass
 
 
+class _Values(list):
+    """
+    Several values on the key in `MultiValueDict`. Differs from list values of users.
+
+    """
+    __slots__ = ()
+
+
+_missing = object()  # Marker of not found key.
+
+
 class MultiValueDict(dict):
     """
     A dictionary that allows you to store multiple values in one key.
     We’ve done to solve the cgi.parse_qs problem,
     which returns a list for each key, although most web forms give key value pairs.
+    Single value is stored as is, a list is made only for several values of the key.
 
 
     >>> d = MultiValueDict({'name': ['Adrian', 'Simon'], 'position': ['Developer']})
@@ -41,10 +57,19 @@ class MultiValueDict(dict):
         We’ve done to solve the cgi.parse_qs problem,
         which returns a list for each key, although most web forms give key value pairs.
 
-        :param iter key_to_list_mapping: Data for initializing.
+        :param iter key_to_list_mapping: Data for initializing. Dict or pairs, in which values are lists.
 
         """
-        super(MultiValueDict, self).__init__(key_to_list_mapping)
+        super(MultiValueDict, self).__init__()
+        if isinstance(key_to_list_mapping, MultiValueDict):
+            key_to_list_mapping = key_to_list_mapping.lists()
+        elif isinstance(key_to_list_mapping, Mapping):
+            key_to_list_mapping = six.iteritems(key_to_list_mapping)
+        for key, list_ in key_to_list_mapping:
+            self.setlist(key, list_)
+
+    def __repr__(self):
+        return repr(dict(self.lists()))
 
     def __getitem__(self, key):
         """
@@ -59,39 +84,37 @@ class MultiValueDict(dict):
         :raise KeyError: Id If you did not find the key.
 
         """
-        # First we look for an array in the dict.
         try:
-            list_ = super(MultiValueDict, self).__getitem__(key)
+            value = super(MultiValueDict, self).__getitem__(key)
         except KeyError:
             raise MultiValueDictKeyError(repr(key))
-        # Now take the last value.
-        try:
-            return list_[-1]
-        except IndexError:
-            return []
+        # Single value is stored as is, of several values take the last.
+        if type(value) is _Values:
+            return value[-1] if value else []
+        return value
 
     def __setitem__(self, key, value):
         """
-        Set an array as a value.
+        Set a single value on the key.
 
         :param object key: Key for set.
         :param object value: Value for set.
 
         """
-        super(MultiValueDict, self).__setitem__(key, [value])
+        super(MultiValueDict, self).__setitem__(key, value)
 
     def __copy__(self):
         """
-        Make a copy of the dictionary. We also copy all the values, since they are arrays.
+        Make a copy of the dictionary. Only lists of several values are copied.
 
         :return: Copied dict.
         :rtype: MultiValueDict
 
         """
-        return self.__class__([
-            (k, v[:])
-            for k, v in self.lists()
-        ])
+        result = self.__class__()
+        for key, value in dict.items(self):
+            dict.__setitem__(result, key, _Values(value) if type(value) is _Values else value)
+        return result
 
     def __deepcopy__(self, memo=None):
         """
@@ -169,17 +192,17 @@ class MultiValueDict(dict):
         """
         try:
             # Get on the key.
-            values = super(MultiValueDict, self).__getitem__(key)
+            value = super(MultiValueDict, self).__getitem__(key)
         except KeyError:
             # If not found.
             if default is None:
                 return []
             return default
-        else:
-            # If found, then return. If you need to make a copy.
-            if force_list:
-                values = list(values) if values is not None else None
-            return values
+        # Single value is stored as is.
+        if type(value) is not _Values:
+            return [value]
+        # If found, then return. If you need to make a copy.
+        return list(value) if force_list else value
 
     def getlist(self, key, default=None):
         """
@@ -199,10 +222,10 @@ class MultiValueDict(dict):
         Set list values on the key.
 
         :param object key: Key for set.
-        :param list list_: List values for set.
+        :param list list_: List values for set. The list is copied.
 
         """
-        super(MultiValueDict, self).__setitem__(key, list_)
+        super(MultiValueDict, self).__setitem__(key, list_[0] if len(list_) == 1 else _Values(list_))
 
     def setdefault(self, key, default=None):
         """
@@ -226,16 +249,17 @@ class MultiValueDict(dict):
         :param object key: Key for set.
         :param list default_list: List values on default.
 
-        :return: Value o the key.
+        :return: List values on the key. Changes of the list change the dictionary.
         :rtype: list
 
         """
-        if key not in self:
-            if default_list is None:
-                default_list = []
-            self.setlist(key, default_list)
-
-        return self._getlist(key)
+        value = dict.get(self, key, _missing)
+        if type(value) is _Values:
+            return value
+        # Single value or default is moved to list, which is returned for changes.
+        values = _Values(default_list or ()) if value is _missing else _Values((value,))
+        super(MultiValueDict, self).__setitem__(key, values)
+        return values
 
     def appendlist(self, key, value):
         """
@@ -245,7 +269,13 @@ class MultiValueDict(dict):
         :param object value: Value for append.
 
         """
-        self.setlistdefault(key).append(value)
+        current = dict.get(self, key, _missing)
+        if current is _missing:
+            super(MultiValueDict, self).__setitem__(key, value)
+        elif type(current) is _Values:
+            current.append(value)
+        else:
+            super(MultiValueDict, self).__setitem__(key, _Values((current, value)))
 
     def items(self):
         """
@@ -266,7 +296,8 @@ class MultiValueDict(dict):
         :rtype: Generator[Tuple[object, list], None, None]
 
         """
-        return six.iteritems(super(MultiValueDict, self))
+        for key in self:
+            yield key, self._getlist(key, force_list=True)
 
     def values(self):
         """
@@ -303,18 +334,19 @@ class MultiValueDict(dict):
             # If this is also a dict of arrays.
             if isinstance(other_dict, MultiValueDict):
                 for key, value_list in other_dict.lists():
-                    self.setlistdefault(key).extend(value_list)
+                    for value in value_list:
+                        self.appendlist(key, value)
             else:
                 # If this is also a dict of arrays.
                 try:
                     for key, value in six.iteritems(other_dict):
-                        self.setlistdefault(key).append(value)
+                        self.appendlist(key, value)
                 except TypeError:
                     raise ValueError("`MultiValueDict.update ()` accepts either `MultiValueDict` or` dict`")
 
         # Supplement with positional documents.
         for key, value in six.iteritems(kwargs):
-            self.setlistdefault(key).append(value)
+            self.appendlist(key, value)
 
     def dict(self):
         """
@@ -325,3 +357,77 @@ class MultiValueDict(dict):
 
         """
         return {key: self[key] for key in self}
+
+
+class LayeredMapping(Mapping):
+    """
+    Read-only dictionary over several dictionaries, as `collections.ChainMap`.
+    The key is searched in the layers in order, so the first layer has priority.
+    The layers are not copied, values are got by `.get()` of the layer.
+
+    >>> d = LayeredMapping({'name': 'body'}, {'name': 'query', 'page': '1'})
+    >>> d['name'], d['page']
+    ('body', '1')
+    """
+    __slots__ = ('layers',)
+
+    def __init__(self, *layers):
+        """
+        Read-only dictionary over several dictionaries.
+
+        :param layers: Dictionaries in order of priority. Empty layers and None are skipped.
+
+        """
+        self.layers = tuple(layer for layer in layers if layer)
+
+    def __getitem__(self, key):
+        """
+        Returns the value from the first layer with this key.
+
+        :param object key: Key for search.
+
+        :return: Found value.
+        :rtype: object
+
+        :raise KeyError: If you did not find the key.
+
+        """
+        for layer in self.layers:
+            value = layer.get(key, _missing)
+            if value is not _missing:
+                return value
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        for layer in self.layers:
+            value = layer.get(key, _missing)
+            if value is not _missing:
+                return value
+        return default
+
+    def __contains__(self, key):
+        return any(key in layer for layer in self.layers)
+
+    def __iter__(self):
+        seen = set()
+        for layer in self.layers:
+            for key in layer:
+                if key not in seen:
+                    seen.add(key)
+                    yield key
+
+    def __len__(self):
+        return len(set().union(*self.layers))
+
+    def __repr__(self):
+        return '<{}: {!r}>'.format(self.__class__.__name__, self.dict())
+
+    def dict(self):
+        """
+        We return a simple dictionary with values of layers.
+
+        :return: Simple dict.
+        :rtype: dict
+
+        """
+        return {key: self[key] for key in self}
@@ -3,9 +3,11 @@ Utilities for working with raw html request body.
 
 """
 import re
+from functools import lru_cache
 
 import six
 
+from rest_framework.serializers.exceptions import ValidationError
 from rest_framework.utils.collections import MultiValueDict
 
 
@@ -22,6 +24,125 @@ def is_html_input(dictionary):
     return hasattr(dictionary, 'getlist')
 
 
+# Part of key: `[0]` - index of list, `name` or `.name` - key of dict.
+KEY_PART_REGEX = re.compile(r'\[([0-9]+)\]|\.?([^.\[\]]+)')
+# Max count of parts of one key. Nodes are built by recursion, so deeper keys from clients are not valid.
+MAX_KEY_DEPTH = 32
+
+
+@lru_cache(maxsize=1024)
+def split_html_key(key):
+    """
+    Split key of html form to parts. Keys of one form are the same in requests, so the result is cached.
+
+    >>> split_html_key('a[0].b[1]c')
+    ('a', 0, 'b', 1, 'c')
+
+    :param str key: Key of html form.
+
+    :return: Parts of key: int - index of list, str - key of dict. If key is not nested, then one part.
+    :rtype: tuple
+
+    """
+    parts, position = [], 0
+    for match in KEY_PART_REGEX.finditer(key):
+        if match.start() != position:
+            return (key,)
+        index, name = match.groups()
+        parts.append(int(index) if index is not None else name)
+        position = match.end()
+    if position != len(key) or not parts:
+        return (key,)
+    return tuple(parts)
+
+
+@lru_cache(maxsize=256)
+def _get_prefix_regex(pattern, prefix):
+    """
+    Compile regex for keys with prefix. Compiled regex are cached.
+
+    :param str pattern: Pattern with `%s` for escaped prefix.
+    :param str prefix: Prefix of keys.
+
+    :return: Compiled regex.
+    :rtype: re.Pattern
+
+    """
+    return re.compile(pattern % re.escape(prefix))
+
+
+def parse_html_tree(dictionary):
+    """
+    Parsing html form to nested dicts and lists in one pass over the keys.
+    Nodes, in which all keys are indexes, become lists. The index order is kept, missed indexes are skipped.
+
+    {
+        'users[0].name': 'abc',
+        'users[0].tags[0]': 'def',
+        'users[1].name': 'hij',
+        'page': '1',
+    }
+        -->
+    {
+        'users': [
+            {'name': 'abc', 'tags': ['def']},
+            {'name': 'hij'}
+        ],
+        'page': '1'
+    }
+
+    :param dict dictionary: Object with dictionary interface.
+
+    :return: Parsed data.
+    :rtype: dict
+
+    """
+    tree = {}
+    for field, value in six.iteritems(dictionary):
+        _set_html_value(tree, split_html_key(field), value)
+    return _build_html_node(tree)
+
+
+def _set_html_value(tree, parts, value):
+    """
+    Set value to tree by parts of key.
+
+    :param dict tree: Tree for set.
+    :param tuple parts: Parts of key.
+    :param object value: Value for set.
+
+    :raise ValidationError: If key is deeper than `MAX_KEY_DEPTH`.
+
+    """
+    if len(parts) > MAX_KEY_DEPTH:
+        raise ValidationError(detail='Too deep nesting.')
+    node = tree
+    for part in parts[:-1]:
+        child = node.get(part)
+        if not isinstance(child, dict):
+            child = node[part] = {}
+        node = child
+    node[parts[-1]] = value
+
+
+def _build_html_node(node):
+    """
+    Make lists from nodes of tree, in which all keys are indexes.
+
+    :param dict node: Node of tree.
+
+    :return: Node with built children.
+    :rtype: Union[dict, list]
+
+    """
+    for key, value in six.iteritems(node):
+        if isinstance(value, dict):
+            node[key] = _build_html_node(value)
+    if node and all(isinstance(key, int) for key in node):
+        return [node[index] for index in sorted(node)]
+    return node
+
+
 def parse_html_list(dictionary, prefix=''):
     """
     Parsing html form, and we get sheets and dicts.
@@ -51,9 +172,24 @@ def parse_html_list(dictionary, prefix=''):
         {'foo': 'abc', 'bar': 'def'},
         {'foo': 'hij', 'bar': 'klm'}
     ]
+
+    * Nested example.
+    {
+        '[0]foo[0]': 'abc',
+        '[0]foo[1]': 'def',
+        '[1].bar.baz': 'hij',
+    }
+        -->
+    [
+        {'foo': ['abc', 'def']},
+        {'bar': {'baz': 'hij'}}
+    ]
+
+    All the levels are parsed in one pass, so nested fields get ready lists and dicts.
+    Keys without index are skipped.
     """
     ret = {}
-    regex = re.compile(r'^%s\[([0-9]+)\](.*)$' % re.escape(prefix))
+    regex = _get_prefix_regex(r'^%s(\[[0-9]+\].*)$', prefix)
 
     # We run on the values.
     for field, value in six.iteritems(dictionary):
@@ -61,23 +197,12 @@ def parse_html_list(dictionary, prefix=''):
         match = regex.match(field)
         if not match:
             continue
-
-        # Try to understand, it is an array index or a dict key.
-        index, key = match.groups()
-        index = int(index)
-
-        if not key:
-            # If list.
-            ret[index] = value
-        elif isinstance(ret.get(index), dict):
-            # If dict.
-            ret[index][key] = value
-        else:
-            # Else save source string.
-            ret[index] = MultiValueDict({key: [value]})
+        parts = split_html_key(match.group(1))
+        if isinstance(parts[0], int):
+            _set_html_value(ret, parts, value)
 
     # Return result.
-    return [ret[item] for item in sorted(ret.keys())]
+    return _build_html_node(ret) if ret else []
 
 
 def parse_html_dict(dictionary, prefix=''):
@@ -97,7 +222,7 @@ def parse_html_dict(dictionary, prefix=''):
     }
     """
     ret = MultiValueDict()
-    regex = re.compile(r'^%s\.(.+)$' % re.escape(prefix))
+    regex = _get_prefix_regex(r'^%s\.(.+)$', prefix)
     for field in dictionary:
         match = regex.match(field)
         if not match:
@@ -5,6 +5,7 @@ Views for aiohttp.
 from aiohttp.hdrs import METH_ALL
 from aiohttp.web import (
     View as AioHttpClassBaseView,
+    StreamResponse,
     json_response
 )
 
@@ -41,6 +42,38 @@ class AioHTTPApiView(AioHttpClassBaseView, BaseApiView):
         """
         return self.request.method
 
+    async def get_stream_response_async(self, encoder, status_code=200):
+        """
+        Create streaming response and write encoded chunks to it, with chunked transfer encoding.
+        `.write()` waits for draining of the transport buffer, so a slow client does not increase memory.
+        Writing stops, when the client disconnects.
+
+        :param rest_framework.views.streaming.JsonStreamEncoder encoder: Encoder of response.
+        :param int status_code: Code server response.
+
+        :return: Response object.
+        :rtype: aiohttp.web.StreamResponse
+
+        """
+        response = StreamResponse(status=status_code, headers=encoder.get_headers())
+        response.content_type = encoder.content_type
+        response.enable_chunked_encoding()
+        await response.prepare(self.request)
+
+        chunks = encoder.iter_chunks_async()
+        try:
+            async for chunk in chunks:
+                transport = self.request.transport
+                if transport is None or transport.is_closing():
+                    return response  # Client is disconnected.
+                await response.write(chunk)
+        except ConnectionResetError:
+            return response
+        finally:
+            await chunks.aclose()
+        await response.write_eof()
+        return response
+
     async def _iter(self):
         """
         Iter for request handler.
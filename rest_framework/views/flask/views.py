@@ -2,7 +2,7 @@
 Views for Flask.
 
 """
-from flask import request, jsonify, make_response
+from flask import request, jsonify, make_response, stream_with_context, Response
 from flask.views import View as _FlaskClassBaseView, MethodView as _FlaskClassBaseMethodView
 
 from rest_framework.views.base import BaseApiView
@@ -52,6 +52,23 @@ class _BaseFlaskView(object):
         """
         return request.method
 
+    def get_stream_response(self, encoder, status_code=200):
+        """
+        Create streaming response with generator of encoded chunks. Werkzeug sends it with chunked transfer encoding.
+        The request context is kept while the generator is iterated.
+
+        :param rest_framework.views.streaming.JsonStreamEncoder encoder: Encoder of response.
+        :param int status_code: Code server response.
+
+        :return: Response object.
+        :rtype: flask.Response
+
+        """
+        return Response(
+            stream_with_context(encoder.iter_chunks()), status=status_code, headers=encoder.get_headers(),
+            content_type=encoder.content_type
+        )
+
 
 class FlaskBaseApiView(_FlaskClassBaseView, _BaseFlaskView, BaseApiView):
     """
@@ -3,12 +3,16 @@ Mixins for views.
 
 """
 import abc
+import asyncio
 import logging
 
 import six
 
 from rest_framework.serializers import Serializer
-from rest_framework.views.paginations import LimitOffsetObjectsPaginator
+from rest_framework.views.paginations import LimitOffsetObjectsPaginator, collect_objects
+from rest_framework.views.streaming import (
+    JsonStreamEncoder, NdjsonStreamDecoder, DEFAULT_CHUNK_SIZE, DEFAULT_READ_SIZE, DEFAULT_MAX_LINE_SIZE
+)
 
 
 logger = logging.getLogger(__name__)
@@ -48,6 +52,15 @@ class GetSerializerMixin(GetRequestAbstractMixin):
     """
     serializer_classes = {}
 
+    # Decoder of NDJSON request body for `.get_valid_stream()`.
+    stream_decoder_class = NdjsonStreamDecoder
+
+    # Size of chunks of request body, read at once by `.get_valid_stream()`.
+    stream_read_size = DEFAULT_READ_SIZE
+
+    # Max size of one line of NDJSON request body, in bytes.
+    stream_max_line_size = DEFAULT_MAX_LINE_SIZE
+
     def get_serializer(self, key):
         """
         Search serializer.
@@ -87,6 +100,24 @@ class GetSerializerMixin(GetRequestAbstractMixin):
         """
         return self.get_serializer('in')
 
+    def get_stream_decoder(self, batch_size=None, errors=None, max_errors=None):
+        """
+        Create decoder of NDJSON request body. Each line is validated by the request serializer.
+
+        :param int batch_size: Return lists of validated items of this size. None - return items.
+        :param dict errors: Storage for errors of lines: `{"<line>": errors}`, invalid lines are skipped.
+                            None - raise error on the first invalid line.
+        :param int max_errors: Raise error, when count of errors in `errors` reaches this value. None - no limit.
+
+        :return: Decoder.
+        :rtype: rest_framework.views.streaming.NdjsonStreamDecoder
+
+        """
+        return self.stream_decoder_class(
+            self.get_request_serializer(), batch_size=batch_size, errors=errors, max_errors=max_errors,
+            max_line_size=self.stream_max_line_size
+        )
+
 
 # @check_attributes_on_none('response_class')
 class GetResponseMixin(GetSerializerMixin):
@@ -104,6 +135,25 @@ class GetResponseMixin(GetSerializerMixin):
     # Response Content Type, default: application/json
     response_content_type = 'application/json'
 
+    # Query parameter with expanded nested serializers, example: `?expand=author,comments.user`. None - disabled.
+    expand_query_param = 'expand'
+
+    # Pool for reuse of response serializers between requests, example: `SerializerPool()`. None - disabled.
+    serializer_pool = None
+
+    # Slice objects by paginator before serialization, so only objects of the page are serialized.
+    paginate_before_serialize = False
+
+    # Count of all objects for pagination, if `count=` is not passed: `counter(objs) -> int`. None - disabled.
+    # Used only with `paginate_before_serialize`, example: `len` or `lambda query: query.count()`.
+    pagination_counter = None
+
+    # Encoder of streaming list responses, `stream=True`.
+    stream_encoder_class = JsonStreamEncoder
+
+    # Count of objects, serialized and written at once by streaming list responses.
+    stream_chunk_size = DEFAULT_CHUNK_SIZE
+
     def __new__(cls, *args, **kwargs):
         res = super().__new__(cls)
         # TODO: Not working
@@ -114,24 +164,274 @@ class GetResponseMixin(GetSerializerMixin):
             )
         return res
 
+    def get_expand(self):
+        """
+        Get expanded nested serializers from request query.
+
+        :return: Value of `expand_query_param` or None.
+        :rtype: Optional[str]
+
+        """
+        request = self.request_object
+        if self.expand_query_param is None or request is None:
+            return None
+        query = getattr(request, 'query', None)  # AioHttp
+        if query is None:
+            query = getattr(request, 'args', None)  # Flask, Sanic
+        return query.get(self.expand_query_param) if query is not None else None
+
+    def acquire_response_serializer(self, obj, many=False):
+        """
+        Create response serializer for object, or get it from `serializer_pool`.
+
+        :param object obj: Object for response body.
+        :param bool many: Is it list of objects?
+
+        :return: Serializer with object.
+        :rtype: rest_framework.serializers.serializers.BaseSerializer
+
+        """
+        serializer_class, kwargs = self.get_response_serializer(), {'expand': self.get_expand()}
+        if many:
+            kwargs['many'] = True
+        if self.serializer_pool is not None:
+            return self.serializer_pool.acquire(serializer_class, instance=obj, **kwargs)
+        return serializer_class(instance=obj, **kwargs)
+
+    def release_response_serializer(self, serializer):
+        """
+        Return response serializer to `serializer_pool`.
+
+        :param rest_framework.serializers.serializers.BaseSerializer serializer: Serializer for release.
+
+        """
+        if self.serializer_pool is not None:
+            self.serializer_pool.release(serializer)
+
+    def get_list_page(self, objs, *args, **kwargs):
+        """
+        Create paginator for list objects, and get objects for serialization.
+        With `paginate_before_serialize` only objects of the page are returned.
+
+        :param list objs: List object for return response.
+        :param args: Arguments for `.paginate()` of paginator.
+        :param kwargs: Keyword arguments for `.paginate()`. `count=` is added by `pagination_counter`.
+
+        :return: Paginator or None, objects for serialization and keyword arguments for `.paginate()`.
+                 Tuple: (paginator, objects, kwargs)
+        :rtype: tuple
+
+        """
+        if not self.paginate_before_serialize or objs is None:
+            return None, objs, kwargs
+
+        if kwargs.get('count') is None and self.pagination_counter is not None:
+            kwargs = dict(kwargs, count=self.pagination_counter(objs))
+        paginator = self.pagination_class(objects=objs)
+        return paginator, paginator.slice_objects(*args, **kwargs), kwargs
+
+    async def get_list_page_async(self, objs, *args, **kwargs):
+        """
+        Create paginator for list objects, and get objects for serialization. Async version of `.get_list_page()`.
+        Objects can be async iterables or async query objects. The page and count are fetched concurrently.
+
+        :param objs: List, async iterable or query object for return response.
+        :param args: Arguments for `.paginate()` of paginator.
+        :param kwargs: Keyword arguments for `.paginate()`.
+                       `count=` is added by `pagination_counter` or by `count_mode` of paginator.
+
+        :return: Paginator or None, objects for serialization and keyword arguments for `.paginate()`.
+                 Tuple: (paginator, objects, kwargs)
+        :rtype: tuple
+
+        """
+        if not self.paginate_before_serialize or objs is None:
+            return None, await collect_objects(objs), kwargs
+
+        paginator = self.pagination_class(objects=objs)
+        if kwargs.get('count') is None and self.pagination_counter is not None:
+            count = self.pagination_counter(objs)
+            page, count = await asyncio.gather(paginator.slice_objects_async(*args, **kwargs), collect_objects(count))
+            return paginator, page, dict(kwargs, count=count)
+        page, kwargs = await paginator.fetch_page_async(*args, **kwargs)
+        return paginator, page, kwargs
+
+    def paginate_list(self, paginator, data, *args, **kwargs):
+        """
+        Make paginate data for serialized objects.
+
+        :param paginator: Paginator from `.get_list_page()` or None.
+        :param list data: Serialized objects.
+
+        :return: Result paginate data.
+        :rtype: dict
+
+        """
+        if paginator is None:
+            return self.pagination_class(objects=data).paginate(*args, **kwargs)
+        paginator.objects = data
+        return paginator.paginate(*args, **kwargs)
+
+    def serialize_chunk(self, objs):
+        """
+        Serialize chunk of objects for streaming list response.
+
+        :param list objs: Objects for serialization.
+
+        :return: Serialized objects.
+        :rtype: list
+
+        """
+        serializer = self.acquire_response_serializer(objs, many=True)
+        try:
+            return serializer.data
+        finally:
+            self.release_response_serializer(serializer)
+
+    async def serialize_chunk_async(self, objs):
+        """
+        Serialize chunk of objects for streaming list response. Async version of `.serialize_chunk()`.
+
+        :param list objs: Objects for serialization.
+
+        :return: Serialized objects.
+        :rtype: list
+
+        """
+        serializer = self.acquire_response_serializer(objs, many=True)
+        try:
+            return await serializer.async_data()
+        finally:
+            self.release_response_serializer(serializer)
+
+    def get_stream_encoder(self, paginator, objs, serialize=None, *args, **kwargs):
+        """
+        Create encoder for streaming list response. Objects are serialized by chunks, while the response is written.
+
+        :param paginator: Paginator from `.get_list_page()` or None.
+        :param objs: Objects of response. Iterable or async iterable.
+        :param Callable serialize: Serialize chunk of objects. None - objects are serialized.
+        :param args: Arguments for `.paginate()` of paginator.
+        :param kwargs: Keyword arguments for `.paginate()`.
+
+        :return: Encoder.
+        :rtype: rest_framework.views.streaming.JsonStreamEncoder
+
+        :raise ValueError: If paginator does not put objects to result as is.
+
+        """
+        if paginator is None:
+            paginator = self.pagination_class(objects=objs)
+        else:
+            paginator.objects = objs
+        envelope = paginator.paginate(*args, **kwargs)
+        items_key = next((key for key, value in envelope.items() if value is paginator.objects), None)
+        if items_key is None:
+            raise ValueError(
+                'Paginator `{}` must put `self.objects` to result as is, '
+                'for streaming responses.'.format(paginator.__class__.__name__)
+            )
+        return self.stream_encoder_class(
+            envelope, items_key, paginator.objects, serialize=serialize, chunk_size=self.stream_chunk_size
+        )
+
+    def get_stream_response(self, encoder, status_code=200):
+        """
+        Create streaming response, which writes encoded chunks. Must be implemented in views of framework.
+
+        :param rest_framework.views.streaming.JsonStreamEncoder encoder: Encoder of response.
+        :param int status_code: Code server response.
+
+        :return: Response object.
+
+        """
+        raise NotImplementedError('Streaming responses are not supported by `{}`.'.format(self.__class__.__name__))
+
+    async def get_stream_response_async(self, encoder, status_code=200):
+        """
+        Create streaming response and write encoded chunks to it. Must be implemented in views of framework.
+
+        :param rest_framework.views.streaming.JsonStreamEncoder encoder: Encoder of response.
+        :param int status_code: Code server response.
+
+        :return: Response object.
+
+        """
+        raise NotImplementedError('Streaming responses are not supported by `{}`.'.format(self.__class__.__name__))
+
     def get_list_response(self, objs=None, is_serialized=True,
                           status_code=200,
-                          *args, **kwargs):
+                          *args, stream=False, **kwargs):
+        """
+        Create and return response, object, for list objects.
+
+        :param list objs: List object for return response.
+        :param bool is_serialized: Is data serialization required?
+        :param int status_code: Code server response.
+        :param bool stream: Write response by chunks of `stream_chunk_size` objects?
+
+        :return: Response object.
+
+        """
+        if stream:
+            paginator = None
+            if self.paginate_before_serialize:
+                paginator, objs, kwargs = self.get_list_page(objs, *args, **kwargs)
+            encoder = self.get_stream_encoder(
+                paginator, objs if objs is not None else [], self.serialize_chunk if is_serialized else None,
+                *args, **kwargs
+            )
+            return self.get_stream_response(encoder, status_code=status_code)
+
+        paginator, objs, kwargs = self.get_list_page(objs, *args, **kwargs)
+        data = objs
+        if is_serialized and objs is not None:
+            serializer = self.acquire_response_serializer(objs, many=True)
+            try:
+                data = serializer.data
+            finally:
+                self.release_response_serializer(serializer)
+
+        paginate_data = self.paginate_list(paginator, data, *args, **kwargs)
+
+        return self.get_response(paginate_data, is_serialized=False, status_code=status_code)
+
+    async def get_list_response_async(self, objs=None, is_serialized=True,
+                                      status_code=200,
+                                      *args, stream=False, **kwargs):
         """
         Create and return response, object, for list objects.
+        Async version of `.get_list_response()`, batch methods of serializer fields can be coroutines.
+        Objects can be async iterables or async query objects, see `.get_list_page_async()`.
 
         :param list objs: List object for return response.
         :param bool is_serialized: Is data serialization required?
         :param int status_code: Code server response.
+        :param bool stream: Write response by chunks of `stream_chunk_size` objects?
 
         :return: Response object.
 
         """
+        if stream:
+            paginator = None
+            if self.paginate_before_serialize:
+                paginator, objs, kwargs = await self.get_list_page_async(objs, *args, **kwargs)
+            encoder = self.get_stream_encoder(
+                paginator, objs if objs is not None else [], self.serialize_chunk_async if is_serialized else None,
+                *args, **kwargs
+            )
+            return await self.get_stream_response_async(encoder, status_code=status_code)
+
+        paginator, objs, kwargs = await self.get_list_page_async(objs, *args, **kwargs)
         data = objs
         if is_serialized and objs is not None:
-            data = self.get_response_serializer()(instance=objs, many=True).data
+            serializer = self.acquire_response_serializer(objs, many=True)
+            try:
+                data = await serializer.async_data()
+            finally:
+                self.release_response_serializer(serializer)
 
-        paginate_data = self.pagination_class(objects=data).paginate(*args, **kwargs)
+        paginate_data = self.paginate_list(paginator, data, *args, **kwargs)
 
         return self.get_response(paginate_data, is_serialized=False, status_code=status_code)
 
@@ -150,9 +450,37 @@ class GetResponseMixin(GetSerializerMixin):
         """
         data = obj
         if is_serialized and obj is not None:
-            data = self.get_response_serializer()(obj).data
+            serializer = self.acquire_response_serializer(obj)
+            try:
+                data = serializer.data
+            finally:
+                self.release_response_serializer(serializer)
 
         return self.response_class.__func__(
             data, status=status_code,
             content_type=self.response_content_type
         )
+
+    async def get_response_async(self, obj=None, is_serialized=True,
+                                 status_code=200):
+        """
+        Create and return response object.
+        Async version of `.get_response()`, batch methods of serializer fields can be coroutines.
+
+        :param object obj: Object for response body.
+        :param bool is_serialized: Is data serialization required?
+        :param int status_code: Code server response.
+
+        :return: Response object.
+        :rtype: aiohttp.web_response.Response
+
+        """
+        data = obj
+        if is_serialized and obj is not None:
+            serializer = self.acquire_response_serializer(obj)
+            try:
+                data = await serializer.async_data()
+            finally:
+                self.release_response_serializer(serializer)
+
+        return self.get_response(data, is_serialized=False, status_code=status_code)
@@ -3,12 +3,71 @@ Classes for pagination objects in response.
 
 """
 import abc
+import asyncio
+import base64
+import hashlib
+import hmac
+import inspect
+import json
+from collections import namedtuple
+from itertools import islice
 
 import six
 
+from rest_framework.exceptions import ApiException
 from rest_framework.utils.decorators import copy_methods_signature
 
 
+# Decoded cursor: `position` - tuple of values of `cursor_fields` of the edge object, `reverse` - is it previous page?
+Cursor = namedtuple('Cursor', ('position', 'reverse'))
+
+# Modes of computing of `count` for async pagination.
+COUNT_EXACT = 'exact'  # `.count_objects()`, concurrently with the page.
+COUNT_ESTIMATED = 'estimated'  # `.estimate_count()`, for example from statistics of database.
+
+
+async def _ensure_result(value):
+    """
+    Await value, if it is awaitable.
+
+    :param object value: Value or awaitable object.
+
+    :return: Result value.
+    :rtype: object
+
+    """
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+async def collect_objects(objects, start=0, stop=None):
+    """
+    Read objects to list. Awaitable objects are awaited, async iterables are read by `async for`.
+
+    :param object objects: List, awaitable object or async iterable.
+    :param int start: Count of skipped objects of async iterable.
+    :param int stop: Index of the last object of async iterable. None - read all.
+
+    :return: Objects.
+    :rtype: Union[list, Iterable]
+
+    """
+    objects = await _ensure_result(objects)
+    if not hasattr(objects, '__aiter__'):
+        return objects
+    result, index = [], 0
+    if stop is not None and stop <= start:
+        return result
+    async for obj in objects:
+        if index >= start:
+            result.append(obj)
+        index += 1
+        if stop is not None and index >= stop:
+            break
+    return result
+
+
 class BasePaginatorAbstract(six.with_metaclass(abc.ABCMeta, object)):
     """
     Paginator for base class.
@@ -47,6 +106,52 @@ class BasePaginatorAbstract(six.with_metaclass(abc.ABCMeta, object)):
         """
         pass
 
+    def slice_objects(self, *args, **kwargs):
+        """
+        Get objects of current page, before serialization.
+        Takes the same arguments as `.get_paginate_data()`. By default objects are not sliced.
+
+        :return: Objects of current page.
+        :rtype: Iterable
+
+        """
+        return self.objects
+
+    async def slice_objects_async(self, *args, **kwargs):
+        """
+        Get objects of current page, before serialization. Async version of `.slice_objects()`.
+        Async iterables are read to list before slicing, awaitable results of `.slice_objects()` are awaited.
+
+        :return: Objects of current page.
+        :rtype: Iterable
+
+        """
+        if hasattr(self.objects, '__aiter__') and not hasattr(self.objects, '__getitem__'):
+            self.objects = await collect_objects(self.objects)
+        return await collect_objects(self.slice_objects(*args, **kwargs))
+
+    async def fetch_page_async(self, *args, **kwargs):
+        """
+        Get objects of current page and arguments for `.paginate()`.
+        Paginators with count compute it here, concurrently with the page.
+
+        :return: Objects of current page and keyword arguments for `.paginate()`. Tuple: (objects, kwargs)
+        :rtype: tuple
+
+        """
+        return await self.slice_objects_async(*args, **kwargs), kwargs
+
+    async def paginate_async(self, *args, **kwargs):
+        """
+        Paginate method for async iterables and async query objects. Return result paginate dict.
+
+        :return: Result paginate data
+        :rtype: dict
+
+        """
+        self.objects, kwargs = await self.fetch_page_async(*args, **kwargs)
+        return self.paginate(*args, **kwargs)
+
     def paginate(self, *args, **kwargs):
         """
         Paginate method. Return result paginate dict.
@@ -66,6 +171,10 @@ class LimitOffsetGetPaginateDataMixin(BasePaginatorAbstract):
     Mixin for limit offset pagination.
 
     """
+    # Computing of `count` in `.fetch_page_async()`, if it is not passed:
+    # `COUNT_EXACT`, `COUNT_ESTIMATED` or None - disabled.
+    count_mode = None
+
     def get_paginate_data(self, limit=10, offset=0, count=None):
         """
         Get paginate data for limit offset pagination.
@@ -76,6 +185,249 @@ class LimitOffsetGetPaginateDataMixin(BasePaginatorAbstract):
         """
         return dict(limit=limit, offset=offset, count=count)
 
+    def slice_objects(self, limit=10, offset=0, count=None):
+        """
+        Get objects of current page. Objects with slicing, for example lists or query objects of ORM,
+        are sliced by `objects[offset:offset + limit]`, other iterables are read by `itertools.islice()`.
+
+        :return: Objects of current page.
+        :rtype: Iterable
+
+        """
+        if self.objects is None:
+            return None
+        stop = offset + limit if limit is not None else None
+        if hasattr(self.objects, '__getitem__'):
+            return self.objects[offset:stop]
+        return list(islice(self.objects, offset, stop))
+
+    async def slice_objects_async(self, limit=10, offset=0, count=None):
+        """
+        Get objects of current page. Async version of `.slice_objects()`.
+        Async iterables are read only to the end of the page.
+
+        :return: Objects of current page.
+        :rtype: Iterable
+
+        """
+        if hasattr(self.objects, '__aiter__') and not hasattr(self.objects, '__getitem__'):
+            return await collect_objects(self.objects, offset, offset + limit if limit is not None else None)
+        return await collect_objects(self.slice_objects(limit=limit, offset=offset, count=count))
+
+    async def fetch_page_async(self, *args, **kwargs):
+        """
+        Get objects of current page and arguments for `.paginate()`. Takes the same arguments as `.paginate()`.
+        If `count` is not passed, it is computed by `count_mode`, concurrently with the page.
+
+        :return: Objects of current page and keyword arguments for `.paginate()`. Tuple: (objects, kwargs)
+        :rtype: tuple
+
+        """
+        page = self.slice_objects_async(*args, **kwargs)
+        if len(args) > 2 or kwargs.get('count') is not None or self.count_mode is None:
+            return await page, kwargs
+
+        counter = self.count_objects if self.count_mode == COUNT_EXACT else self.estimate_count
+        page, count = await asyncio.gather(page, _ensure_result(counter(self.objects)))
+        return page, dict(kwargs, count=count)
+
+    def count_objects(self, objects):
+        """
+        Count all objects. Sized objects are counted by `len()`, query objects of ORM by `.count()`.
+
+        :param object objects: All objects.
+
+        :return: Count of objects or awaitable object. None - objects can not be counted, for example async iterator.
+        :rtype: Optional[Union[int, Awaitable]]
+
+        """
+        if hasattr(objects, '__len__'):
+            return len(objects)
+        count = getattr(objects, 'count', None)
+        return count() if callable(count) else None
+
+    def estimate_count(self, objects):
+        """
+        Estimate count of all objects, for `COUNT_ESTIMATED`. Override it for cheap estimations,
+        for example from statistics of database. By default only sized objects are counted.
+
+        :param object objects: All objects.
+
+        :return: Estimated count of objects or awaitable object. None - unknown.
+        :rtype: Optional[Union[int, Awaitable]]
+
+        """
+        return len(objects) if hasattr(objects, '__len__') else None
+
+
+class CursorGetPaginateDataMixin(BasePaginatorAbstract):
+    """
+    Mixin for cursor (keyset) pagination. Objects must be sorted by `cursor_fields`.
+    Cursors are opaque strings with values of `cursor_fields` of the edge object, signed by HMAC.
+
+    The data layer gets the position from `.decode_cursor()` and selects objects after it,
+    for example `WHERE (created, id) > (?, ?) ORDER BY created, id LIMIT limit + 1`.
+    For previous page: `WHERE (created, id) < (?, ?) ORDER BY created DESC, id DESC LIMIT limit + 1`.
+    One extra object shows that there is one more page.
+
+    """
+    cursor_fields = ('id',)  # Fields of sort key. The last one must be unique, as tie-breaker.
+    secret_key = None  # Key for signing of cursors. Must be set.
+    cursor_query_param = 'cursor'  # Query parameter for links.
+    invalid_cursor_message = 'Invalid cursor.'
+    _is_sliced = False  # Are objects selected by `.slice_objects()`?
+
+    def get_paginate_data(self, limit=10, cursor=None, base_url=None):
+        """
+        Get paginate data for cursor pagination.
+        Leaves in `self.objects` at most `limit` objects, in order of `cursor_fields`.
+        If `.slice_objects()` was not called, objects after the cursor are selected by `.filter_objects()`.
+
+        :param int limit: Count of objects on page.
+        :param str cursor: Cursor of current page. None - first page.
+        :param str base_url: URL for links. None - cursors without URL.
+
+        :return: Paginate data dict. {'limit': limit, 'next': link, 'previous': link}
+        :rtype: dict
+
+        """
+        position, reverse = self.decode_cursor(cursor) if cursor else Cursor(None, False)
+        objects = self.objects
+        if objects is not None and not self._is_sliced:
+            objects = self.filter_objects(objects, position, reverse, limit + 1)
+        objects = list(objects) if objects is not None else []
+        has_more = len(objects) > limit
+        objects = objects[:limit]
+        if reverse:
+            objects.reverse()
+        self.objects = objects
+
+        has_next, has_previous = (True, has_more) if reverse else (has_more, position is not None)
+        next_link = previous_link = None
+        if objects and has_next:
+            next_link = self.get_link(self.encode_cursor(self.get_position(objects[-1])), base_url)
+        if objects and has_previous:
+            previous_link = self.get_link(self.encode_cursor(self.get_position(objects[0]), reverse=True), base_url)
+        return dict(limit=limit, next=next_link, previous=previous_link)
+
+    def slice_objects(self, limit=10, cursor=None, base_url=None):
+        """
+        Get objects of current page, with one extra object.
+
+        :return: Objects of current page.
+        :rtype: Iterable
+
+        """
+        if self.objects is None:
+            return None
+        position, reverse = self.decode_cursor(cursor) if cursor else Cursor(None, False)
+        self._is_sliced = True
+        return self.filter_objects(self.objects, position, reverse, limit + 1)
+
+    def filter_objects(self, objects, position, reverse, limit):
+        """
+        Select objects after position. Override it for query objects of ORM.
+        By default sorted sequences are filtered in memory.
+
+        :param Iterable objects: All objects, sorted by `cursor_fields`.
+        :param Optional[tuple] position: Values of `cursor_fields` of the edge object. None - first page.
+        :param bool reverse: Select objects before position, in reverse order?
+        :param int limit: Max count of objects.
+
+        :return: Selected objects.
+        :rtype: list
+
+        """
+        objects = reversed(list(objects)) if reverse else objects
+        if position is not None:
+            if reverse:
+                objects = (obj for obj in objects if self.get_position(obj) < position)
+            else:
+                objects = (obj for obj in objects if self.get_position(obj) > position)
+        return list(islice(objects, limit))
+
+    def get_position(self, obj):
+        """
+        Get values of `cursor_fields` of object.
+
+        :param object obj: Object or dict.
+
+        :return: Values of sort key.
+        :rtype: tuple
+
+        """
+        if isinstance(obj, dict):
+            return tuple(obj[field] for field in self.cursor_fields)
+        return tuple(getattr(obj, field) for field in self.cursor_fields)
+
+    def get_link(self, cursor, base_url=None):
+        """
+        Make link to page.
+
+        :param str cursor: Cursor of page.
+        :param str base_url: URL of list. None - return cursor.
+
+        :return: Link or cursor.
+        :rtype: str
+
+        """
+        if base_url is None:
+            return cursor
+        return '{}{}{}={}'.format(base_url, '&' if '?' in base_url else '?', self.cursor_query_param, cursor)
+
+    def _sign(self, payload):
+        """
+        Sign payload of cursor.
+
+        :param bytes payload: Payload.
+
+        :return: Signature.
+        :rtype: str
+
+        """
+        assert self.secret_key is not None, '`secret_key` of `{}` must be set.'.format(self.__class__.__name__)
+        key = self.secret_key.encode('utf8') if isinstance(self.secret_key, six.text_type) else self.secret_key
+        digest = hmac.new(key, payload, hashlib.sha256).digest()[:16]
+        return base64.urlsafe_b64encode(digest).rstrip(b'=').decode('ascii')
+
+    def encode_cursor(self, position, reverse=False):
+        """
+        Make signed cursor.
+
+        :param tuple position: Values of `cursor_fields`. Must be JSON values.
+        :param bool reverse: Is it cursor of previous page?
+
+        :return: Cursor.
+        :rtype: str
+
+        """
+        payload = json.dumps([list(position), int(reverse)], separators=(',', ':')).encode('utf8')
+        payload = base64.urlsafe_b64encode(payload).rstrip(b'=')
+        return '{}.{}'.format(payload.decode('ascii'), self._sign(payload))
+
+    def decode_cursor(self, cursor):
+        """
+        Check signature of cursor and decode it.
+
+        :param str cursor: Cursor.
+
+        :return: Decoded cursor.
+        :rtype: Cursor
+
+        :raise ApiException: If cursor is not valid.
+
+        """
+        try:
+            payload, signature = cursor.encode('ascii').split(b'.')
+            if not hmac.compare_digest(self._sign(payload), signature.decode('ascii')):
+                raise ValueError('Wrong signature.')
+            position, reverse = json.loads(base64.urlsafe_b64decode(payload + b'=' * (-len(payload) % 4)))
+            if not isinstance(position, list) or len(position) != len(self.cursor_fields):
+                raise ValueError('Wrong position.')
+        except (ValueError, TypeError, AttributeError, UnicodeError):
+            raise ApiException(detail=self.invalid_cursor_message, status=400)
+        return Cursor(tuple(position), bool(reverse))
+
 
 class ResultGetObjectsDataPaginatorMixin(BasePaginatorAbstract):
     """
@@ -153,3 +505,30 @@ class LimitOffsetItemsPaginator(LimitOffsetGetPaginateDataMixin, ItemsGetObjects
 
     """
     pass
+
+
+@copy_methods_signature({'get_paginate_data': 'paginate'})
+class CursorResultPaginator(CursorGetPaginateDataMixin, ResultGetObjectsDataPaginatorMixin, BasePaginatorAbstract):
+    """
+    Cursor result paginator.
+
+    """
+    pass
+
+
+@copy_methods_signature({'get_paginate_data': 'paginate'})
+class CursorObjectsPaginator(CursorGetPaginateDataMixin, ObjectsGetObjectsDataPaginatorMixin, BasePaginatorAbstract):
+    """
+    Cursor objects paginator.
+
+    """
+    pass
+
+
+@copy_methods_signature({'get_paginate_data': 'paginate'})
+class CursorItemsPaginator(CursorGetPaginateDataMixin, ItemsGetObjectsDataPaginatorMixin, BasePaginatorAbstract):
+    """
+    Cursor items paginator.
+
+    """
+    pass
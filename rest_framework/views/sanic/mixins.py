@@ -9,6 +9,7 @@ except (AttributeError, ImportError):
 
 from rest_framework.views.mixins import GetSerializerMixin
 from rest_framework.serializers.exceptions import ValidationError
+from rest_framework.utils.collections import LayeredMapping
 
 
 class GetValidJsonMixin(GetSerializerMixin):
@@ -28,13 +29,16 @@ class GetValidJsonMixin(GetSerializerMixin):
 
         """
         # Get request query
-        data = self.request_object.args.copy() if parse_query else {}
+        query = self.request_object.args if parse_query else None
         # Get request body
+        body = {}
         try:
-            data.update(self.request_object.json)
+            body = self.request_object.json
         except JSONDecodeError:
             if raise_exception:
                 raise ValidationError(detail='Not valid json.')
+        # Body has priority over query. Nothing is copied.
+        data = LayeredMapping(body, query)
 
         # Validate body request.
         serializer = self.get_request_serializer()
@@ -44,3 +48,37 @@ class GetValidJsonMixin(GetSerializerMixin):
         serializer.is_valid(raise_exception=True)
 
         return serializer.validated_data
+
+    async def get_valid_stream(self, batch_size=None, errors=None, max_errors=None):
+        """
+        Read NDJSON request BODY by chunks, validate each line by the request serializer and yield validated data.
+        Only one chunk and one line of body are kept in memory.
+
+        :param int batch_size: Yield lists of validated items of this size. None - yield items.
+        :param dict errors: Storage for errors of lines: `{"<line>": errors}`, invalid lines are skipped.
+                            None - raise error on the first invalid line.
+        :param int max_errors: Raise error, when count of errors in `errors` reaches this value. None - no limit.
+
+        :return: Async generator of validated items or batches.
+        :rtype: AsyncIterator
+
+        :raise ValidationError: If line is not valid.
+
+        """
+        decoder = self.get_stream_decoder(batch_size=batch_size, errors=errors, max_errors=max_errors)
+        request = self.request_object
+        stream = getattr(request, 'stream', None)
+        if stream is None:
+            # Body is read by Sanic, for routes without `stream=True`.
+            for item in decoder.feed(request.body or b'') + decoder.close():
+                yield item
+            return
+
+        while True:
+            chunk = await stream.read()
+            if chunk is None:
+                break
+            for item in decoder.feed(chunk):
+                yield item
+        for item in decoder.close():
+            yield item
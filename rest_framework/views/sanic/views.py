@@ -44,6 +44,39 @@ class _BaseSanicView(object):
         """
         return self._request.method
 
+    def get_stream_response(self, encoder, status_code=200):
+        """
+        Create streaming response, which writes encoded chunks with chunked transfer encoding.
+
+        :param rest_framework.views.streaming.JsonStreamEncoder encoder: Encoder of response.
+        :param int status_code: Code server response.
+
+        :return: Response object.
+        :rtype: sanic.response.StreamingHTTPResponse
+
+        """
+        async def streaming_fn(stream_response):
+            async for chunk in encoder.iter_chunks_async():
+                await stream_response.write(chunk)
+
+        return response.stream(
+            streaming_fn, status=status_code, headers=encoder.get_headers(), content_type=encoder.content_type
+        )
+
+    async def get_stream_response_async(self, encoder, status_code=200):
+        """
+        Create streaming response, which writes encoded chunks with chunked transfer encoding.
+        Serialization of chunks can return coroutines.
+
+        :param rest_framework.views.streaming.JsonStreamEncoder encoder: Encoder of response.
+        :param int status_code: Code server response.
+
+        :return: Response object.
+        :rtype: sanic.response.StreamingHTTPResponse
+
+        """
+        return self.get_stream_response(encoder, status_code=status_code)
+
 
 class SanicApiMethodView(_SanicHTTPMethodView, BaseApiView, _BaseSanicView):
     """
@@ -0,0 +1,378 @@
+"""
+Encoders for streaming list responses.
+
+"""
+import inspect
+import json
+from itertools import islice
+
+from rest_framework.serializers.exceptions import ValidationError
+
+
+DEFAULT_CHUNK_SIZE = 100  # Count of objects, serialized and encoded at once.
+DEFAULT_READ_SIZE = 64 * 1024  # Size of chunks of request body, read at once.
+DEFAULT_MAX_LINE_SIZE = 1024 * 1024  # Max size of one line of NDJSON request body.
+
+# Places of pagination data in NDJSON responses.
+METADATA_TRAILER = 'trailer'  # The last line: `{"pagination": {...}}`.
+METADATA_HEADERS = 'headers'  # Headers: `X-Pagination-Limit: 10`.
+
+
+class JsonStreamEncoder(object):
+    """
+    Encoder of list response by chunks, for any framework.
+    Writes the paginator envelope, then items of the page, so the whole JSON is never built in memory.
+
+    >>> encoder = JsonStreamEncoder({'limit': 2, 'objects': None}, 'objects', [1, 2])
+    >>> b''.join(encoder.iter_chunks())
+    b'{"limit": 2, "objects": [1, 2]}'
+
+    """
+    content_type = 'application/json'
+
+    def __init__(self, envelope, items_key, items, serialize=None, chunk_size=DEFAULT_CHUNK_SIZE, dumps=json.dumps):
+        """
+        Encoder of list response by chunks.
+
+        :param dict envelope: Paginate data. Value of `items_key` is replaced by streamed items.
+        :param str items_key: Key of items in envelope. None - items are encoded as JSON array, without envelope.
+        :param items: Objects. Iterable, or async iterable for `.iter_chunks_async()`.
+        :param Callable serialize: Serialize chunk of objects: `serialize(objects) -> list`.
+                                   Can return awaitable for `.iter_chunks_async()`. None - objects are serialized.
+        :param int chunk_size: Count of objects in one chunk.
+        :param Callable dumps: Function for encode JSON values to str.
+
+        """
+        self.envelope = envelope
+        self.items_key = items_key
+        self.items = items
+        self.serialize = serialize
+        self.chunk_size = int(chunk_size)
+        self.dumps = dumps
+
+    def get_head(self):
+        """
+        Get beginning of response, before items.
+
+        :return: Beginning of response.
+        :rtype: str
+
+        """
+        if self.items_key is None:
+            return '['
+        envelope = {key: value for key, value in self.envelope.items() if key != self.items_key}
+        if not envelope:
+            return '{{{}: ['.format(self.dumps(self.items_key))
+        return '{}, {}: ['.format(self.dumps(envelope)[:-1], self.dumps(self.items_key))
+
+    def get_tail(self):
+        """
+        Get end of response, after items.
+
+        :return: End of response.
+        :rtype: str
+
+        """
+        return ']' if self.items_key is None else ']}'
+
+    def get_headers(self):
+        """
+        Get additional headers of response.
+
+        :return: Headers.
+        :rtype: dict
+
+        """
+        return {}
+
+    def encode_items(self, values, is_first):
+        """
+        Encode chunk of serialized items.
+
+        :param list values: Serialized items.
+        :param bool is_first: Is it the first chunk?
+
+        :return: Encoded items.
+        :rtype: str
+
+        """
+        encoded = ', '.join(self.dumps(value) for value in values)
+        return encoded if is_first else ', ' + encoded
+
+    def iter_chunks(self):
+        """
+        Encode response by chunks.
+
+        :return: Generator of encoded chunks.
+        :rtype: Iterator[bytes]
+
+        """
+        head = self.get_head()
+        if head:  # Empty chunk is the end of chunked response.
+            yield head.encode('utf8')
+        items, is_first = iter(self.items), True
+        chunk = list(islice(items, self.chunk_size))
+        while chunk:
+            values = self.serialize(chunk) if self.serialize is not None else chunk
+            if inspect.isawaitable(values):
+                getattr(values, 'close', lambda: None)()
+                raise TypeError('Serialization returns awaitable object. Use `.iter_chunks_async()`.')
+            if values:
+                yield self.encode_items(values, is_first).encode('utf8')
+                is_first = False
+            chunk = list(islice(items, self.chunk_size))
+        tail = self.get_tail()
+        if tail:
+            yield tail.encode('utf8')
+
+    async def iter_chunks_async(self):
+        """
+        Encode response by chunks. Async version of `.iter_chunks()`.
+        Items can be async iterable, serialization can return awaitable.
+
+        :return: Async generator of encoded chunks.
+        :rtype: AsyncIterator[bytes]
+
+        """
+        head = self.get_head()
+        if head:
+            yield head.encode('utf8')
+        is_first = True
+        async for chunk in self._iter_objects_async():
+            values = self.serialize(chunk) if self.serialize is not None else chunk
+            if inspect.isawaitable(values):
+                values = await values
+            if values:
+                yield self.encode_items(values, is_first).encode('utf8')
+                is_first = False
+        tail = self.get_tail()
+        if tail:
+            yield tail.encode('utf8')
+
+    async def _iter_objects_async(self):
+        """
+        Read objects by chunks.
+
+        :return: Async generator of chunks of objects.
+        :rtype: AsyncIterator[list]
+
+        """
+        if not hasattr(self.items, '__aiter__'):
+            items = iter(self.items)
+            chunk = list(islice(items, self.chunk_size))
+            while chunk:
+                yield chunk
+                chunk = list(islice(items, self.chunk_size))
+            return
+
+        chunk = []
+        async for obj in self.items:
+            chunk.append(obj)
+            if len(chunk) >= self.chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+class NdjsonStreamEncoder(JsonStreamEncoder):
+    """
+    Encoder of list response to NDJSON (JSON Lines): one item on each line.
+    Pagination data is written as the last line or in headers, by `metadata`.
+    Consumers can process the response by lines, and no JSON array is built.
+
+    >>> encoder = NdjsonStreamEncoder({'limit': 2, 'objects': None}, 'objects', [1, 2])
+    >>> b''.join(encoder.iter_chunks())
+    b'1\\n2\\n{"pagination": {"limit": 2}}\\n'
+
+    """
+    content_type = 'application/x-ndjson'
+    metadata = METADATA_TRAILER  # `METADATA_TRAILER`, `METADATA_HEADERS` or None - pagination data is not written.
+    trailer_key = 'pagination'  # Key of pagination data in the last line.
+    headers_prefix = 'X-Pagination-'  # Prefix of headers with pagination data.
+
+    def get_metadata(self):
+        """
+        Get pagination data, without items.
+
+        :return: Pagination data.
+        :rtype: dict
+
+        """
+        if self.items_key is None:
+            return {}
+        return {key: value for key, value in self.envelope.items() if key != self.items_key}
+
+    def get_head(self):
+        return ''
+
+    def get_tail(self):
+        metadata = self.get_metadata()
+        if self.metadata != METADATA_TRAILER or not metadata:
+            return ''
+        return self.dumps({self.trailer_key: metadata}) + '\n'
+
+    def get_headers(self):
+        """
+        Get headers with pagination data, for `METADATA_HEADERS`. Headers with None values are skipped.
+
+        :return: Headers. Example: {'X-Pagination-Limit': '10', 'X-Pagination-Next': '/items?cursor=...'}
+        :rtype: dict
+
+        """
+        if self.metadata != METADATA_HEADERS:
+            return {}
+        return {
+            self.headers_prefix + '-'.join(part.capitalize() for part in str(key).split('_')):
+                value if isinstance(value, str) else self.dumps(value)
+            for key, value in self.get_metadata().items() if value is not None
+        }
+
+    def encode_items(self, values, is_first):
+        return ''.join(self.dumps(value) + '\n' for value in values)
+
+
+class NdjsonStreamDecoder(object):
+    """
+    Decoder of NDJSON (JSON Lines) request body by chunks, for any framework.
+    Each line is validated by the request serializer, as an item of list, so only one line is kept in memory.
+
+    >>> decoder = NdjsonStreamDecoder()
+    >>> decoder.feed(b'{"a": 1}\\n{"a"') + decoder.feed(b': 2}') + decoder.close()
+    [{'a': 1}, {'a': 2}]
+
+    """
+    invalid_json_message = 'Not valid json.'
+    line_too_long_message = 'Line is too long.'
+
+    def __init__(self, serializer_class=None, batch_size=None, errors=None, max_errors=None,
+                 max_line_size=DEFAULT_MAX_LINE_SIZE):
+        """
+        Decoder of NDJSON request body by chunks.
+
+        :param Type[rest_framework.serializers.Serializer] serializer_class: Serializer for each line.
+                                                                            None - lines are not validated.
+        :param int batch_size: Return lists of validated items of this size. None - return items.
+        :param dict errors: Storage for errors of lines: `{"<line>": errors}`, invalid lines are skipped.
+                            None - raise error on the first invalid line.
+        :param int max_errors: Raise error, when count of errors in `errors` reaches this value. None - no limit.
+        :param int max_line_size: Max size of one line in bytes.
+
+        """
+        self.child = serializer_class() if serializer_class is not None else None
+        self.batch_size = batch_size if batch_size is None else int(batch_size)
+        self.errors = errors
+        self.max_errors = max_errors
+        self.max_line_size = int(max_line_size)
+        self.line_number = 0  # Number of the last read line, from 1.
+        self._parts, self._size = [], 0  # Parts of current line.
+        self._skip_line = False  # Is current line too long? It is skipped to the end.
+        self._batch = []
+
+    def feed(self, chunk):
+        """
+        Decode and validate complete lines of chunk. The end of the last line is waited in the next chunks.
+
+        :param bytes chunk: Chunk of request body.
+
+        :return: Validated items or batches.
+        :rtype: list
+
+        :raise ValidationError: If line is not valid.
+
+        """
+        lines = chunk.split(b'\n')
+        result = []
+        for line in lines[:-1]:
+            if self._skip_line:
+                self._skip_line = False
+                self.line_number += 1
+                continue
+            if self._parts:
+                self._parts.append(line)
+                line, self._parts, self._size = b''.join(self._parts), [], 0
+            self._add_line(line, result)
+
+        tail = lines[-1]
+        if tail and not self._skip_line:
+            self._size += len(tail)
+            if self._size > self.max_line_size:
+                self._parts, self._size, self._skip_line = [], 0, True
+                self.fail_line(self.line_number + 1, self.line_too_long_message)
+            else:
+                self._parts.append(tail)
+        return result
+
+    def close(self):
+        """
+        Decode and validate the last line, without the end of line, and return the last batch.
+
+        :return: Validated items or batches.
+        :rtype: list
+
+        :raise ValidationError: If line is not valid.
+
+        """
+        result = []
+        if self._skip_line:
+            self._skip_line = False
+            self.line_number += 1
+        elif self._parts:
+            line, self._parts, self._size = b''.join(self._parts), [], 0
+            self._add_line(line, result)
+        if self._batch:
+            result.append(self._batch)
+            self._batch = []
+        return result
+
+    def _add_line(self, line, result):
+        """
+        Validate line and add item to result.
+
+        :param bytes line: Line of request body.
+        :param list result: Storage for items or batches.
+
+        """
+        self.line_number += 1
+        if len(line) > self.max_line_size:
+            self.fail_line(self.line_number, self.line_too_long_message)
+            return
+        if not line.strip():
+            return  # Empty lines are skipped.
+
+        try:
+            value = json.loads(line.decode('utf8'))
+        except (ValueError, UnicodeDecodeError):
+            self.fail_line(self.line_number, self.invalid_json_message)
+            return
+
+        if self.child is not None:
+            try:
+                value = self.child.run_validation(value)
+            except ValidationError as e:
+                self.fail_line(self.line_number, e.detail)
+                return
+
+        if self.batch_size is None:
+            result.append(value)
+            return
+        self._batch.append(value)
+        if len(self._batch) >= self.batch_size:
+            result.append(self._batch)
+            self._batch = []
+
+    def fail_line(self, line_number, detail):
+        """
+        Report error of line. Raise it, or save it to `errors`.
+
+        :param int line_number: Number of line, from 1.
+        :param detail: Errors of line.
+
+        :raise ValidationError: If `errors` is None, or count of errors reaches `max_errors`.
+
+        """
+        if self.errors is None:
+            raise ValidationError(detail={str(line_number): detail})
+        self.errors[str(line_number)] = detail
+        if self.max_errors is not None and len(self.errors) >= self.max_errors:
+            raise ValidationError(detail=self.errors)
@@ -20,6 +20,7 @@ setup(
     description='Python Rest Framework. Box utils for easy makes rest api on python',
     long_description=README,
     long_description_content_type='text/markdown',
+    python_requires='>=3.6',  # Async generators in serializers and streaming responses.
     install_requires=['six>=1'],
     tests_require=['codecov>=2', 'coverage>=4'],
     extras_require={
@@ -40,8 +41,6 @@ setup(
         'Operating System :: OS Independent',
         'Programming Language :: Python',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.4',
-        'Programming Language :: Python :: 3.5',
         'Programming Language :: Python :: 3.6',
         'Programming Language :: Python :: 3.7',
         'Topic :: Internet :: WWW/HTTP',
@@ -2,10 +2,12 @@ import unittest
 
 from .test_fields import *
 from .test_serializers import *
+from .test_utils import *
 from .test_validators import *
 from .test_views import *
 from .test_views_mixin import *
 from .test_views_pagination import *
+from .test_views_streaming import *
 
 
 if __name__ == '__main__':
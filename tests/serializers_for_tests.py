@@ -7,6 +7,7 @@ from rest_framework.serializers.fields import (
     CharField, IntegerField, FloatField, BooleanField, ListField, SerializerMethodField
 )
 from rest_framework.serializers.serializers import Serializer
+from rest_framework.serializers.exceptions import ValidationError
 
 
 class SerializerPrimitiveField(Serializer):
@@ -129,3 +130,170 @@ class InheritAllowNoneSerializer(Serializer):
 
     """
     inherit = AllowNoneSerializer(allow_none=True)
+
+
+class CountingAuthorSerializer(Serializer):
+    """
+    Serializer for testing memoization. Counts calls of `.to_representation()`.
+
+    """
+    calls = 0
+    id = IntegerField(required=True)
+    name = CharField(required=True)
+
+    def to_representation(self, instance):
+        CountingAuthorSerializer.calls += 1
+        return super().to_representation(instance)
+
+
+class MemoizedPostSerializer(Serializer):
+    """
+    Serializer for testing memoization by identity.
+
+    """
+    title = CharField(required=True)
+    author = CountingAuthorSerializer(memoize=True)
+
+
+class MemoizedThreadSerializer(Serializer):
+    """
+    Serializer for testing memoization in nested list of serializers.
+
+    """
+    posts = MemoizedPostSerializer(many=True)
+
+
+class MemoizedByKeyPostSerializer(Serializer):
+    """
+    Serializer for testing memoization by declared key.
+
+    """
+    title = CharField(required=True)
+    author = CountingAuthorSerializer(memo_key='id')
+
+
+class NotMemoizedPostSerializer(Serializer):
+    """
+    Serializer for testing without memoization.
+
+    """
+    title = CharField(required=True)
+    author = CountingAuthorSerializer()
+
+
+class BatchCommentSerializer(Serializer):
+    """
+    Serializer for testing batch method field.
+
+    """
+    batch_calls = []
+    text = CharField(required=True)
+    length = SerializerMethodField(batch=True)
+
+    def get_length_batch(self, objs):
+        BatchCommentSerializer.batch_calls.append(len(objs))
+        return [len(obj['text']) for obj in objs]
+
+
+class BatchPostSerializer(Serializer):
+    """
+    Serializer for testing batch method field in nested serializers.
+
+    """
+    title = CharField(required=True)
+    comments = BatchCommentSerializer(many=True)
+
+
+class AsyncBatchCommentSerializer(Serializer):
+    """
+    Serializer for testing async batch method field.
+
+    """
+    text = CharField(required=True)
+    length = SerializerMethodField(batch=True)
+
+    async def get_length_batch(self, objs):
+        return [len(obj['text']) for obj in objs]
+
+
+class ProjectionAuthorSerializer(Serializer):
+    """
+    Serializer for testing attribute paths.
+
+    """
+    id = IntegerField(required=True)
+    name = CharField(source='full_name', required=True)
+    rating = SerializerMethodField(depends_on=('stats.likes', 'stats.views'))
+
+    def get_rating(self, obj):
+        return obj.stats.likes / obj.stats.views
+
+
+class ProjectionPostSerializer(Serializer):
+    """
+    Serializer for testing attribute paths with nested serializers.
+
+    """
+    title = CharField(required=True)
+    author = ProjectionAuthorSerializer(memo_key='id')
+    readers = ProjectionAuthorSerializer(source='subscribers', many=True)
+    tags = ListField(child=CharField())
+
+
+class ExpandUserSerializer(Serializer):
+    """
+    Serializer for testing expandable nested serializers.
+
+    """
+    id = IntegerField(required=True)
+    name = CharField(required=True)
+
+
+class ExpandCommentSerializer(Serializer):
+    """
+    Serializer for testing expandable nested serializers.
+
+    """
+    id = IntegerField(required=True)
+    text = CharField(required=True)
+    user = ExpandUserSerializer(expandable=True)
+
+
+class ExpandPostSerializer(Serializer):
+    """
+    Serializer for testing expand of nested serializers.
+
+    """
+    title = CharField(required=True)
+    author = ExpandUserSerializer(expandable=True)
+    comments = ExpandCommentSerializer(many=True, expandable=True)
+
+
+class ValidateHooksSerializer(Serializer):
+    """
+    Serializer for testing manual validation methods of fields.
+
+    """
+    name = CharField(required=True)
+    email = CharField(required=False)
+    age = IntegerField(required=False)
+
+    def validate_name(self, value):
+        return value.title()
+
+    @staticmethod
+    def validate_email(value):
+        return value.lower()
+
+
+class InheritValidateHooksSerializer(ValidateHooksSerializer):
+    """
+    Serializer for testing inherited manual validation methods of fields.
+
+    """
+    validate_email = None
+
+    def validate_age(self, value):
+        if value < 18:
+            raise ValidationError(detail='Too young.')
+        return value
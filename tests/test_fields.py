@@ -2,22 +2,28 @@
 Fields testing
 
 """
+import copy
 import datetime
+import enum
+from collections import OrderedDict
 from unittest import TestCase
 
 import six
 
 from rest_framework.exceptions import SkipError
 from rest_framework.serializers.exceptions import ValidationError
+from rest_framework.serializers.helpers import MISSING
+from rest_framework.utils.collections import MultiValueDict
 from rest_framework.serializers.fields import (
     Field, CharField, IntegerField, FloatField, BooleanField, BooleanNullField, ListField,
     TimeField, DateField, DateTimeField,
-    JsonField, DictField,
-    SerializerMethodField,
+    JsonField, DictField, ChoiceField, EnumField,
+    SerializerMethodField, DEFAULT_INPUT_LIMITS,
     get_attribute
 )
 from rest_framework.serializers.validators import (
-    RequiredValidator, MaxValueValidator, MinValueValidator, MinLengthValidator, MaxLengthValidator
+    RequiredValidator, MaxValueValidator, MinValueValidator, MinLengthValidator, MaxLengthValidator,
+    RegexValidator, RegexSetValidator
 )
 
 from tests.serializers_for_tests import SerializerMethodFieldDefault, SerializerMethodFieldSingle
@@ -394,6 +400,42 @@ class BaseFieldTestCase(TestCase):
         except Exception as e:
             self.fail('`.get_attribute()` must throw as exception `TypeError`, reality {}.'.format(type(e)))
 
+    def test_get_attribute_or_missing(self):
+        """
+        Testing get_attribute_or_missing method.
+
+        """
+        field = self.field_class(**self.create_params(required=True))
+        field.bind('test_missing_field', self)
+        for obj in ({'test_missing_field': 1}, type('Object', (object,), {'test_missing_field': 1})):
+            res = field.get_attribute_or_missing(obj)
+            assert res == 1, '`.get_attribute_or_missing()` must return 1, reality {}.'.format(res)
+
+        # Not found required attribute is skipped without exceptions.
+        for obj in ({}, OrderedDict(), object()):
+            res = field.get_attribute_or_missing(obj)
+            assert res is MISSING, '`.get_attribute_or_missing()` must return `MISSING`, reality {}.'.format(res)
+
+        field = self.field_class(**self.create_params(default=100))
+        field.bind('test_missing_field', self)
+        res = field.get_attribute_or_missing({})
+        assert res == 100, '`.get_attribute_or_missing()` must return 100, reality {}.'.format(res)
+
+        field = self.field_class(**self.create_params(required=False))
+        field.bind('test_missing_field', self)
+        with self.assertRaises(KeyError):
+            field.get_attribute_or_missing({})
+
+        # Own search of attribute is called with exception contract.
+        class CustomField(self.field_class):
+            def _get_attribute(self, instance):
+                raise SkipError('Skip')
+
+        field = CustomField(**self.create_params(required=True))
+        field.bind('test_missing_field', self)
+        res = field.get_attribute_or_missing({'test_missing_field': 1})
+        assert res is MISSING, '`.get_attribute_or_missing()` must return `MISSING`, reality {}.'.format(res)
+
     def test_validate_empty_values(self):
         """
         Testing validation on an empty type.
@@ -518,8 +560,54 @@ class CharFieldTest(BaseFieldTestCase):
         {'data': {'data': ''}, 'params': {'allow_blank': True}, 'return': ''},
         {'data': {'data': '   '}, 'params': {'allow_blank': True, 'trim_whitespace': True}, 'return': ''},
         {'data': {'data': '   '}, 'params': {'allow_blank': False, 'trim_whitespace': True}, 'exceptions': (ValidationError,)},
+        {'data': {'data': 'qwe'}, 'params': {'max_length': 2}, 'exceptions': (ValidationError,)},
+        {'data': {'data': ' qw '}, 'params': {'max_length': 2, 'trim_whitespace': True}, 'return': 'qw'},
+        {'data': {'data': 'q w'}, 'params': {'max_length': 2, 'trim_whitespace': True}, 'exceptions': (ValidationError,)},
     )  # Cases, to test the performance of `.run_validation()`.
 
+    def test_max_length_early(self):
+        """
+        Testing that too long string is rejected with the same error as from validators.
+
+        """
+        def get_error(field, data):
+            try:
+                field.run_validation(data)
+            except ValidationError as e:
+                return e.detail
+            self.fail('`.run_validation()` must throw as exception `ValidationError`.')
+
+        field = self.field_class(max_length=3)
+        expected = ['Ensure this field has no more than 3 characters.']
+        assert get_error(field, 'q' * 10 ** 6) == expected, 'Expected error {}.'.format(expected)
+        assert get_error(field, 12345) == expected, 'Expected error {}.'.format(expected)
+
+        # Errors of other validators are kept.
+        field = self.field_class(max_length=3, min_length=5)
+        assert get_error(field, 'qwer') == [
+            'Ensure this field has no more than 3 characters.', 'Ensure this field has at least 5 characters.'
+        ], 'Expected errors of both validators.'
+
+        # Custom length validators are not skipped.
+        field = self.field_class(max_length=10, validators=[MaxLengthValidator(5, message='custom {max_length}')])
+        assert get_error(field, 'q' * 12) == [
+            'custom 5', 'Ensure this field has no more than 10 characters.'
+        ], 'Expected errors of custom and built-in validators.'
+
+    def test_regex_set_errors(self):
+        """
+        Testing that RegexSetValidator gives the same errors as separate RegexValidator.
+
+        """
+        validators = [RegexValidator(r'\d', message='digit'), RegexValidator(r'[a-z]', message='letter')]
+        for field in (CharField(validators=validators), CharField(validators=[RegexSetValidator(validators)])):
+            with self.assertRaises(ValidationError) as e:
+                field.run_validation('Q')
+            assert e.exception.detail == ['digit', 'letter'], 'Expected flat list of errors, reality {}.'.format(
+                e.exception.detail
+            )
+            assert field.run_validation('q1') == 'q1', 'Expected valid value.'
+
     def test_init(self):
         """
         Testing create.
@@ -594,6 +682,29 @@ class TestIntegerField(BaseFieldTestCase):
     )  # Cases, to test the performance of `.run_validation()`.
 
 
+    def test_fused_validators(self):
+        """
+        Testing that built-in validators give the same errors, when they are fused.
+
+        """
+        field = self.field_class(min_value=5, max_value=3)
+        with self.assertRaises(ValidationError) as e:
+            field.run_validation(4)
+        assert e.exception.detail == [
+            'Ensure this value is greater than or equal to 5.', 'Ensure this value is less than or equal to 3.'
+        ], 'Expected errors of both validators, reality {}.'.format(e.exception.detail)
+
+        # Changed validators are used.
+        field = self.field_class(min_value=1)
+        assert field.run_validation(10) == 10, 'Expected valid value.'
+        field.validators.append(MaxValueValidator(5, message='max'))
+        with self.assertRaises(ValidationError) as e:
+            field.run_validation(10)
+        assert e.exception.detail == ['max'], 'Expected error of new validator, reality {}.'.format(
+            e.exception.detail
+        )
+
+
 class TestFloatField(BaseFieldTestCase):
     """
     Testing FloatField.
@@ -750,7 +861,8 @@ class TestListField(BaseFieldTestCase):
         'not_a_list': None,
         'empty': None,
         'min_length': None,
-        'max_length': None
+        'max_length': None,
+        'max_items': None,
     }
     _fields_vals = {
         'required': True, 'default': None, 'label': None, 'validators': [],
@@ -799,7 +911,23 @@ class TestListField(BaseFieldTestCase):
         {'data': {'data': [1, 1, 1]}, 'params': {'min_length': 1, 'max_length': 5, 'child': IntegerField()}, 'return': [1, 1, 1]},
         {'data': {'data': [1, 1, 1]}, 'params': {'min_length': 1, 'max_length': 3, 'child': IntegerField()}, 'return': [1, 1, 1]},
         {'data': {'data': [1, 1, 1]}, 'params': {'min_length': 1, 'max_length': 2}, 'exceptions': (ValidationError,)},
-        {'data': {'data': [1, True, '1']}, 'params': {'child': None}, 'return': [1, True, '1']}  # Check empty child field.
+        {'data': {'data': [1, True, '1']}, 'params': {'child': None}, 'return': [1, True, '1']},  # Check empty child field.
+        {'data': {'data': [1, 1, 1]}, 'params': {'max_items': 3, 'child': IntegerField()}, 'return': [1, 1, 1]},
+        {'data': {'data': [1, 1, 1]}, 'params': {'max_items': 2}, 'exceptions': (ValidationError,)},
+        # HTML form.
+        {
+            'data': {'data': MultiValueDict({'[1]': ['2'], '[0]': ['1'], 'page': ['1']})},
+            'params': {'child': IntegerField()}, 'return': [1, 2]
+        },
+        {
+            'data': {'data': MultiValueDict({'[0][0]': ['1'], '[0][1]': ['2'], '[1][0]': ['3']})},
+            'params': {'child': ListField(child=IntegerField())}, 'return': [[1, 2], [3]]
+        },
+        # Deep keys of HTML form do not exceed the recursion limit.
+        {
+            'data': {'data': MultiValueDict({'[0]' * 1500: ['1']})},
+            'params': {'child': IntegerField()}, 'exceptions': (ValidationError,)
+        },
     )  # Cases, to test the performance of `.run_validation()`.
 
 
@@ -942,6 +1070,8 @@ class TestJsonField(BaseFieldTestCase):
     requirement_arguments_for_field = {}  # Required arguments for creating a field.
     field_error_messages = {
         'invalid': None,
+        'max_depth': None,
+        'max_keys': None,
     }
 
     to_representation_cases = (
@@ -979,6 +1109,11 @@ class TestJsonField(BaseFieldTestCase):
         {'data': {'data': 123}, 'exceptions': (ValidationError,)},
         {'data': {'data': None}, 'exceptions': (ValidationError,)},
         {'data': {'data': None}, 'params': {'required': False}, 'return': None},  # TODO: FIXME
+        {'data': {'data': [{'1': [1]}]}, 'params': {'max_depth': 3}, 'return': [{'1': [1]}]},
+        {'data': {'data': [{'1': [1]}]}, 'params': {'max_depth': 2}, 'exceptions': (ValidationError,)},
+        {'data': {'data': '[[[[1]]]]'}, 'params': {'max_depth': 3}, 'exceptions': (ValidationError,)},
+        {'data': {'data': {'1': 1, '2': 2}}, 'params': {'max_keys': 2}, 'return': {'1': 1, '2': 2}},
+        {'data': {'data': [{'1': 1, '2': 2}]}, 'params': {'max_keys': 1}, 'exceptions': (ValidationError,)},
     )  # Cases, to test the performance of `.run_validation()`.
 
 
@@ -992,6 +1127,8 @@ class TestDictField(BaseFieldTestCase):
     requirement_arguments_for_field = {}  # Required arguments for creating a field.
     field_error_messages = {
         'not_a_dict': None,
+        'max_depth': None,
+        'max_keys': None,
     }
 
     to_representation_cases = (
@@ -1024,9 +1161,128 @@ class TestDictField(BaseFieldTestCase):
         {'data': {'data': 123}, 'exceptions': (ValidationError,)},
         {'data': {'data': None}, 'exceptions': (ValidationError,)},
         {'data': {'data': None}, 'params': {'required': False}, 'return': None},  # TODO: FIXME
-        {'data': {'data': {123: [123]}}, 'params': {'child': IntegerField()}, 'exceptions': (ValidationError,)}
+        {'data': {'data': {123: [123]}}, 'params': {'child': IntegerField()}, 'exceptions': (ValidationError,)},
+        {'data': {'data': {1: {2: 2}}}, 'params': {'max_depth': 2}, 'return': {'1': {2: 2}}},
+        {'data': {'data': {1: {2: {3: 3}}}}, 'params': {'max_depth': 2}, 'exceptions': (ValidationError,)},
+        {'data': {'data': {1: 1, 2: 2}}, 'params': {'max_keys': 1}, 'exceptions': (ValidationError,)},
+        # HTML form.
+        {'data': {'data': MultiValueDict({'a': ['1'], '.b': ['2']})}, 'return': {'a': '1', 'b': '2'}},
+        {'data': {'data': MultiValueDict({'a.b[0]': ['1'], 'a.b[1]': ['2']})}, 'return': {'a': {'b': ['1', '2']}}},
+        {'data': {'data': MultiValueDict({'a' + '[0]' * 1500: ['1']})}, 'exceptions': (ValidationError,)},
     )  # Cases, to test the performance of `.run_validation()`.
 
+    def test_default_input_limits(self):
+        """
+        Testing global defaults of input limits.
+
+        """
+        field = DictField()
+        DEFAULT_INPUT_LIMITS['max_keys'] = 1
+        try:
+            with self.assertRaises(ValidationError) as e:
+                field.run_validation({1: 1, 2: 2})
+            assert e.exception.detail == 'Too many keys.', 'Expected constant message, reality {}.'.format(
+                e.exception.detail
+            )
+            assert DictField(max_keys=2).run_validation({1: 1, 2: 2}) == {'1': 1, '2': 2}, \
+                'Own limit of field must be used instead of default.'
+        finally:
+            DEFAULT_INPUT_LIMITS['max_keys'] = None
+        assert field.run_validation({1: 1, 2: 2}) == {'1': 1, '2': 2}, 'Without limits all keys are valid.'
+
+
+class Color(enum.Enum):
+    """
+    Enum for testing EnumField.
+
+    """
+    red = 'r'
+    green = 'g'
+
+
+class TestChoiceField(BaseFieldTestCase):
+    """
+    Testing ChoiceField.
+
+    """
+    field_class = ChoiceField
+    abstract_methods = {}  # Custom abstract methods.
+    requirement_arguments_for_field = {
+        'choices': [1, 2, 'three']
+    }  # Required arguments for creating a field.
+    field_error_messages = {
+        'invalid_choice': None,
+    }
+
+    to_representation_cases = (
+        {'data': {'value': 1}, 'return': 1},
+        {'data': {'value': 'three'}, 'return': 'three'},
+    )  # Cases, to test the performance of `.to_representation()`.
+    to_internal_value_cases = (
+        {'data': {'data': 1}, 'return': 1},
+        {'data': {'data': '1'}, 'return': 1},
+        {'data': {'data': 'three'}, 'return': 'three'},
+        {'data': {'data': 3}, 'exceptions': (ValidationError,)},
+        {'data': {'data': []}, 'exceptions': (ValidationError,)},
+        {'data': {'data': 'a'}, 'params': {'choices': {'a': 'A', 'b': 'B'}}, 'return': 'a'},
+        {'data': {'data': 'A'}, 'params': {'choices': {'a': 'A', 'b': 'B'}}, 'exceptions': (ValidationError,)},
+    )  # Cases, to test the performance of `.to_internal_value()`.
+    run_validation_cases = (
+        {'data': {'data': 2}, 'return': 2},
+        {'data': {'data': '2'}, 'return': 2},
+        {'data': {'data': 'four'}, 'exceptions': (ValidationError,)},
+        {'data': {'data': None}, 'exceptions': (ValidationError,)},
+        {'data': {'data': None}, 'params': {'required': False}, 'return': None},
+    )  # Cases, to test the performance of `.run_validation()`.
+
+    def test_init(self):
+        """
+        Testing not valid choices.
+
+        """
+        with self.assertRaises(ValueError):
+            ChoiceField(choices=[[1], [2]])
+        with self.assertRaises(ValueError):
+            ChoiceField(choices=1)
+
+
+class TestEnumField(BaseFieldTestCase):
+    """
+    Testing EnumField.
+
+    """
+    field_class = EnumField
+    abstract_methods = {}  # Custom abstract methods.
+    requirement_arguments_for_field = {
+        'enum_class': Color
+    }  # Required arguments for creating a field.
+    field_error_messages = {
+        'invalid_choice': None,
+    }
+
+    to_representation_cases = (
+        {'data': {'value': Color.red}, 'return': 'r'},
+        {'data': {'value': 'g'}, 'return': 'g'},
+    )  # Cases, to test the performance of `.to_representation()`.
+    to_internal_value_cases = (
+        {'data': {'data': 'r'}, 'return': Color.red},
+        {'data': {'data': Color.green}, 'return': Color.green},
+        {'data': {'data': 'red'}, 'exceptions': (ValidationError,)},
+        {'data': {'data': 1}, 'exceptions': (ValidationError,)},
+    )  # Cases, to test the performance of `.to_internal_value()`.
+    run_validation_cases = (
+        {'data': {'data': 'g'}, 'return': Color.green},
+        {'data': {'data': 'b'}, 'exceptions': (ValidationError,)},
+    )  # Cases, to test the performance of `.run_validation()`.
+
+    def test_deepcopy(self):
+        """
+        Testing copy of field.
+
+        """
+        field = EnumField(enum_class=Color)
+        assert copy.deepcopy(field).enum_class is Color, 'Copy of field must have the same enum.'
+
 
 class TestSerializerMethodField(TestCase):
     """
@@ -1076,6 +1332,23 @@ class TestSerializerMethodField(TestCase):
         assert len(ser.data) == 1, 'Expected single value in data. Reality: `{}`.'.format(ser.data)
         assert ser.data['test'] == 123, 'Expected value `123`. Reality: `{}`.'.format(ser.data['test'])
 
+    def test_methods_on_bind(self):
+        """
+        Testing search of methods on bind.
+
+        """
+        ser = SerializerMethodFieldDefault(instance={'test': 'test'})
+        field = ser.fields['test']
+        assert field._method_get == ser.get_test, 'Method `get_test` must be found on bind.'
+        assert field._method_pop == ser.pop_test, 'Method `pop_test` must be found on bind.'
+        assert field.get_attribute(ser.instance) is ser.instance, '`.get_attribute()` must return the object.'
+
+        field = SerializerMethodField(method_name_get='not_exists')
+        field.bind('test', ser)
+        assert field._method_get is None, 'Not existing method must not be found.'
+        with self.assertRaises(AttributeError):
+            field.to_representation({})
+
     def test_single_method_validation(self):
         """
         Testing single method.
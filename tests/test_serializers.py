@@ -5,6 +5,8 @@ Testing serializers.
 
 """
 # import collections
+import asyncio
+import threading
 try:
     from typing import Mapping
 except ImportError:
@@ -15,11 +17,17 @@ import six
 
 from rest_framework.serializers.serializers import BaseSerializer, Serializer, ListSerializer
 from rest_framework.serializers.exceptions import ValidationError
+from rest_framework.serializers.helpers import SerializerPool, RepresentationPass
 
 from tests.serializers_for_tests import (
     SerializerPrimitiveField, SerializerMixinSingle, SerializerMixinMany, SerializerMixinRequired,
     InheritSecondLevelChild, SerializerSourceFields, SourceFieldFromSerializer,
-    AllowNoneSerializer, InheritAllowNoneSerializer
+    AllowNoneSerializer, InheritAllowNoneSerializer,
+    CountingAuthorSerializer, MemoizedPostSerializer, MemoizedByKeyPostSerializer, NotMemoizedPostSerializer,
+    MemoizedThreadSerializer,
+    BatchCommentSerializer, BatchPostSerializer, AsyncBatchCommentSerializer,
+    ProjectionAuthorSerializer, ProjectionPostSerializer,
+    ExpandPostSerializer, ValidateHooksSerializer, InheritValidateHooksSerializer
 )
 
 
@@ -632,3 +640,468 @@ class SerializerInheritAllowNoneTestCase(SerializerUserTestCase):
             return {'inherit': {'bool': 'test'}}
         else:
             return {'inherit': {'char': None, 'bool': None, 'integer': None}}
+
+
+class SerializerMemoizeTestCase(TestCase):
+    """
+    Testing memoization of nested serializers within one `.data` call.
+
+    """
+    def setUp(self):
+        self.authors = [{'id': i, 'name': 'author_%s' % i} for i in range(3)]
+        self.posts = [{'title': 'post_%s' % i, 'author': self.authors[i % 3]} for i in range(30)]
+        CountingAuthorSerializer.calls = 0
+
+    def test_without_memoize(self):
+        data = NotMemoizedPostSerializer(instance=self.posts, many=True).data
+        self.assertEqual(CountingAuthorSerializer.calls, 30)
+        self.assertEqual(data[4]['author'], {'id': 1, 'name': 'author_1'})
+
+    def test_memoize_by_identity(self):
+        data = MemoizedPostSerializer(instance=self.posts, many=True).data
+        self.assertEqual(CountingAuthorSerializer.calls, 3)
+        self.assertEqual(len(data), 30)
+        for post, item in zip(self.posts, data):
+            self.assertEqual(item['author'], post['author'])
+
+        # Equal, but not the same objects.
+        posts = [{'title': 'post', 'author': dict(self.authors[0])} for _ in range(5)]
+        CountingAuthorSerializer.calls = 0
+        MemoizedPostSerializer(instance=posts, many=True).data
+        self.assertEqual(CountingAuthorSerializer.calls, 5)
+
+    def test_memoize_by_key(self):
+        posts = [{'title': 'post', 'author': dict(self.authors[i % 3])} for i in range(30)]
+        data = MemoizedByKeyPostSerializer(instance=posts, many=True).data
+        self.assertEqual(CountingAuthorSerializer.calls, 3)
+        self.assertEqual(data[29]['author'], {'id': 2, 'name': 'author_2'})
+
+    def test_memo_released_after_call(self):
+        ser = MemoizedPostSerializer(instance=self.posts, many=True)
+        ser.data
+        self.assertIsNone(RepresentationPass.current(ser))
+        self.assertIsNone(ser.child.fields['author']._get_representation_pass())
+
+        # Every call computes representations again.
+        CountingAuthorSerializer.calls = 0
+        MemoizedPostSerializer(instance=self.posts, many=True).data
+        self.assertEqual(CountingAuthorSerializer.calls, 3)
+
+    def test_memoize_in_nested_list(self):
+        # Bound fields of other serializers of the same class do not take the nested serializers.
+        ser = MemoizedThreadSerializer(instance={'posts': self.posts})
+        ser.fields
+        MemoizedThreadSerializer(instance={'posts': self.posts}).fields
+        data = ser.data
+        self.assertEqual(CountingAuthorSerializer.calls, 3)
+        self.assertEqual(data['posts'][4]['author'], {'id': 1, 'name': 'author_1'})
+
+    def test_memoize_without_call(self):
+        ser = MemoizedPostSerializer()
+        ser.to_representation(self.posts[0])
+        ser.to_representation(self.posts[3])
+        self.assertEqual(CountingAuthorSerializer.calls, 2)
+
+
+class SerializerBatchMethodFieldTestCase(TestCase):
+    """
+    Testing `SerializerMethodField(batch=True)`.
+
+    """
+    def setUp(self):
+        self.comments = [{'text': 'c' * i} for i in range(1, 6)]
+        BatchCommentSerializer.batch_calls = []
+
+    def run_async(self, coroutine):
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coroutine)
+        finally:
+            loop.close()
+
+    def test_list(self):
+        data = BatchCommentSerializer(instance=self.comments, many=True).data
+        self.assertEqual(BatchCommentSerializer.batch_calls, [5])
+        self.assertEqual([item['length'] for item in data], [1, 2, 3, 4, 5])
+        self.assertEqual(list(data[0].keys()), ['text', 'length'])
+
+    def test_single(self):
+        data = BatchCommentSerializer(instance=self.comments[2]).data
+        self.assertEqual(BatchCommentSerializer.batch_calls, [1])
+        self.assertEqual(data, {'text': 'ccc', 'length': 3})
+
+        # Without `.data` call.
+        data = BatchCommentSerializer().to_representation(self.comments[1])
+        self.assertEqual(data, {'text': 'cc', 'length': 2})
+
+    def test_nested(self):
+        posts = [
+            {'title': 'first', 'comments': self.comments[:2]},
+            {'title': 'second', 'comments': self.comments[2:]},
+        ]
+        data = BatchPostSerializer(instance=posts, many=True).data
+        self.assertEqual(BatchCommentSerializer.batch_calls, [5])
+        self.assertEqual([c['length'] for c in data[0]['comments']], [1, 2])
+        self.assertEqual([c['length'] for c in data[1]['comments']], [3, 4, 5])
+
+    def test_nested_with_other_instances(self):
+        ser = BatchPostSerializer(instance={'title': 'first', 'comments': self.comments[:3]})
+        ser.fields
+        BatchPostSerializer().fields
+        data = ser.data
+        self.assertEqual(BatchCommentSerializer.batch_calls, [3])
+        self.assertEqual([c['length'] for c in data['comments']], [1, 2, 3])
+
+    def test_wrong_count_of_values(self):
+        ser = BatchCommentSerializer(instance=self.comments, many=True)
+        ser.child.get_length_batch = lambda objs: []
+        with self.assertRaises(ValueError):
+            ser.data
+
+    def test_async(self):
+        ser = AsyncBatchCommentSerializer(instance=self.comments, many=True)
+        data = self.run_async(ser.async_data())
+        self.assertEqual([item['length'] for item in data], [1, 2, 3, 4, 5])
+        self.assertIs(ser.data, data)
+
+        # Sync batch methods work too.
+        data = self.run_async(BatchCommentSerializer(instance=self.comments, many=True).async_data())
+        self.assertEqual([item['length'] for item in data], [1, 2, 3, 4, 5])
+
+    def test_async_method_from_sync_data(self):
+        ser = AsyncBatchCommentSerializer(instance=self.comments, many=True)
+        with self.assertRaises(TypeError):
+            ser.data
+
+
+class SerializerRequiredAttributesTestCase(TestCase):
+    """
+    Testing `Serializer.required_attributes()`.
+
+    """
+    def test_flat(self):
+        self.assertEqual(
+            ProjectionAuthorSerializer.required_attributes(),
+            {'id', 'full_name', 'stats.likes', 'stats.views'}
+        )
+        self.assertEqual(SerializerPrimitiveField.required_attributes(), {
+            'char_f', 'integer_f', 'float_f', 'bool_f', 'list_f'
+        })
+
+    def test_nested(self):
+        self.assertEqual(ProjectionPostSerializer.required_attributes(), {
+            'title', 'tags',
+            'author.id', 'author.full_name', 'author.stats.likes', 'author.stats.views',
+            'subscribers.id', 'subscribers.full_name', 'subscribers.stats.likes', 'subscribers.stats.views',
+        })
+        self.assertIs(ProjectionPostSerializer.required_attributes(), ProjectionPostSerializer.required_attributes())
+
+    def test_sparse_fields(self):
+        self.assertEqual(
+            ProjectionPostSerializer.required_attributes('title,author.name,readers'),
+            {
+                'title', 'author.full_name', 'author.id',  # `id` is the memo key.
+                'subscribers.id', 'subscribers.full_name', 'subscribers.stats.likes', 'subscribers.stats.views',
+            }
+        )
+        self.assertEqual(ProjectionPostSerializer.required_attributes(['readers.rating']), {
+            'subscribers.stats.likes', 'subscribers.stats.views'
+        })
+        self.assertEqual(ProjectionPostSerializer.required_attributes(''), ProjectionPostSerializer.required_attributes())
+
+
+class SerializerExpandTestCase(TestCase):
+    """
+    Testing expandable nested serializers.
+
+    """
+    post = {
+        'title': 'Post',
+        'author': {'id': 1, 'name': 'Author'},
+        'comments': [
+            {'id': 10, 'text': 'First', 'user': {'id': 2, 'name': 'User'}},
+            {'id': 11, 'text': 'Second', 'user': {'id': 1, 'name': 'Author'}},
+        ]
+    }
+
+    def test_not_expanded(self):
+        self.assertEqual(ExpandPostSerializer(self.post).data, {'title': 'Post', 'author': 1, 'comments': [10, 11]})
+
+    def test_expand(self):
+        data = ExpandPostSerializer(self.post, expand='author,comments').data
+        self.assertEqual(data['author'], {'id': 1, 'name': 'Author'})
+        self.assertEqual(data['comments'], [{'id': 10, 'text': 'First', 'user': 2}, {'id': 11, 'text': 'Second', 'user': 1}])
+
+        data = ExpandPostSerializer(self.post, expand=['comments.user']).data
+        self.assertEqual(data['author'], 1)
+        self.assertEqual(data['comments'][0]['user'], {'id': 2, 'name': 'User'})
+
+        # The expand is applied per `.data` call and does not change the serializer.
+        data = ExpandPostSerializer(instance=[self.post], many=True, expand='author').data
+        self.assertEqual(data, [{'title': 'Post', 'author': {'id': 1, 'name': 'Author'}, 'comments': [10, 11]}])
+
+    def test_expand_with_other_instances(self):
+        serializer = ExpandPostSerializer(self.post, expand='comments,comments.user')
+        serializer.fields
+        ExpandPostSerializer(self.post).fields
+        data = serializer.data
+        self.assertEqual(data['comments'][1], {'id': 11, 'text': 'Second', 'user': {'id': 1, 'name': 'Author'}})
+
+    def test_required_attributes(self):
+        self.assertEqual(ExpandPostSerializer.required_attributes(), {'title', 'author.id', 'comments.id'})
+        self.assertEqual(ExpandPostSerializer.required_attributes(expand='author,comments.user'), {
+            'title', 'author.id', 'author.name', 'comments.id', 'comments.text', 'comments.user.id', 'comments.user.name'
+        })
+
+
+class SerializerResetTestCase(TestCase):
+    """
+    Testing reuse of serializers with `.reset()` and `SerializerPool`.
+
+    """
+    def test_reset_instance(self):
+        serializer = ExpandPostSerializer({'title': 'First', 'author': {'id': 1}, 'comments': []})
+        fields = serializer.fields
+        self.assertEqual(serializer.data['title'], 'First')
+
+        self.assertIs(serializer.reset({'title': 'Second', 'author': {'id': 2}, 'comments': []}), serializer)
+        self.assertEqual(serializer.data, {'title': 'Second', 'author': 2, 'comments': []})
+        self.assertIs(serializer.fields, fields)
+
+        serializer.reset({'title': 'Third', 'author': {'id': 3}, 'comments': []}, expand='author')
+        self.assertEqual(serializer.data['author'], {'id': 3})
+        self.assertIsNone(serializer.reset().expand)
+        self.assertIsNone(serializer.instance)
+        self.assertEqual(serializer.data, serializer.get_default())
+
+    def test_reset_data(self):
+        serializer = SerializerPrimitiveField(data={'char_f': 'value'})
+        self.assertFalse(serializer.is_valid())
+        self.assertIn('integer_f', serializer.errors)
+
+        serializer.reset(data={'char_f': 'value', 'integer_f': 1, 'float_f': 1.0, 'bool_f': True, 'list_f': ['a']})
+        self.assertTrue(serializer.is_valid())
+        self.assertEqual(serializer.errors, {})
+        self.assertEqual(serializer.validated_data['integer_f'], 1)
+
+        serializer.reset(instance={'title': 'value'})
+        self.assertFalse(hasattr(serializer, 'initial_data'))
+        with self.assertRaises(AssertionError):
+            serializer.validated_data
+        with self.assertRaises(AssertionError):
+            serializer.errors
+
+    def test_pool(self):
+        pool = SerializerPool(max_size=1)
+        first = pool.acquire(ExpandPostSerializer, instance={'title': 'First', 'author': {'id': 1}, 'comments': []})
+        second = pool.acquire(ExpandPostSerializer, instance={'title': 'Second', 'author': {'id': 2}, 'comments': []})
+        self.assertIsNot(first, second)
+        self.assertEqual(first.data['title'], 'First')
+        self.assertEqual(second.data['title'], 'Second')
+
+        pool.release(first)
+        pool.release(second)  # Pool is full.
+        self.assertIsNone(first.instance)
+        self.assertFalse(hasattr(first, '_data'))
+
+        third = pool.acquire(ExpandPostSerializer, instance={'title': 'Third', 'author': {'id': 3}, 'comments': []})
+        self.assertIs(third, first)
+        self.assertEqual(third.data['title'], 'Third')
+
+        # Other arguments use other serializers.
+        many = pool.acquire(ExpandPostSerializer, instance=[], many=True, expand='author')
+        self.assertIsInstance(many, ListSerializer)
+        self.assertEqual(many.data, [])
+        not_pooled = pool.acquire(ExpandPostSerializer, instance={}, validators=[])
+        self.assertFalse(hasattr(not_pooled, '_pool_key'))
+        pool.release(not_pooled)
+
+    def test_pool_expand(self):
+        pool = SerializerPool(max_size=1)
+        post = {'title': 'Post', 'author': {'id': 1, 'name': 'Author'}, 'comments': []}
+        for expand in ('author', 'comments', ['author', 'comments'], None):
+            serializer = pool.acquire(ExpandPostSerializer, instance=post, expand=expand)
+            expanded = expand is not None and 'author' in expand
+            self.assertEqual(serializer.data['author'], {'id': 1, 'name': 'Author'} if expanded else 1)
+            pool.release(serializer)
+            self.assertIsNone(serializer.expand)
+        # Values of `expand=` come from clients, they do not make new groups of serializers.
+        self.assertEqual(len(pool._free), 1)
+
+
+class SerializerThreadSafetyTestCase(TestCase):
+    """
+    Testing concurrent use of one serializer from many threads.
+
+    """
+    threads_count = 8
+    iterations = 200
+
+    def run_threads(self, target):
+        barrier, errors = threading.Barrier(self.threads_count), []
+
+        def run(number):
+            try:
+                barrier.wait()
+                for iteration in range(self.iterations):
+                    target(number, iteration)
+            except Exception as e:  # pragma: no cover
+                errors.append(e)
+
+        threads = [threading.Thread(target=run, args=(number,)) for number in range(self.threads_count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+
+    def test_fields_publish(self):
+        serializers = [ExpandPostSerializer() for _ in range(self.iterations)]
+        seen = [set() for _ in serializers]
+
+        def target(number, iteration):
+            fields = serializers[iteration].fields
+            self.assertEqual(list(fields), ['title', 'author', 'comments'])
+            seen[iteration].add(id(fields))
+
+        self.run_threads(target)
+        self.assertTrue(all(len(ids) == 1 for ids in seen))
+
+    def test_represent(self):
+        serializer = ExpandPostSerializer(many=True)
+        batch_serializer = BatchPostSerializer(many=True)
+
+        def target(number, iteration):
+            posts = [{
+                'title': '{}-{}'.format(number, iteration),
+                'author': {'id': number, 'name': 'Author'},
+                'comments': [{'id': iteration, 'text': 'x' * number, 'user': {'id': number, 'name': 'User'}}]
+            }]
+            expand = 'comments.user' if number % 2 else 'comments'
+            data = serializer.represent(posts, expand=expand)
+            self.assertEqual(data[0]['title'], posts[0]['title'])
+            self.assertEqual(data[0]['author'], number)
+            user = data[0]['comments'][0]['user']
+            self.assertEqual(user, {'id': number, 'name': 'User'} if number % 2 else number)
+
+            data = batch_serializer.represent(posts)
+            self.assertEqual(data[0]['comments'][0]['length'], number)
+
+        self.run_threads(target)
+        self.assertFalse(hasattr(serializer, '_data'))
+
+    def test_new_serializer_per_call(self):
+        def target(number, iteration):
+            post = {
+                'title': '{}-{}'.format(number, iteration),
+                'author': {'id': number, 'name': 'Author'},
+                'comments': [{'id': iteration, 'text': 'x' * number, 'user': {'id': number, 'name': 'User'}}]
+            }
+            data = ExpandPostSerializer(post, expand='comments.user').data
+            self.assertEqual(data['comments'][0]['user'], {'id': number, 'name': 'User'})
+
+            data = BatchPostSerializer(post).data
+            self.assertEqual(data['comments'][0]['length'], number)
+
+        self.run_threads(target)
+
+    def test_run_validation(self):
+        serializer = SerializerPrimitiveField()
+
+        def target(number, iteration):
+            data = {'char_f': str(number), 'integer_f': iteration, 'float_f': 1.0, 'bool_f': True, 'list_f': ['a']}
+            self.assertEqual(serializer.run_validation(data)['integer_f'], iteration)
+            with self.assertRaises(ValidationError):
+                serializer.run_validation({'char_f': str(number)})
+
+        self.run_threads(target)
+
+
+class SerializerValidateHooksTestCase(TestCase):
+    """
+    Testing manual validation methods `validate_<field_name>`.
+
+    """
+    def test_hooks_table(self):
+        self.assertEqual(set(ValidateHooksSerializer._validate_hooks), {'name', 'email'})
+        self.assertEqual(set(InheritValidateHooksSerializer._validate_hooks), {'name', 'age'})
+
+    def test_validation(self):
+        serializer = ValidateHooksSerializer(data={'name': 'john smith', 'email': 'John@Mail.com', 'age': 10})
+        self.assertTrue(serializer.is_valid())
+        self.assertEqual(serializer.validated_data, {'name': 'John Smith', 'email': 'john@mail.com', 'age': 10})
+
+        serializer = InheritValidateHooksSerializer(data={'name': 'john', 'email': 'John@Mail.com', 'age': 10})
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual(serializer.errors, {'age': 'Too young.'})
+
+        serializer = InheritValidateHooksSerializer(data={'name': 'john', 'email': 'John@Mail.com', 'age': 20})
+        self.assertTrue(serializer.is_valid())
+        self.assertEqual(serializer.validated_data['email'], 'John@Mail.com')
+
+    def test_object_override(self):
+        serializer = ValidateHooksSerializer(data={'name': 'john', 'age': 10})
+        serializer.validate_age = lambda value: value + 1
+        serializer.validate_name = None
+        self.assertTrue(serializer.is_valid())
+        self.assertEqual(serializer.validated_data, {'name': 'john', 'age': 11})
+        self.assertEqual(set(serializer._validate_hooks), {'email', 'age'})
+        self.assertEqual(set(ValidateHooksSerializer._validate_hooks), {'name', 'email'})
+
+        serializer = ValidateHooksSerializer(data={'name': 'john', 'age': 10})
+        self.assertIs(serializer._validate_hooks, ValidateHooksSerializer._validate_hooks)
+        self.assertTrue(serializer.is_valid())
+        self.assertNotIn('_validate_hooks', serializer.__dict__, 'Object without hooks must use the class table.')
+
+
+class ListSerializerErrorsTestCase(TestCase):
+    """
+    Testing errors of ListSerializer validation.
+
+    """
+    valid = {'char_f': 'value', 'integer_f': 1, 'float_f': 1.0, 'bool_f': True, 'list_f': ['a']}
+    invalid = {'char_f': 'value'}
+
+    def test_dense_errors(self):
+        serializer = SerializerPrimitiveField(many=True, data=[self.valid, self.invalid, self.valid])
+        self.assertFalse(serializer.is_valid())
+        errors = serializer.errors
+        self.assertEqual(len(errors), 3)
+        self.assertEqual(errors[0], {})
+        self.assertIn('integer_f', errors[1])
+
+        serializer = SerializerPrimitiveField(many=True, max_errors=1, data=[self.invalid, self.invalid, self.valid])
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual(len(serializer.errors), 1)
+
+    def test_sparse_errors(self):
+        data = [self.valid] * 1000
+        data[3], data[981] = self.invalid, self.invalid
+        serializer = SerializerPrimitiveField(many=True, sparse_errors=True, data=data)
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual(list(serializer.errors), ['3', '981'])
+        self.assertIn('integer_f', serializer.errors['981'])
+
+        serializer = SerializerPrimitiveField(many=True, sparse_errors=True, max_errors=1, data=data)
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual(list(serializer.errors), ['3'])
+
+        serializer = SerializerPrimitiveField(many=True, sparse_errors=True, data=[self.valid, self.valid])
+        self.assertTrue(serializer.is_valid())
+        self.assertEqual(len(serializer.validated_data), 2)
+        self.assertEqual(serializer.errors, {})
+
+    def test_list_arguments(self):
+        serializer = SerializerPrimitiveField(many=True, allow_empty=True, data=[])
+        self.assertTrue(serializer.is_valid())
+        self.assertEqual(serializer.validated_data, [])
+        self.assertTrue(serializer.allow_empty)
+        self.assertFalse(hasattr(serializer.child, 'sparse_errors'))
+
+    def test_max_items(self):
+        serializer = SerializerPrimitiveField(many=True, max_items=2, data=[self.invalid] * 3)
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual(serializer.errors, {'non_field_errors': ['Too many items.']})
+
+        serializer = SerializerPrimitiveField(many=True, max_items=2, data=[self.valid] * 2)
+        self.assertTrue(serializer.is_valid())
@@ -0,0 +1,81 @@
+"""
+Testing utils.
+
+"""
+import copy
+import pickle
+import unittest
+
+from rest_framework.utils.collections import MultiValueDict, MultiValueDictKeyError, LayeredMapping
+
+
+class MultiValueDictTestCase(unittest.TestCase):
+    """
+    Testing MultiValueDict.
+
+    """
+    def test_values(self):
+        data = MultiValueDict({'name': ['Adrian', 'Simon'], 'position': ['Developer'], 'empty': [], 'list': [[1]]})
+        self.assertEqual(data['name'], 'Simon')
+        self.assertEqual(data['position'], 'Developer')
+        self.assertEqual(data['empty'], [])
+        self.assertEqual(data['list'], [1])
+        self.assertIsNone(data.get('empty'))
+        self.assertEqual(data.getlist('name'), ['Adrian', 'Simon'])
+        self.assertEqual(data.getlist('list'), [[1]])
+        self.assertEqual(data.getlist('missing'), [])
+        self.assertEqual(dict(data.items()), {'name': 'Simon', 'position': 'Developer', 'empty': [], 'list': [1]})
+        with self.assertRaises(MultiValueDictKeyError):
+            data['missing']
+
+        # Single value is stored as is.
+        self.assertEqual(dict.__getitem__(data, 'position'), 'Developer')
+
+    def test_change(self):
+        data = MultiValueDict()
+        data['name'] = 'Adrian'
+        data.appendlist('name', 'Simon')
+        data.appendlist('position', 'Developer')
+        self.assertEqual(dict(data.lists()), {'name': ['Adrian', 'Simon'], 'position': ['Developer']})
+
+        data.setlistdefault('position').append('Manager')
+        self.assertEqual(data.getlist('position'), ['Developer', 'Manager'])
+        self.assertEqual(data.setlistdefault('new', ['value']), ['value'])
+        data.getlist('name').append('Other')  # Copy of list.
+        self.assertEqual(data.getlist('name'), ['Adrian', 'Simon'])
+
+        data.update({'name': 'Other'}, position='Owner')
+        self.assertEqual(data.getlist('name'), ['Adrian', 'Simon', 'Other'])
+        self.assertEqual(data['position'], 'Owner')
+        data.setlist('name', ['One'])
+        self.assertEqual(data.getlist('name'), ['One'])
+
+    def test_copy(self):
+        data = MultiValueDict({'name': ['Adrian', 'Simon'], 'position': ['Developer']})
+        for other in (data.copy(), copy.deepcopy(data), pickle.loads(pickle.dumps(data)), MultiValueDict(data)):
+            self.assertEqual(dict(other.lists()), {'name': ['Adrian', 'Simon'], 'position': ['Developer']})
+            other.appendlist('name', 'Other')
+            self.assertEqual(data.getlist('name'), ['Adrian', 'Simon'])
+
+
+class LayeredMappingTestCase(unittest.TestCase):
+    """
+    Testing LayeredMapping.
+
+    """
+    def test_layers(self):
+        body, query = {'name': 'body', 'empty': None}, MultiValueDict({'name': ['query'], 'page': ['1', '2']})
+        data = LayeredMapping(body, query, None)
+        self.assertEqual(data['name'], 'body')
+        self.assertEqual(data['page'], '2')
+        self.assertIsNone(data['empty'])
+        self.assertEqual(data.get('missing', 1), 1)
+        self.assertIn('page', data)
+        self.assertEqual(list(data), ['name', 'empty', 'page'])
+        self.assertEqual(len(data), 3)
+        with self.assertRaises(KeyError):
+            data['missing']
+
+        # Layers are not copied.
+        body['new'] = 1
+        self.assertEqual(data['new'], 1)
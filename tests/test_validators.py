@@ -8,7 +8,7 @@ import six
 
 from rest_framework.serializers.validators import (
     RegexValidator, BaseValidator, RequiredValidator, MinLengthValidator, MaxLengthValidator,
-    MinValueValidator, MaxValueValidator, ChoiceValidator
+    MinValueValidator, MaxValueValidator, ChoiceValidator, RegexSetValidator, FusedRangeValidator
 )
 from rest_framework.serializers.exceptions import ValidationError
 
@@ -159,6 +159,69 @@ class MaxValueValidatorTestCase(ValidatorTestCases):
     )
 
 
+class FusedRangeValidatorTestCase(ValidatorTestCases):
+    """
+    Testing FusedRangeValidator.
+
+    """
+    validator_class = FusedRangeValidator
+    cases = (
+        {'init': {'validators': [RequiredValidator(), MinValueValidator(1), MaxValueValidator(3)]}, 'data': 2},
+        {
+            'init': {'validators': [RequiredValidator(), MinValueValidator(1), MaxValueValidator(3)]},
+            'data': 5, 'message': ['The value must be less than or equal to 3.']
+        },
+        {
+            'init': {'validators': [MinValueValidator(5), MaxValueValidator(3)]},
+            'data': 4, 'message': [
+                'The value must be greater than or equal to 5.', 'The value must be less than or equal to 3.'
+            ]
+        },
+        {'init': {'validators': [MaxLengthValidator(3), MinLengthValidator(1)]}, 'data': 'qw'},
+        {
+            'init': {'validators': [MaxLengthValidator(3), MinLengthValidator(1)]},
+            'data': '', 'message': ['The value must be longer than 1.']
+        },
+        {'init': {'validators': [RequiredValidator()]}, 'data': None, 'message': ['This field is required.']},
+    )
+
+    def test_init(self):
+        """
+        Testing not valid validators.
+
+        """
+        with self.assertRaises(ValueError):
+            FusedRangeValidator([MinValueValidator(1), MinValueValidator(2)])
+        with self.assertRaises(ValueError):
+            FusedRangeValidator([MinValueValidator(1), RegexValidator(r'\d')])
+
+    def test_fuse(self):
+        """
+        Testing fusion of contiguous built-in validators.
+
+        """
+        regex, required, min_value, max_value = (
+            RegexValidator(r'\d'), RequiredValidator(), MinValueValidator(1), MaxValueValidator(3)
+        )
+        assert FusedRangeValidator.fuse([regex, min_value]) == [regex, min_value], 'Single validator is not fused.'
+        validators = FusedRangeValidator.fuse([required, regex, min_value, max_value, regex])
+        assert len(validators) == 4 and validators[1] is regex and validators[3] is regex, \
+            'Order of validators must be kept, reality {}.'.format(validators)
+        assert validators[2].validators == [min_value, max_value], 'Expected fused min and max validators.'
+        validators = FusedRangeValidator.fuse([min_value, max_value, MinValueValidator(2)])
+        assert len(validators) == 2 and isinstance(validators[1], MinValueValidator), \
+            'Validators of the same type must be in different groups.'
+
+    def test_not_comparable(self):
+        """
+        Testing that exceptions are the same as from validators.
+
+        """
+        validator = FusedRangeValidator([MinValueValidator(1), MaxValueValidator(3)])
+        with self.assertRaises(TypeError):
+            validator('2')
+
+
 class RegexValidatorTestCase(ValidatorTestCases):
     """
     Testing RegexValidator.
@@ -174,6 +237,37 @@ class RegexValidatorTestCase(ValidatorTestCases):
     )
 
 
+class RegexSetValidatorTestCase(ValidatorTestCases):
+    """
+    Testing RegexSetValidator.
+
+    """
+    validator_class = RegexSetValidator
+    cases = (
+        {'init': {'validators': [r'\d+', r'[a-z]']}, 'data': '3a'},
+        {'init': {'validators': [r'\d+', r'[a-z]']}, 'data': '3', 'message': ['Enter a valid value.']},
+        {'init': {'validators': [r'\d+', r'[a-z]'], 'message': 'test'}, 'data': 'A', 'message': ['test', 'test']},
+        {
+            'init': {'validators': [RegexValidator(r'\d+', message='digit'), RegexValidator(r'[a-z]', message='letter')]},
+            'data': 'A', 'message': ['digit', 'letter']
+        },
+        {
+            'init': {'validators': [RegexValidator(r'\d+'), RegexValidator(r'<', inverse_match=True, message='tag')]},
+            'data': '<3', 'message': ['tag']
+        },
+    )
+
+    def test_get_failed(self):
+        """
+        Testing search of failed validators.
+
+        """
+        digit, letter = RegexValidator(r'\d+'), RegexValidator(r'[a-z]')
+        validator = RegexSetValidator([digit, letter])
+        assert validator.get_failed('a') == [digit], 'Expected only failed validator.'
+        assert validator.get_failed('1a') == [], 'Expected no failed validators.'
+
+
 class ChoiceValidatorTestCase(ValidatorTestCases):
     """
     Testing ChoiceValidator.
@@ -185,4 +279,7 @@ class ChoiceValidatorTestCase(ValidatorTestCases):
         {'init': {'choices': {1: 1, 2: 2, 3: 3}}, 'data': 2},
         {'init': {'choices': [1, 2, 3]}, 'data': 'asdasd', 'message': 'Value must be one of `[1, 2, 3]`.'},
         {'init': {'choices': [1, 2, 3], 'message': 'test'}, 'data': 'test', 'message': 'test'},
+        {'init': {'choices': [[1], [2]]}, 'data': [2]},
+        {'init': {'choices': [[1], [2]]}, 'data': [3], 'message': 'Value must be one of `[[1], [2]]`.'},
+        {'init': {'choices': [1, 2, 3]}, 'data': [1], 'message': 'Value must be one of `[1, 2, 3]`.'},
     )
@@ -2,15 +2,19 @@
 Testing views mixins.
 
 """
+import asyncio
 import unittest
 from functools import namedtuple
 
 from rest_framework.views.mixins import (
     GetSerializerMixin, GetResponseMixin
 )
-from rest_framework.views.paginations import LimitOffsetObjectsPaginator
+from rest_framework.views.paginations import LimitOffsetObjectsPaginator, CursorObjectsPaginator, COUNT_EXACT
+from rest_framework.views.flask.mixins import GetValidJsonMixin as FlaskGetValidJsonMixin
+from rest_framework.views.aiohttp.mixins import GetValidJsonMixin as AioHttpGetValidJsonMixin
+from rest_framework.serializers import SerializerPool, Serializer, CharField, IntegerField
 
-from tests.serializers_for_tests import SerializerPrimitiveField
+from tests.serializers_for_tests import SerializerPrimitiveField, AsyncBatchCommentSerializer, ExpandPostSerializer
 
 
 Response = namedtuple('Response', ('data', 'status', 'content_type'))
@@ -165,3 +169,225 @@ class GetResponseMixinTestCase(unittest.TestCase):
         )
         self.assertEqual(resp.status, 400)
 
+    def test_get_list_response_before_serialize(self):
+        def get_response(data, status, content_type='application/json'):
+            return Response(data, status, content_type)
+
+        class ForTest(ForTests, GetResponseMixin):
+            response_class = get_response
+            serializer_classes = {'get': ExpandPostSerializer}
+            paginate_before_serialize = True
+            pagination_counter = len
+
+        posts = [{'title': str(number), 'author': {'id': 1}, 'comments': []} for number in range(100)]
+        mixin = ForTest()
+        resp = mixin.get_list_response(posts, limit=2, offset=10)
+        self.assertEqual(resp.data, {
+            'limit': 2, 'offset': 10, 'count': 100,
+            'objects': [{'title': '10', 'author': 1, 'comments': []}, {'title': '11', 'author': 1, 'comments': []}]
+        })
+
+        # Iterators are sliced without counter, `count=` is kept.
+        mixin.pagination_counter = None
+        resp = mixin.get_list_response(iter(posts), limit=1, offset=99, count=5)
+        self.assertEqual(resp.data, {
+            'limit': 1, 'offset': 99, 'count': 5, 'objects': [{'title': '99', 'author': 1, 'comments': []}]
+        })
+
+    def test_get_list_response_cursor(self):
+        def get_response(data, status, content_type='application/json'):
+            return Response(data, status, content_type)
+
+        class Paginator(CursorObjectsPaginator):
+            secret_key = 'secret'
+
+        class ForTest(ForTests, GetResponseMixin):
+            response_class = get_response
+            pagination_class = Paginator
+
+        objects = [{'id': number} for number in range(5)]
+        mixin = ForTest()
+        first = mixin.get_list_response(objects, is_serialized=False, limit=2).data
+        page = mixin.get_list_response(objects, is_serialized=False, limit=2, cursor=first['next']).data
+        self.assertEqual(page['objects'], [{'id': 2}, {'id': 3}])
+
+    def test_get_response_async(self):
+        def get_response(data, status, content_type='application/json'):
+            return Response(data, status, content_type)
+
+        class ForTest(ForTests, GetResponseMixin):
+            response_class = get_response
+            serializer_classes = {'get': AsyncBatchCommentSerializer}
+
+        mixin = ForTest()
+        loop = asyncio.new_event_loop()
+        try:
+            resp = loop.run_until_complete(mixin.get_response_async({'text': 'abc'}))
+            self.assertEqual(resp.data, {'text': 'abc', 'length': 3})
+            self.assertEqual(resp.status, 200)
+
+            resp = loop.run_until_complete(mixin.get_list_response_async(
+                [{'text': 'a'}, {'text': 'ab'}], limit=2, offset=0, count=2
+            ))
+            self.assertEqual(resp.data, {
+                'limit': 2, 'offset': 0, 'count': 2,
+                'objects': [{'text': 'a', 'length': 1}, {'text': 'ab', 'length': 2}]
+            })
+        finally:
+            loop.close()
+
+    def test_get_list_response_async_before_serialize(self):
+        def get_response(data, status, content_type='application/json'):
+            return Response(data, status, content_type)
+
+        class Paginator(LimitOffsetObjectsPaginator):
+            count_mode = COUNT_EXACT
+
+        class ForTest(ForTests, GetResponseMixin):
+            response_class = get_response
+            serializer_classes = {'get': AsyncBatchCommentSerializer}
+            pagination_class = Paginator
+            paginate_before_serialize = True
+
+        class Query(object):
+            def __init__(self, objects):
+                self.objects = objects
+
+            def __getitem__(self, item):
+                return self.fetch(self.objects[item])
+
+            async def fetch(self, objects):
+                return objects
+
+            async def count(self):
+                return len(self.objects)
+
+        async def iterate(objects):
+            for obj in objects:
+                yield obj
+
+        comments = [{'text': 'a' * number} for number in range(1, 6)]
+        mixin = ForTest()
+        loop = asyncio.new_event_loop()
+        try:
+            resp = loop.run_until_complete(mixin.get_list_response_async(Query(comments), limit=2, offset=1))
+            self.assertEqual(resp.data, {
+                'limit': 2, 'offset': 1, 'count': 5,
+                'objects': [{'text': 'aa', 'length': 2}, {'text': 'aaa', 'length': 3}]
+            })
+
+            # Async iterators can not be counted.
+            resp = loop.run_until_complete(mixin.get_list_response_async(iterate(comments), limit=2, offset=4))
+            self.assertEqual(resp.data, {
+                'limit': 2, 'offset': 4, 'count': None, 'objects': [{'text': 'aaaaa', 'length': 5}]
+            })
+
+            mixin.pagination_counter = lambda objs: objs.count()
+            resp = loop.run_until_complete(mixin.get_list_response_async(Query(comments), limit=1, offset=0))
+            self.assertEqual(resp.data['count'], 5)
+
+            mixin.paginate_before_serialize = False
+            resp = loop.run_until_complete(mixin.get_list_response_async(
+                iterate(comments[:1]), limit=1, offset=0, count=1
+            ))
+            self.assertEqual(resp.data['objects'], [{'text': 'a', 'length': 1}])
+        finally:
+            loop.close()
+
+    def test_get_response_expand(self):
+        def get_response(data, status, content_type='application/json'):
+            return Response(data, status, content_type)
+
+        class Request(object):
+            query = {'expand': 'author'}
+
+        class ForTest(ForTests, GetResponseMixin):
+            response_class = get_response
+            serializer_classes = {'get': ExpandPostSerializer}
+            request_object = Request()
+
+        post = {'title': 'Post', 'author': {'id': 1, 'name': 'Author'}, 'comments': [{'id': 10}]}
+        mixin = ForTest()
+        resp = mixin.get_response(post)
+        self.assertEqual(resp.data, {'title': 'Post', 'author': {'id': 1, 'name': 'Author'}, 'comments': [10]})
+
+        mixin.expand_query_param = None
+        resp = mixin.get_list_response([post], limit=1, offset=0, count=1)
+        self.assertEqual(resp.data['objects'], [{'title': 'Post', 'author': 1, 'comments': [10]}])
+
+    def test_get_response_pool(self):
+        def get_response(data, status, content_type='application/json'):
+            return Response(data, status, content_type)
+
+        class ForTest(ForTests, GetResponseMixin):
+            response_class = get_response
+            serializer_classes = {'get': ExpandPostSerializer}
+            serializer_pool = SerializerPool()
+
+        mixin = ForTest()
+        for title in ('First', 'Second'):
+            resp = mixin.get_response({'title': title, 'author': {'id': 1}, 'comments': []})
+            self.assertEqual(resp.data, {'title': title, 'author': 1, 'comments': []})
+        self.assertEqual(sum(len(free) for free in ForTest.serializer_pool._free.values()), 1)
+
+
+class QuerySerializer(Serializer):
+    name = CharField()
+    page = IntegerField(required=False)
+
+
+class FlaskArgs(dict):
+    """
+    Query of flask request, with several values on the key.
+
+    """
+    def get(self, key, default=None):
+        values = super().get(key)
+        return values[0] if values else default
+
+
+class GetValidJsonMixinTestCase(unittest.TestCase):
+    """
+    Tests for GetValidJsonMixin.
+
+    """
+    def test_flask_get_valid_json(self):
+        class Request(object):
+            args = FlaskArgs({'name': ['query'], 'page': ['1', '2']})
+            body = {'name': 'body'}
+
+            def get_json(self):
+                return self.body
+
+        class ForTest(ForTests, FlaskGetValidJsonMixin):
+            serializer_classes = {'get': QuerySerializer}
+            request_object = Request()
+
+        mixin = ForTest()
+        self.assertEqual(mixin.get_valid_json(), {'name': 'body'})
+        self.assertEqual(mixin.get_valid_json(parse_query=True), {'name': 'body', 'page': 1})
+
+        # Request without body.
+        mixin.request_object.body = None
+        self.assertEqual(mixin.get_valid_json(parse_query=True), {'name': 'query', 'page': 1})
+
+    def test_aiohttp_get_valid_json(self):
+        class Request(object):
+            query = {'name': 'query', 'page': '1'}
+
+            async def json(self):
+                return {'name': 'body'}
+
+        class ForTest(ForTests, AioHttpGetValidJsonMixin):
+            serializer_classes = {'get': QuerySerializer}
+            request_object = Request()
+
+        mixin = ForTest()
+        loop = asyncio.new_event_loop()
+        try:
+            self.assertEqual(loop.run_until_complete(mixin.get_valid_json()), {'name': 'body'})
+            self.assertEqual(
+                loop.run_until_complete(mixin.get_valid_json(parse_query=True)), {'name': 'body', 'page': 1}
+            )
+        finally:
+            loop.close()
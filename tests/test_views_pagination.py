@@ -2,13 +2,16 @@
 Testing views pagination.
 
 """
+import asyncio
 import unittest
 
 from rest_framework.views.paginations import (
     BasePaginatorAbstract, LimitOffsetGetPaginateDataMixin, ResultGetObjectsDataPaginatorMixin,
     ObjectsGetObjectsDataPaginatorMixin, ItemsGetObjectsDataPaginatorMixin, LimitOffsetResultPaginator,
-    LimitOffsetObjectsPaginator, LimitOffsetItemsPaginator
+    LimitOffsetObjectsPaginator, LimitOffsetItemsPaginator, CursorResultPaginator, CursorObjectsPaginator,
+    CursorItemsPaginator, COUNT_EXACT, COUNT_ESTIMATED
 )
+from rest_framework.exceptions import ApiException
 
 
 class LimitOffsetGetPaginateDataMixinTestCase(unittest.TestCase):
@@ -163,3 +166,182 @@ class LimitOffsetItemsPaginatorTestCase(unittest.TestCase):
             paginator.paginate(limit=1, offset=1, count=10),
             dict(limit=1, offset=1, count=10, items=[1, 2])
         )
+
+
+class SliceObjectsTestCase(unittest.TestCase):
+    def test(self):
+        self.assertEqual(LimitOffsetObjectsPaginator(list(range(10))).slice_objects(limit=3, offset=2), [2, 3, 4])
+        self.assertEqual(LimitOffsetObjectsPaginator(iter(range(10))).slice_objects(limit=3, offset=8), [8, 9])
+        self.assertEqual(LimitOffsetObjectsPaginator(range(10)).slice_objects(limit=None, offset=8), range(8, 10))
+        self.assertIsNone(LimitOffsetObjectsPaginator(None).slice_objects())
+
+        class Paginator(ItemsGetObjectsDataPaginatorMixin):
+            def get_paginate_data(self, *args, **kwargs):
+                return {}
+
+        self.assertEqual(Paginator([1, 2]).slice_objects(limit=1), [1, 2])
+
+
+class AsyncPaginatorTestCase(unittest.TestCase):
+    class Query(object):
+        """
+        Async query object of ORM.
+
+        """
+        def __init__(self, objects):
+            self.objects = objects
+            self.calls = []
+
+        def __getitem__(self, item):
+            return self.fetch(self.objects[item])
+
+        async def fetch(self, objects):
+            self.calls.append('page')
+            await asyncio.sleep(0)
+            self.calls.append('page done')
+            return objects
+
+        async def count(self):
+            self.calls.append('count')
+            await asyncio.sleep(0)
+            self.calls.append('count done')
+            return len(self.objects)
+
+    @staticmethod
+    async def iterate(objects):
+        for obj in objects:
+            yield obj
+
+    def run_async(self, coroutine):
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coroutine)
+        finally:
+            loop.close()
+
+    def test_count_modes(self):
+        class Paginator(LimitOffsetItemsPaginator):
+            count_mode = COUNT_EXACT
+
+        query = self.Query(list(range(10)))
+        result = self.run_async(Paginator(query).paginate_async(limit=3, offset=2))
+        self.assertEqual(result, dict(limit=3, offset=2, count=10, items=[2, 3, 4]))
+        self.assertEqual(query.calls, ['page', 'count', 'page done', 'count done'])  # Concurrently.
+
+        query = self.Query(list(range(10)))
+        self.assertEqual(self.run_async(Paginator(query).paginate_async(limit=3, offset=2, count=5))['count'], 5)
+        self.assertEqual(query.calls, ['page', 'page done'])
+
+        Paginator.count_mode = None
+        self.assertIsNone(self.run_async(Paginator(self.Query(list(range(10)))).paginate_async(limit=3))['count'])
+
+        class EstimatedPaginator(LimitOffsetItemsPaginator):
+            count_mode = COUNT_ESTIMATED
+
+            def estimate_count(self, objects):
+                return 1000
+
+        self.assertEqual(self.run_async(EstimatedPaginator(self.Query([1, 2])).paginate_async())['count'], 1000)
+        del EstimatedPaginator.estimate_count
+        self.assertEqual(self.run_async(EstimatedPaginator([1, 2]).paginate_async())['count'], 2)
+        self.assertIsNone(self.run_async(EstimatedPaginator(self.Query([1, 2])).paginate_async())['count'])
+
+    def test_async_iterables(self):
+        class Paginator(LimitOffsetItemsPaginator):
+            count_mode = COUNT_EXACT
+
+        result = self.run_async(Paginator(self.iterate(range(10))).paginate_async(limit=3, offset=8))
+        self.assertEqual(result, dict(limit=3, offset=8, count=None, items=[8, 9]))
+        self.assertEqual(self.run_async(Paginator(self.iterate(range(10))).slice_objects_async(limit=0)), [])
+        result = self.run_async(Paginator([1, 2, 3]).paginate_async(2, 1))
+        self.assertEqual(result, dict(limit=2, offset=1, count=3, items=[2, 3]))
+
+        class CursorPaginator(CursorItemsPaginator):
+            secret_key = 'secret'
+
+        result = self.run_async(CursorPaginator(self.iterate([dict(id=1), dict(id=2)])).paginate_async(limit=1))
+        self.assertEqual(result['items'], [dict(id=1)])
+        self.assertIsNotNone(result['next'])
+
+
+class CursorPaginatorTestCase(unittest.TestCase):
+    class Paginator(CursorObjectsPaginator):
+        secret_key = 'secret'
+        cursor_fields = ('rank', 'id')
+
+    objects = [dict(rank=i // 2, id=i) for i in range(7)]  # Ranks are not unique, `id` is tie-breaker.
+
+    def get_page(self, limit, cursor=None, base_url=None):
+        paginator = self.Paginator(self.objects)
+        paginator.objects = paginator.slice_objects(limit=limit, cursor=cursor, base_url=base_url)
+        return paginator.paginate(limit=limit, cursor=cursor, base_url=base_url)
+
+    def test_pages(self):
+        page = self.get_page(3)
+        self.assertEqual([obj['id'] for obj in page['objects']], [0, 1, 2])
+        self.assertIsNone(page['previous'])
+
+        page = self.get_page(3, cursor=page['next'])
+        self.assertEqual([obj['id'] for obj in page['objects']], [3, 4, 5])
+
+        last = self.get_page(3, cursor=page['next'])
+        self.assertEqual([obj['id'] for obj in last['objects']], [6])
+        self.assertIsNone(last['next'])
+
+        page = self.get_page(3, cursor=last['previous'])
+        self.assertEqual([obj['id'] for obj in page['objects']], [3, 4, 5])
+        page = self.get_page(3, cursor=page['previous'])
+        self.assertEqual([obj['id'] for obj in page['objects']], [0, 1, 2])
+        self.assertIsNone(page['previous'])
+        self.assertIsNotNone(page['next'])
+
+    def test_paginate(self):
+        # Without `.slice_objects()`, objects are filtered by `.paginate()`.
+        first = self.Paginator(self.objects).paginate(limit=3)
+        self.assertEqual([obj['id'] for obj in first['objects']], [0, 1, 2])
+        page = self.Paginator(self.objects).paginate(limit=3, cursor=first['next'])
+        self.assertEqual([obj['id'] for obj in page['objects']], [3, 4, 5])
+        self.assertNotEqual(page['next'], first['next'])
+        page = self.Paginator(iter(self.objects)).paginate(limit=3, cursor=page['previous'])
+        self.assertEqual([obj['id'] for obj in page['objects']], [0, 1, 2])
+        self.assertIsNone(page['previous'])
+
+    def test_links(self):
+        page = self.get_page(3, base_url='/items')
+        self.assertTrue(page['next'].startswith('/items?cursor='))
+        cursor = page['next'].split('=', 1)[1]
+        self.assertEqual([obj['id'] for obj in self.get_page(3, cursor=cursor)['objects']], [3, 4, 5])
+        self.assertTrue(self.get_page(3, base_url='/items?q=1')['next'].startswith('/items?q=1&cursor='))
+
+    def test_cursor(self):
+        paginator = self.Paginator([])
+        cursor = paginator.encode_cursor((1, 'a'), reverse=True)
+        self.assertEqual(paginator.decode_cursor(cursor), ((1, 'a'), True))
+
+        payload, signature = cursor.split('.')
+        invalid = [
+            '', 'abc', payload, payload + '.' + signature[:-1] + ('A' if signature[-1] != 'A' else 'B'),
+            paginator.encode_cursor((1,)), None, 'ы.ы'
+        ]
+        for cursor in invalid:
+            with self.assertRaises(ApiException) as e:
+                paginator.decode_cursor(cursor)
+            self.assertEqual(e.exception.status, 400)
+
+        other = self.Paginator([])
+        other.secret_key = b'other'
+        with self.assertRaises(ApiException):
+            other.decode_cursor(paginator.encode_cursor((1, 'a')))
+
+        with self.assertRaises(AssertionError):
+            CursorResultPaginator([]).encode_cursor((1,))
+
+    def test_variants(self):
+        for paginator_class, key in ((CursorResultPaginator, 'result'), (CursorItemsPaginator, 'items')):
+            class Paginator(paginator_class):
+                secret_key = 'secret'
+
+            page = Paginator([dict(id=1), dict(id=2)]).paginate(limit=1)
+            self.assertEqual(page[key], [dict(id=1)])
+            self.assertEqual(page['limit'], 1)
+            self.assertIsNotNone(page['next'])
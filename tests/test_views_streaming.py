@@ -0,0 +1,295 @@
+"""
+Testing streaming responses.
+
+"""
+import asyncio
+import json
+import unittest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer, TestClient
+from flask import Flask, jsonify
+
+from rest_framework.serializers import ValidationError
+from rest_framework.views.aiohttp import ApiGenericView
+from rest_framework.views.flask.generics import ApiGenericMethodView as FlaskApiGenericMethodView
+from rest_framework.views.streaming import (
+    JsonStreamEncoder, NdjsonStreamEncoder, NdjsonStreamDecoder, METADATA_HEADERS
+)
+
+from tests.serializers_for_tests import AsyncBatchCommentSerializer, ExpandPostSerializer, InheritSerRoot
+
+
+def run_async(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+async def iterate(objects):
+    for obj in objects:
+        yield obj
+
+
+async def read_chunks(encoder):
+    return [chunk async for chunk in encoder.iter_chunks_async()]
+
+
+class JsonStreamEncoderTestCase(unittest.TestCase):
+    def test_iter_chunks(self):
+        encoder = JsonStreamEncoder({'limit': 2, 'objects': None}, 'objects', range(5), chunk_size=2)
+        chunks = list(encoder.iter_chunks())
+        self.assertEqual(len(chunks), 5)  # Head, 3 chunks of items, tail.
+        self.assertEqual(json.loads(b''.join(chunks)), {'limit': 2, 'objects': [0, 1, 2, 3, 4]})
+
+        cases = [
+            (({'objects': None}, 'objects', []), {'objects': []}),
+            (({'objects': None}, 'objects', [1]), {'objects': [1]}),
+            (({'limit': 1, 'objects': None}, 'objects', iter([{'a': 'ы'}])), {'limit': 1, 'objects': [{'a': 'ы'}]}),
+            (({}, None, [1, 2]), [1, 2]),
+        ]
+        for args, result in cases:
+            self.assertEqual(json.loads(b''.join(JsonStreamEncoder(*args).iter_chunks())), result)
+
+    def test_serialize(self):
+        chunks = []
+
+        def serialize(objects):
+            chunks.append(objects)
+            return [{'value': obj} for obj in objects]
+
+        encoder = JsonStreamEncoder({'items': None}, 'items', iter(range(3)), serialize=serialize, chunk_size=2)
+        self.assertEqual(
+            json.loads(b''.join(encoder.iter_chunks())), {'items': [{'value': 0}, {'value': 1}, {'value': 2}]}
+        )
+        self.assertEqual(chunks, [[0, 1], [2]])
+
+        async def serialize_async(objects):
+            return serialize(objects)
+
+        encoder = JsonStreamEncoder({'items': None}, 'items', [1], serialize=serialize_async)
+        with self.assertRaises(TypeError):
+            list(encoder.iter_chunks())
+
+    def test_iter_chunks_async(self):
+        async def serialize(objects):
+            return [obj * 2 for obj in objects]
+
+        for items in (range(5), iterate(range(5))):
+            encoder = JsonStreamEncoder(
+                {'count': 5, 'result': None}, 'result', items, serialize=serialize, chunk_size=2
+            )
+            chunks = run_async(read_chunks(encoder))
+            self.assertEqual(len(chunks), 5)
+            self.assertEqual(json.loads(b''.join(chunks)), {'count': 5, 'result': [0, 2, 4, 6, 8]})
+
+
+class NdjsonStreamEncoderTestCase(unittest.TestCase):
+    def test_trailer(self):
+        encoder = NdjsonStreamEncoder({'limit': 2, 'next': None, 'items': None}, 'items', range(3), chunk_size=2)
+        lines = b''.join(encoder.iter_chunks()).decode('utf8').split('\n')
+        self.assertEqual(lines[-1], '')
+        self.assertEqual(
+            [json.loads(line) for line in lines[:-1]], [0, 1, 2, {'pagination': {'limit': 2, 'next': None}}]
+        )
+        self.assertEqual(encoder.get_headers(), {})
+
+        lines = run_async(read_chunks(NdjsonStreamEncoder({}, None, iterate([{'a': 1}]))))
+        self.assertEqual(lines, [b'{"a": 1}\n'])
+        self.assertEqual(list(NdjsonStreamEncoder({'items': None}, 'items', []).iter_chunks()), [])
+
+    def test_headers(self):
+        class Encoder(NdjsonStreamEncoder):
+            metadata = METADATA_HEADERS
+
+        encoder = Encoder({'limit': 2, 'next_page': '/items?cursor=a', 'count': None, 'items': None}, 'items', [1])
+        self.assertEqual(
+            encoder.get_headers(), {'X-Pagination-Limit': '2', 'X-Pagination-Next-Page': '/items?cursor=a'}
+        )
+        self.assertEqual(b''.join(encoder.iter_chunks()), b'1\n')
+
+
+class NdjsonStreamDecoderTestCase(unittest.TestCase):
+    def decode(self, chunks, **kwargs):
+        decoder = NdjsonStreamDecoder(**kwargs)
+        result = []
+        for chunk in chunks:
+            result.extend(decoder.feed(chunk))
+        return result + decoder.close()
+
+    def test_lines(self):
+        body = b'{"root": 1}\n{"root": "2"}\r\n\n{"root": 3, "other": 1}'
+        for size in (1, 3, 100):
+            chunks = [body[index:index + size] for index in range(0, len(body), size)]
+            self.assertEqual(
+                self.decode(chunks, serializer_class=InheritSerRoot), [{'root': 1}, {'root': 2}, {'root': 3}]
+            )
+            self.assertEqual(self.decode(chunks), [{'root': 1}, {'root': '2'}, {'root': 3, 'other': 1}])
+
+        self.assertEqual(self.decode([b'1\n2\n3\n4\n5\n'], batch_size=2), [[1, 2], [3, 4], [5]])
+        self.assertEqual(self.decode([b'1\n2\n'], batch_size=2), [[1, 2]])
+        self.assertEqual(self.decode([]), [])
+
+    def test_errors(self):
+        with self.assertRaises(ValidationError) as e:
+            self.decode([b'{"root": 1}\n{"root": "a"}\n'], serializer_class=InheritSerRoot)
+        self.assertEqual(list(e.exception.detail), ['2'])
+
+        errors = {}
+        body = [b'{"root": 1}\n{"root": "a"}\nnot json\n', b'\xff\n{"root": 5}']
+        self.assertEqual(self.decode(body, serializer_class=InheritSerRoot, errors=errors), [{'root': 1}, {'root': 5}])
+        self.assertEqual(list(errors), ['2', '3', '4'])
+        self.assertEqual(errors['3'], NdjsonStreamDecoder.invalid_json_message)
+
+        with self.assertRaises(ValidationError) as e:
+            self.decode(body, serializer_class=InheritSerRoot, errors={}, max_errors=2)
+        self.assertEqual(list(e.exception.detail), ['2', '3'])
+
+    def test_max_line_size(self):
+        errors = {}
+        chunks = [b'1\n', b'2' * 5, b'2' * 5, b'2\n3\n', b'4' * 20]
+        self.assertEqual(self.decode(chunks, errors=errors, max_line_size=8), [1, 3])
+        self.assertEqual(errors, {
+            '2': NdjsonStreamDecoder.line_too_long_message, '4': NdjsonStreamDecoder.line_too_long_message
+        })
+
+        # Long line is complete in one chunk, as `request.body` of Sanic.
+        errors = {}
+        self.assertEqual(self.decode([b'1\n' + b'2' * 10 + b'\n3\n'], errors=errors, max_line_size=8), [1, 3])
+        self.assertEqual(errors, {'2': NdjsonStreamDecoder.line_too_long_message})
+
+        with self.assertRaises(ValidationError) as e:
+            self.decode([b'1\n' + b'2' * 10 + b'\n'], max_line_size=8)
+        self.assertEqual(e.exception.detail, {'2': NdjsonStreamDecoder.line_too_long_message})
+
+
+class AioHttpStreamResponseTestCase(unittest.TestCase):
+    class View(ApiGenericView):
+        serializer_classes = {'get': AsyncBatchCommentSerializer, 'post': InheritSerRoot}
+        stream_chunk_size = 2
+
+        async def get(self):
+            comments = [{'text': 'a' * number} for number in range(1, 6)]
+            return await self.get_list_response_async(comments, limit=10, offset=0, count=5, stream=True)
+
+        async def post(self):
+            errors = {}
+            batches = [batch async for batch in self.get_valid_stream(batch_size=2, errors=errors)]
+            return web.json_response({'batches': batches, 'errors': errors})
+
+    def request(self, path, method='get', data=None):
+        async def request():
+            app = web.Application()
+            app.router.add_view(path, self.View)
+            client = TestClient(TestServer(app))
+            await client.start_server()
+            try:
+                response = await client.request(method, path, data=data)
+                return response.status, response.headers, await response.read()
+            finally:
+                await client.close()
+
+        return run_async(request())
+
+    def test_stream(self):
+        status, headers, body = self.request('/comments')
+        self.assertEqual(status, 200)
+        self.assertEqual(headers['Content-Type'], 'application/json')
+        self.assertEqual(headers['Transfer-Encoding'], 'chunked')
+        self.assertEqual(json.loads(body), {
+            'limit': 10, 'offset': 0, 'count': 5,
+            'objects': [{'text': 'a' * number, 'length': number} for number in range(1, 6)]
+        })
+
+    def test_valid_stream(self):
+        async def body():
+            for chunk in (b'{"root": 1}\n{"ro', b'ot": 2}\n{"root": "a"}\n', b'{"root": 3}'):
+                yield chunk
+
+        status, headers, body = self.request('/items', method='post', data=body())
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(body), {
+            'batches': [[{'root': 1}, {'root': 2}], [{'root': 3}]],
+            'errors': {'3': {'root': 'A valid integer is required.'}}
+        })
+
+    def test_ndjson(self):
+        class Encoder(NdjsonStreamEncoder):
+            metadata = METADATA_HEADERS
+
+        self.View.stream_encoder_class = Encoder
+        try:
+            status, headers, body = self.request('/comments')
+        finally:
+            del self.View.stream_encoder_class
+        self.assertEqual(status, 200)
+        self.assertEqual(headers['Content-Type'], 'application/x-ndjson')
+        self.assertEqual(headers['X-Pagination-Count'], '5')
+        self.assertEqual(
+            [json.loads(line) for line in body.splitlines()],
+            [{'text': 'a' * number, 'length': number} for number in range(1, 6)]
+        )
+
+
+class FlaskStreamResponseTestCase(unittest.TestCase):
+    class View(FlaskApiGenericMethodView):
+        serializer_classes = {'get': ExpandPostSerializer}
+        stream_chunk_size = 3
+        paginate_before_serialize = True
+        pagination_counter = len
+
+        def get(self):
+            posts = [{'title': str(number), 'author': {'id': 1}, 'comments': []} for number in range(10)]
+            return self.get_list_response(posts, limit=5, offset=2, stream=True)
+
+    def test_stream(self):
+        app = Flask(__name__)
+        app.add_url_rule('/posts', view_func=self.View.as_view('posts'))
+        response = app.test_client().get('/posts?expand=author')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content_type, 'application/json')
+        self.assertTrue(response.is_streamed)
+        self.assertEqual(json.loads(response.data), {
+            'limit': 5, 'offset': 2, 'count': 10,
+            'objects': [
+                {'title': str(number), 'author': {'id': 1}, 'comments': []} for number in range(2, 7)
+            ]
+        })
+
+    def test_ndjson(self):
+        class View(self.View):
+            stream_encoder_class = NdjsonStreamEncoder
+
+        app = Flask(__name__)
+        app.add_url_rule('/posts', view_func=View.as_view('posts'))
+        response = app.test_client().get('/posts')
+        self.assertEqual(response.content_type, 'application/x-ndjson')
+        lines = [json.loads(line) for line in response.data.splitlines()]
+        self.assertEqual(lines[:-1], [{'title': str(number), 'author': 1, 'comments': []} for number in range(2, 7)])
+        self.assertEqual(lines[-1], {'pagination': {'limit': 5, 'offset': 2, 'count': 10}})
+
+
+class FlaskValidStreamTestCase(unittest.TestCase):
+    class View(FlaskApiGenericMethodView):
+        serializer_classes = {'post': InheritSerRoot}
+        stream_read_size = 4
+
+        def post(self):
+            try:
+                return jsonify([item['root'] for item in self.get_valid_stream()])
+            except ValidationError as e:
+                return jsonify({'errors': e.detail}), 400
+
+    def test_valid_stream(self):
+        app = Flask(__name__)
+        app.add_url_rule('/items', view_func=self.View.as_view('items'))
+        client = app.test_client()
+        response = client.post('/items', data=b'{"root": 1}\n{"root": 2}\n')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json(), [1, 2])
+
+        response = client.post('/items', data=b'{"root": 1}\n{"root": "a"}\n')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(list(response.get_json()['errors']), ['2'])